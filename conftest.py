@@ -1,55 +1,517 @@
 import pytest
 import allure
+import allure_commons
 from allure_commons.types import AttachmentType
-from playwright.sync_api import Page, BrowserContext
+from playwright.sync_api import Page, Browser, BrowserContext
 import os
-from datetime import datetime
+import json
+import platform
+import subprocess
+import warnings
+from pathlib import Path
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 from test_data.test_data import TestDataGenerator
+from test_data.data_factory import DataFactory
+from utils.lint import HardWaitLinter
+from pages.base.base_page import BasePage
+from pages.base.readiness import ReadinessPolicy, NavigationTimings, LOAD_STATES
+from pages.base.selectors import CandidateRanking, LocatorCounter
+from pages.base.perf_metrics import PerfCollector, PerfMetrics
+from pages.base.perf_budgets import PerfBudgets, BUDGET_MODES
+from pages.base.timeline import StepTimeline, timeline
+from pages.base.trace_buffer import TraceRingBuffer
+from pages.login_page import LoginPage
+from utils.auth import AuthStateCache
+from utils.artifacts import FailureArtifacts
+from utils.resource_policy import ResourcePolicy, ResourceStats
+from utils.har import HarArchive, HAR_MODES
+from utils.context_pool import ContextPool
+from utils.scheduling import DurationHistory, DurationScheduling
+from utils.run_history import RunHistory
+from utils.cart_seeder import CartSeeder
+from utils.account_pool import AccountPool, pool_path, registrar, stand_in_account
+from utils.product_index import ProductIndex
+from utils.allure_steps import AllureStepTimer
+from utils.async_flows import AsyncFlowRunner, FlowBatch, FlowHandle
+from local_store import LocalStoreServer
 
 # Load environment variables from .env file
 load_dotenv()
 
+#=====================
+# Command line options
+#=====================
+def pytest_addoption(parser):
+    parser.addoption(
+        "--wait-until",
+        default=os.getenv("WAIT_UNTIL", "domcontentloaded"),
+        choices=LOAD_STATES,
+        help="Load state page objects wait for after navigations and page-changing actions",
+    )
+    parser.addoption(
+        "--readiness",
+        action="append",
+        default=[],
+        help="Per page/action load state override, e.g. HomePage=load or CartPage.update_qty=networkidle "
+             "(can be repeated; READINESS env var takes a comma separated list)",
+    )
+    parser.addoption(
+        "--local-store",
+        action="store_true",
+        default=os.getenv("LOCAL_STORE", "").lower() in ("1", "true", "yes"),
+        help="Run against the bundled local stand-in store instead of BASE_URL (also LOCAL_STORE=1)",
+    )
+    parser.addoption(
+        "--block-resources",
+        action="store_true",
+        default=os.getenv("BLOCK_RESOURCES", "").lower() in ("1", "true", "yes"),
+        help="Stub images and drop fonts, media and third-party trackers for every test "
+             "(per test: @pytest.mark.block_resources; whitelist: @pytest.mark.allow_resources('image'))",
+    )
+    parser.addoption(
+        "--locator-stats",
+        action="store_true",
+        default=os.getenv("LOCATOR_STATS", "").lower() in ("1", "true", "yes"),
+        help="Report how many locators page objects built per test (debug)",
+    )
+    parser.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=os.getenv("PERF_METRICS", "").lower() in ("1", "true", "yes"),
+        help="Read Navigation Timing, paint/LCP and resource entries after every page object navigation "
+             "and report percentiles per route (reports/perf_metrics.json)",
+    )
+    parser.addoption(
+        "--perf-budgets",
+        default=os.getenv("PERF_BUDGETS", "warn"),
+        choices=BUDGET_MODES,
+        help="What a @budgeted page object action over its perf_budgets.json budget does: warn or fail the test",
+    )
+    parser.addoption(
+        "--trace-on-failure",
+        action="store_true",
+        default=os.getenv("TRACE_ON_FAILURE", "").lower() in ("1", "true", "yes"),
+        help="Trace every test (DOM snapshots only) but keep the trace of failed tests only, "
+             "under <--output>/failure-traces (ignored when --tracing is on)",
+    )
+    parser.addoption(
+        "--trace-chunks",
+        type=int,
+        default=int(os.getenv("TRACE_CHUNKS", "3")),
+        help="Pages (trace chunks) kept before the failure with --trace-on-failure",
+    )
+    parser.addoption(
+        "--flow-concurrency",
+        type=int,
+        default=int(os.getenv("FLOW_CONCURRENCY", "4")),
+        help="async_flow tests of a module run this many at a time on one event loop "
+             "(with -n, only under --dist loadgroup, otherwise one at a time)",
+    )
+    parser.addoption(
+        "--data-seed",
+        type=int,
+        default=int(os.environ["DATA_SEED"]) if os.getenv("DATA_SEED") else None,
+        help="Seed of the generated test data (random by default, printed in the header to reproduce a run)",
+    )
+    parser.addoption(
+        "--account-lease",
+        default=os.getenv("ACCOUNT_LEASE", "worker"),
+        choices=("worker", "test"),
+        help="Registered-user tests get a pooled account for the whole worker, or one per test",
+    )
+    parser.addoption(
+        "--har-mode",
+        default=os.getenv("HAR_MODE", "off"),
+        choices=HAR_MODES,
+        help="record: save the store traffic of every test as a HAR, replay: serve it back without network "
+             "(tests using cart_seeder or product_index are skipped in replay, their HTTP requests bypass the HAR)",
+    )
+    parser.addoption(
+        "--har-dir",
+        default=os.getenv("HAR_DIR", "har"),
+        help="Directory holding the per-test HAR files and their shared content",
+    )
+
+def pytest_configure(config):
+    # Fail the run before any browser starts if a fixed sleep slipped back in
+    offenders = HardWaitLinter.find_hard_waits(config.rootpath)
+    if offenders:
+        raise pytest.UsageError(
+            "Hard-coded wait_for_timeout() found, use the event-driven waits in BasePage instead:\n  "
+            + "\n  ".join(offenders)
+        )
+
+    # Readiness policy shared by every page object
+    overrides = ReadinessPolicy.parse_overrides([os.getenv("READINESS", "")] + config.getoption("--readiness"))
+    try:
+        BasePage.readiness = ReadinessPolicy(config.getoption("--wait-until"), overrides)
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+
+    # Learned order of first_of() candidates, carried over from previous runs
+    BasePage.candidate_ranking = CandidateRanking(config.rootpath / ".cache" / "candidate_ranking.json")
+
+    # Front-end performance samples, read by every page object navigation
+    if config.getoption("--perf-metrics"):
+        BasePage.perf_collector = PerfCollector()
+
+    # Time/requests/transfer budgets of key actions, versioned in perf_budgets.json
+    try:
+        BasePage.perf_budgets = PerfBudgets(config.rootpath / "perf_budgets.json", config.getoption("--perf-budgets"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+
+    # Test data seeded once for the run (the controller hands its seed to the workers), namespaced per worker
+    if hasattr(config, "workerinput"):
+        TestDataGenerator.factory = DataFactory(config.workerinput["data_seed"], config.workerinput["workerid"],
+                                                run_id=config.workerinput["data_run_id"])
+    else:
+        TestDataGenerator.factory = DataFactory(config.getoption("--data-seed"))
+
+    # allure.step() blocks become spans of the step timeline
+    config.allure_step_timer = AllureStepTimer(timeline)
+    allure_commons.plugin_manager.register(config.allure_step_timer)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # Every worker generates from the controller's seed, the run id and worker id keep their values apart
+    node.workerinput["data_seed"] = TestDataGenerator.factory.seed
+    node.workerinput["data_run_id"] = TestDataGenerator.factory.run_id
+
+def pytest_report_header(config):
+    seed = TestDataGenerator.factory.seed
+    return f"test data seed: {seed} (reproduce with --data-seed {seed} or DATA_SEED={seed})"
+
+def pytest_unconfigure(config):
+    # Not registered when pytest_configure stopped early (e.g. on a hard wait)
+    if hasattr(config, "allure_step_timer"):
+        allure_commons.plugin_manager.unregister(config.allure_step_timer)
+
+#=====================
+# Navigation latency per page
+#=====================
+# Run totals, summed from the tests' reports so the xdist controller covers every worker
+navigation_timings = NavigationTimings()
+context_setup_timings = NavigationTimings()
+locator_counts = LocatorCounter()
+
+@pytest.fixture(autouse=True)
+def process_samples(request):
+    """Hand the timings and locator counts recorded in this process during the test to its report"""
+    # Autouse, so torn down after page and pooled_context: their timings are in
+    yield
+    request.node.user_properties.append(("process_samples", {
+        "navigation": BasePage.navigation_timings.drain(),
+        "context_setup": context_timings.drain(),
+        "locators": BasePage.locator_counter.drain(),
+    }))
+
+def pytest_terminal_summary(terminalreporter, config):
+    lines = navigation_timings.summary()
+    if lines:
+        terminalreporter.write_sep("=", "navigation latency per page/action")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    lines = context_setup_timings.summary()
+    if lines:
+        terminalreporter.write_sep("=", "browser context setup (pooled)")
+        for line in lines + [ContextPool.savings(context_setup_timings) or ""]:
+            terminalreporter.write_line(line)
+
+    if config.getoption("--locator-stats") and locator_counts.per_test:
+        terminalreporter.write_sep("=", "locators built per test")
+        for line in locator_counts.summary():
+            terminalreporter.write_line(line)
+
+    lines = perf_metrics.summary()
+    if lines:
+        terminalreporter.write_sep("=", "front-end performance per route (ms, kB)")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    lines = resource_stats.summary()
+    if lines:
+        terminalreporter.write_sep("=", "resource filtering savings")
+        for line in lines:
+            terminalreporter.write_line(line)
+
 #=====================
 # Page configuration
 #=====================
+resource_stats = ResourceStats(Path(__file__).parent / ".cache" / "resource_sizes.json")
+
+@pytest.fixture(scope="session")
+def har_archive(pytestconfig) -> HarArchive:
+    return HarArchive(pytestconfig.rootpath / pytestconfig.getoption("--har-dir"), pytestconfig.getoption("--har-mode"))
+
+context_timings = NavigationTimings()
+
+@pytest.fixture(scope="session")
+def context_pool(browser: Browser):
+    """Warm contexts shared by the tests of this worker"""
+    pool = ContextPool(browser, context_timings)
+    yield pool
+    pool.close()
+
 @pytest.fixture
-def page(context: BrowserContext) -> Page:
+def pooled_context(context_pool: ContextPool, browser_context_args, request) -> BrowserContext:
+    # Same argument merging as pytest-playwright's context fixture
+    marker = request.node.get_closest_marker("browser_context_args")
+    context = context_pool.acquire({**browser_context_args, **(marker.kwargs if marker else {})})
+    yield context
+    context_pool.release(context)
+
+def needs_fresh_context(request, browser_context_args) -> bool:
+    """Tests whose context records artifacts on close, or asks for it, get their own context"""
+    config = request.config
+    return (
+        request.node.get_closest_marker("isolated_context") is not None
+        or config.getoption("--har-mode") != "off"
+        or any(config.getoption(option) != "off" for option in ("--tracing", "--video", "--screenshot"))
+        or not ContextPool.can_pool(browser_context_args)
+    )
+
+@pytest.fixture
+def page(browser_context_args, har_archive: HarArchive, request) -> Page:
+    # Pooled context reset between tests, or pytest-playwright's own per-test context
+    if needs_fresh_context(request, browser_context_args):
+        context = request.getfixturevalue("context")
+    else:
+        context = request.getfixturevalue("pooled_context")
+    # In replay mode every request is answered from the test's HAR, nothing reaches the network
+    try:
+        har_archive.replay(context, request.node.nodeid)
+    except FileNotFoundError as e:
+        pytest.fail(str(e), pytrace=False)
+    # Remember resource sizes so blocked requests can be turned into bytes saved
+    context.on("response", resource_stats.record_response)
+    # Opt-in resource filtering, tests asserting on images whitelist them
+    policy = None
+    if request.config.getoption("--block-resources") or request.node.get_closest_marker("block_resources"):
+        allowed = request.node.get_closest_marker("allow_resources")
+        policy = ResourcePolicy(resource_stats, allowed.args if allowed else ())
+        policy.install(context)
+    # Failure-only tracing, unless pytest-playwright already traces the context
+    trace_buffer = None
+    if request.config.getoption("--trace-on-failure") and request.config.getoption("--tracing") == "off":
+        trace_buffer = TraceRingBuffer(context, size=max(1, request.config.getoption("--trace-chunks")))
+        trace_buffer.start(title=request.node.nodeid)
+        BasePage.trace_buffer = trace_buffer
     # Create a new page for each test
     page = context.new_page()
     # Deliver the page to the test
     yield page
+    # rep_call is set by pytest_runtest_makereport, missing when setup failed
+    if trace_buffer:
+        BasePage.trace_buffer = None
+        failed = getattr(request.node, "rep_call", None) is not None and request.node.rep_call.failed
+        keep_to = TraceRingBuffer.directory_for(
+            Path(request.config.getoption("--output")) / "failure-traces", request.node.nodeid
+        ) if failed else None
+        for path in trace_buffer.finish(keep_to):
+            print(f"Trace saved to {path}")
     # Close the page after the test
     page.close()
+    context.remove_listener("response", resource_stats.record_response)
+    if policy:
+        policy.uninstall(context)
+    # Counted where the test ran, summed up by the controller from the teardown report
+    counts = resource_stats.drain()
+    if counts:
+        request.node.user_properties.append(("resource_stats", counts))
 
 #=====================
-# Base URL configuration
+# Step timeline (Allure steps + page object actions)
 #=====================
-@pytest.fixture(scope="session")
-def base_url() -> str:
-    return os.getenv("BASE_URL", "https://automationteststore.com/")
+@pytest.fixture(autouse=True)
+def step_timeline(request):
+    """Time the test's steps and actions, write reports/timeline/<test>.json and attach the breakdown"""
+    timeline.start(request.node.nodeid)
+    yield
+    result = timeline.stop()
+    # Travels with the teardown report to the controller's run history
+    request.node.user_properties.append(("step_timeline", result["spans"]))
+    StepTimeline.write(result, Path(request.config.rootpath) / "reports" / "timeline")
+    allure.attach(StepTimeline.breakdown(result), name="step timeline", attachment_type=AttachmentType.TEXT)
+    allure.attach(json.dumps(result, indent=2), name="step timeline (json)", attachment_type=AttachmentType.JSON)
 
 #=====================
-# Automatic screenshot on failure
+# Front-end performance per route
 #=====================
+perf_metrics = PerfMetrics()
+
 @pytest.fixture(autouse=True)
-def screenshot_on_failure(request, page: Page):
-    # Execute the test
+def perf_samples(request):
+    """Hand the test's navigation samples to its report, so xdist workers' samples reach the controller"""
     yield
-    # If the test failed, take a screenshot
-    if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
-        # Create screenshot with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_path = f"screenshots/{request.node.name}_{timestamp}.png"
-        # Ensure the screenshots directory exists
-        os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
-        # Take screenshot
-        page.screenshot(path=screenshot_path)
-        print(f"Screenshot saved to {screenshot_path}")
+    if BasePage.perf_collector:
+        samples = BasePage.perf_collector.drain()
+        if samples:
+            request.node.user_properties.append(("perf_metrics", samples))
+
+#=====================
+# Async flows (async def tests marked async_flow, see pages/aio)
+#=====================
+def flow_batch_size(config) -> int:
+    # A worker only knows the tests it was sent, batches stay whole only if the group goes to one worker
+    # (xdist resets dist on workers, loadgroup is what remains of --dist loadgroup there)
+    if hasattr(config, "workerinput") and not config.getoption("loadgroup", False):
+        return 1
+    return max(1, config.getoption("--flow-concurrency"))
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    try:
+        batches = FlowBatch.assign(items, flow_batch_size(config))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    # Runs before xdist turns xdist_group into the @group nodeid suffix
+    for index, batch in enumerate(batches):
+        for item in batch.items:
+            item.add_marker(pytest.mark.xdist_group(f"async_flows_{index}"))
+
+def pytest_collection_finish(session):
+    # Batched again once -k/-m deselection is done, so deselected flows do not run with the others
+    FlowBatch.assign(session.items, flow_batch_size(session.config))
+
+@pytest.fixture(scope="session")
+def async_flow_runner(browser_name: str, browser_type_launch_args: dict, base_url: str):
+    """Event loop thread with its own async browser, shared by the async flows of this worker"""
+    runner = AsyncFlowRunner(browser_name, browser_type_launch_args, {"base_url": base_url})
+    yield runner
+    runner.close()
+
+@pytest.fixture
+def flow(request, async_flow_runner: AsyncFlowRunner, base_url: str) -> FlowHandle:
+    """The test's own context and page; its batch runs the first time one of its flows is set up"""
+    handle = request.node.flow_batch.handle_for(request.node, async_flow_runner, base_url)
+    # Its own time, not the batch's, for the duration history and the run history
+    request.node.user_properties.append(("flow_duration", handle.duration))
+    return handle
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    # The flow already ran with its batch, the test reports its outcome
+    if not hasattr(pyfuncitem, "flow_batch"):
+        return None
+    handle = pyfuncitem.funcargs["flow"]
+    if handle.error:
+        raise handle.error
+    if handle.duration is None:
+        pytest.fail("The flow never ran with its batch")
+    return True
+
+#=====================
+# Local stand-in store
 #=====================
-# Hook to capture test results
+@pytest.fixture(scope="session")
+def local_store_server() -> LocalStoreServer:
+    """Start the stand-in store once per worker, seeded with the registered test account"""
+    accounts = {os.getenv("VALID_LOGIN_NAME", "cmctest"): os.getenv("VALID_PASSWORD", "Qwerty123")}
+    with LocalStoreServer(accounts=accounts) as server:
+        yield server
+
+@pytest.fixture(scope="session")
+def local_store(local_store_server: LocalStoreServer) -> str:
+    return local_store_server.url
+
 #=====================
+# Base URL configuration
+#=====================
+@pytest.fixture(scope="session")
+def base_url(request) -> str:
+    # --local-store wins, then --base-url (pytest-base-url), then BASE_URL from .env
+    if request.config.getoption("--local-store"):
+        return request.getfixturevalue("local_store")
+    return request.config.getoption("base_url") or os.getenv("BASE_URL", "https://automationteststore.com/")
+
+@pytest.fixture(scope="session", autouse=True)
+def page_routes(base_url: str) -> None:
+    """Resolve every page object route against the configured origin"""
+    BasePage.base_url = base_url
+
+#=====================
+# Registered accounts (pool leased per worker or per test)
+#=====================
+def account_lease_scope(fixture_name: str, config) -> str:
+    return "session" if config.getoption("--account-lease") == "worker" else "function"
+
+@pytest.fixture(scope="session")
+def account_pool(base_url: str, pytestconfig) -> AccountPool:
+    """Accounts registered on this store by earlier runs and workers, .cache/account_pool_<host>.json"""
+    return AccountPool(pool_path(pytestconfig.rootpath, base_url), TestDataGenerator.factory)
+
+@pytest.fixture(scope=account_lease_scope)
+def registered_account(account_pool: AccountPool, browser: Browser, base_url: str, page_routes,
+                       har_archive: HarArchive, request) -> dict:
+    """An account no other worker (or test, with --account-lease test) uses, handed back with an empty cart"""
+    worker = getattr(request.config, "workerinput", {}).get("workerid", "main")
+    account = account_pool.lease(f"{worker} {request.node.nodeid}".strip(), registrar(browser))
+    # The stand-in store keeps accounts in memory, per worker: teach it the ones registered elsewhere
+    if request.config.getoption("--local-store"):
+        request.getfixturevalue("local_store_server").state.add_account(stand_in_account(account))
+    yield account
+    # The store keeps a customer's cart across sessions, the next holder starts from an empty one
+    context = None
+    try:
+        context = browser.new_context(storage_state=logged_in_state(browser, account, base_url, har_archive,
+                                                                   request.config.rootpath))
+        CartSeeder(context.new_page()).clear()
+    except Exception as e:
+        # Not the test's failure: the account still goes back, its next holder may find items in the cart
+        warnings.warn(f"Could not empty the cart of pooled account {account['login_name']}: {e}")
+    finally:
+        try:
+            if context:
+                context.close()
+        finally:
+            account_pool.release(account)
+
+#=====================
+# Authenticated session (storage state cache)
+#=====================
+def logged_in_state(browser: Browser, account: dict, base_url: str, har_archive: HarArchive, rootpath) -> str:
+    """Storage state file of the account, logged in again once its TTL is over"""
+    # One state file per store host, the session cookies are not valid anywhere else
+    cache = AuthStateCache(
+        Path(rootpath) / ".auth" / f"{urlsplit(base_url).hostname}_{account['login_name']}.json",
+        ttl_seconds=int(os.getenv("AUTH_STATE_TTL", "1800")),
+    )
+
+    def login(path: str) -> None:
+        context = browser.new_context(**har_archive.context_args("auth_login", base_url))
+        har_archive.replay(context, "auth_login")
+        login_page = LoginPage(context.new_page())
+        login_page.navigate_to_login()
+        login_page.login(account["login_name"], account["password"])
+        login_page.assert_login_successful()
+        context.storage_state(path=path)
+        context.close()
+
+    return cache.get(login)
+
+@pytest.fixture(scope=account_lease_scope)
+def auth_storage_state(browser: Browser, registered_account: dict, base_url: str, har_archive: HarArchive,
+                       pytestconfig) -> str:
+    """Log in with the leased account once and share the storage state file with every logged_in test"""
+    return logged_in_state(browser, registered_account, base_url, har_archive, pytestconfig.rootpath)
+
+@pytest.fixture
+def browser_context_args(browser_context_args, base_url: str, har_archive: HarArchive, request):
+    # In record mode the context writes the test's store traffic to its HAR on close
+    args = {**browser_context_args, **har_archive.context_args(request.node.nodeid, base_url)}
+    # Tests marked logged_in start on a context that already holds the session cookies
+    if request.node.get_closest_marker("logged_in"):
+        args["storage_state"] = request.getfixturevalue("auth_storage_state")
+    return args
+
+#=====================
+# Hook to capture test results and failure artifacts
+#=====================
+failure_artifacts = FailureArtifacts(screenshots_dir="screenshots")
+
 @pytest.hookimpl(hookwrapper=True, tryfirst=True)
 def pytest_runtest_makereport(item, call):
     # Execute all other hooks to obtain the report object
@@ -58,24 +520,131 @@ def pytest_runtest_makereport(item, call):
     # Set a report attribute for each phase of a call, which can be "setup", "call", "teardown"
     setattr(item, f"rep_{rep.when}", rep)
 
+    # On failure capture screenshot and page source once, for both Allure and screenshots/
+    if rep.when == "call" and rep.failed:
+        page = item.funcargs.get("page", None)
+        if page:
+            failure_artifacts.capture(page, item.name)
+
+def pytest_sessionfinish(session):
+    # Let the background writer finish before the process exits
+    failure_artifacts.shutdown()
+    resource_stats.save()
+    # Every process merges its own wins into the shared ranking file
+    BasePage.candidate_ranking.save()
+    # Everything below runs once, in the controller (or the only process without xdist)
+    if hasattr(session.config, "workerinput"):
+        return
+    duration_history.save()
+    run_history.save(run_environment(session.config))
+    if perf_metrics.samples:
+        perf_metrics.write(session.config.rootpath / "reports" / "perf_metrics.json")
+    # Drop content left over from earlier recordings, once every worker has written its HARs
+    if session.config.getoption("--har-mode") == "record":
+        HarArchive(session.config.rootpath / session.config.getoption("--har-dir"), "record").prune()
+
+#=====================
+# Duration-aware scheduling for -n runs
+#=====================
+duration_history = DurationHistory(Path(__file__).parent / ".cache" / "test_durations.json")
+
+def pytest_runtest_logreport(report):
+    # The controller receives every worker's reports, so it sees the whole run
+    duration_history.add(report)
+    run_history.add(report)
+    if report.when == "teardown":
+        # In the controller, worker reports show up here too (their processes are not summarised)
+        for name, samples in report.user_properties:
+            if name == "process_samples":
+                navigation_timings.merge(samples["navigation"])
+                context_setup_timings.merge(samples["context_setup"])
+                locator_counts.add(report.nodeid, samples["locators"])
+            elif name == "perf_metrics":
+                for sample in samples:
+                    perf_metrics.add(sample)
+            elif name == "resource_stats":
+                resource_stats.add(samples)
+
+#=====================
+# Run history (python -m utils.run_history flags slow-downs)
+#=====================
+run_history = RunHistory(Path(__file__).parent / ".cache" / "run_history.sqlite")
+
+def run_environment(config) -> dict:
+    """What the run was made against, stored next to its results"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=config.rootpath,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "base_url": "local-store" if config.getoption("--local-store")
+                    else config.getoption("base_url") or os.getenv("BASE_URL", "https://automationteststore.com/"),
+        "browsers": config.getoption("--browser") or ["chromium"],
+        "headed": config.getoption("--headed"),
+        "workers": config.getoption("numprocesses", 0),
+        "wait_until": config.getoption("--wait-until"),
+        "block_resources": config.getoption("--block-resources"),
+        "har_mode": config.getoption("--har-mode"),
+        "data_seed": TestDataGenerator.factory.seed,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": commit,
+    }
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    # Only replace the default --dist=load, explicit loadfile/loadscope/... are respected
+    if config.getoption("dist") == "load":
+        return DurationScheduling(config, log, duration_history)
+
 #=====================
 # Test Data Fixtures - E2E Tests
 #=====================
 
+@pytest.fixture(scope="session")
+def product_index(har_archive: HarArchive, playwright, base_url: str, pytestconfig) -> ProductIndex:
+    """Store catalog crawled over HTTP once per TTL, query it instead of probing searches"""
+    # Session fixtures set up before cart_seeder can skip, and the crawl would go to the network
+    if har_archive.mode == "replay":
+        pytest.skip("product_index crawls the store over playwright.request, which HAR replay does not cover")
+    index = ProductIndex(
+        ProductIndex.cache_path(pytestconfig.rootpath, base_url),
+        ttl_seconds=int(os.getenv("PRODUCT_INDEX_TTL", "86400")),
+    )
+    request = playwright.request.new_context()
+    try:
+        return index.load(request, base_url)
+    finally:
+        request.dispose()
+
+@pytest.fixture
+def cart_seeder(har_archive: HarArchive, request) -> CartSeeder:
+    """Fill the cart over HTTP on the test's session, e.g. cart_seeder.seed([(72, 1), (78, 2)])"""
+    # context.request is not served by route_from_har, seeding would need the live store
+    if har_archive.mode == "replay":
+        pytest.skip("cart_seeder posts over context.request, which HAR replay does not cover")
+    return CartSeeder(request.getfixturevalue("page"))
+
+@pytest.fixture(scope="session")
+def data_factory() -> DataFactory:
+    """This worker's generator of unique users, addresses and emails"""
+    return TestDataGenerator.factory
+
 @pytest.fixture
 def guest_checkout_data():
     """Fixture for guest checkout test data"""
     return TestDataGenerator.generate_guest_checkout_data()
 
 @pytest.fixture
-def registered_user_data():
+def registered_user_data(registered_account: dict):
     """Fixture for registered user credentials"""
-    return TestDataGenerator.generate_registered_user_data()
+    return TestDataGenerator.generate_registered_user_data(registered_account)
 
 @pytest.fixture
-def registered_user_checkout_data():
+def registered_user_checkout_data(registered_account: dict):
     """Fixture for registered user checkout data"""
-    return TestDataGenerator.generate_registered_user_checkout_data()
+    return TestDataGenerator.generate_registered_user_checkout_data(registered_account)
 
 @pytest.fixture
 def multiple_products_data():
@@ -107,38 +676,15 @@ def invalid_login_data():
     }
 
 @pytest.fixture
-def valid_login_data():
+def valid_login_data(registered_account: dict):
     """Fixture for valid login credentials"""
     return {
-        "email": os.getenv("VALID_EMAIL", "registereduser@example.com"),
-        "password": os.getenv("VALID_PASSWORD", "TestPassword123!")
+        "login_name": registered_account["login_name"],
+        "email": registered_account["email"],
+        "password": registered_account["password"]
     }
 
 @pytest.fixture
 def generate_data_for_contact_us():
     """Fixture for contact us form data"""
     return TestDataGenerator.generate_data_for_contact_us()
-
-#============================
-# Allure Reports
-#============================
-@pytest.hookimpl(tryfirst=True, hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    outcome = yield
-    rep = outcome.get_result()
-
-    if rep.when == "call" and rep.failed:
-        page = item.funcargs.get("page", None)
-        if page:
-            # Screenshot
-            allure.attach(
-                page.screenshot(full_page=True),
-                name="screenshot",
-                attachment_type=AttachmentType.PNG,
-            )
-            # Page HTML
-            allure.attach(
-                page.content(),
-                name="page_source",
-                attachment_type=AttachmentType.HTML,
-            )
\ No newline at end of file
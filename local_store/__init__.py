@@ -0,0 +1,7 @@
+"""
+Local stand-in for automationteststore.com used for offline, deterministic runs
+"""
+
+from local_store.server import LocalStoreServer
+
+__all__ = ["LocalStoreServer"]
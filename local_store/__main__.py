@@ -0,0 +1,24 @@
+"""
+Run the stand-in store by hand: python -m local_store [port]
+"""
+
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+from local_store import LocalStoreServer
+
+load_dotenv()
+
+port = int(sys.argv[1]) if len(sys.argv) > 1 else 8080
+accounts = {os.getenv("VALID_LOGIN_NAME", "cmctest"): os.getenv("VALID_PASSWORD", "Qwerty123")}
+
+with LocalStoreServer(port=port, accounts=accounts) as server:
+    print(f"Local store running at {server.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,88 @@
+"""
+Static catalog served by the local stand-in store
+"""
+
+CATEGORIES = [
+    {"id": 68, "name": "Apparel & accessories"},
+    {"id": 36, "name": "Makeup"},
+    {"id": 43, "name": "Skincare"},
+    {"id": 49, "name": "Fragrance"},
+    {"id": 58, "name": "Men"},
+    {"id": 52, "name": "Hair Care"},
+    {"id": 65, "name": "Books"},
+]
+
+PRODUCTS = [
+    {"id": 116, "name": "New Ladies High Wedge Heel Toe Thong Diamante Flip Flop Sandals",
+     "price": 24.00, "category": 68, "stock": 120},
+    {"id": 119, "name": "Fruit of the Loom T-Shirts 5 Pack - Super Premium",
+     "price": 47.00, "category": 68, "stock": 120},
+    {"id": 121, "name": "Designer Men Casual Formal Double Cuffs Grandad Band Collar Shirt",
+     "price": 32.00, "category": 58, "stock": 120},
+    {"id": 118, "name": "Womens high heel point toe stiletto sandals ankle strap court shoes",
+     "price": 29.00, "category": 68, "stock": 120},
+    {"id": 117, "name": "Ruby Shoo Womens Jada T-Bar Shoes",
+     "price": 39.00, "category": 68, "stock": 0},
+    {"id": 50, "name": "Skinsheen Bronzer Stick",
+     "price": 29.50, "category": 36, "stock": 120},
+    {"id": 57, "name": "Delicate Oil-Free Powder Blush Makeup",
+     "price": 46.00, "category": 36, "stock": 120},
+    {"id": 66, "name": "Total Moisture Facial Cream",
+     "price": 38.00, "category": 43, "stock": 120},
+    {"id": 93, "name": "Creme Precieuse Nuit 50ml",
+     "price": 220.00, "category": 43, "stock": 120},
+    {"id": 98, "name": "Soft Hands Nourishing Cream",
+     "price": 18.00, "category": 43, "stock": 120},
+    {"id": 78, "name": "Obsession Eau de Perfume for Women",
+     "price": 62.00, "category": 49, "stock": 120},
+    {"id": 80, "name": "Acqua Di Gio Pour Homme Perfume",
+     "price": 75.00, "category": 49, "stock": 120},
+    {"id": 64, "name": "Pantene Pro-V Conditioner, Classic Care",
+     "price": 8.23, "category": 52, "stock": 120},
+    {"id": 71, "name": "Seaweed Conditioner",
+     "price": 16.00, "category": 52, "stock": 120},
+    {"id": 72, "name": "Curls to straight Shampoo",
+     "price": 10.00, "category": 52, "stock": 120},
+    {"id": 76, "name": "Eau Parfumee au The Vert Shampoo",
+     "price": 31.00, "category": 52, "stock": 120},
+    {"id": 110, "name": "Paper Towns by John Green",
+     "price": 12.00, "category": 65, "stock": 120},
+]
+
+COUNTRIES = [
+    {"id": 222, "name": "United Kingdom"},
+    {"id": 223, "name": "United States"},
+    {"id": 38, "name": "Canada"},
+]
+
+# The zone list is loaded by the browser (rt=common/zone) once a country is picked
+ZONES = {
+    222: ["Aberdeen", "Bristol", "Cardiff", "Greater London", "Merseyside"],
+    223: ["Alabama", "California", "Florida", "New York", "Texas", "Washington"],
+    38: ["Alberta", "British Columbia", "Ontario", "Quebec"],
+}
+
+DEFAULT_COUNTRY_ID = 222
+
+
+def find_product(product_id: int) -> dict | None:
+    return next((product for product in PRODUCTS if product["id"] == product_id), None)
+
+
+def search_products(keyword: str) -> list[dict]:
+    keyword = keyword.strip().lower()
+    if not keyword:
+        return []
+    return [product for product in PRODUCTS if keyword in product["name"].lower()]
+
+
+def products_in_category(category_id: int) -> list[dict]:
+    return [product for product in PRODUCTS if product["category"] == category_id]
+
+
+def country_id_for(value: str) -> int | None:
+    """Accept either the numeric id or the country name, like <select> values do"""
+    for country in COUNTRIES:
+        if value in (str(country["id"]), country["name"]):
+            return country["id"]
+    return None
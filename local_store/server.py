@@ -0,0 +1,386 @@
+"""
+Local stand-in for automationteststore.com.
+
+Serves the flows the suite drives (home, search, category, product, cart,
+login, register, guest/registered checkout, contact) from memory, so runs
+need no network and every page loads in milliseconds.
+"""
+
+import hashlib
+import hmac
+import json
+import re
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from local_store import templates
+from local_store.catalog import (
+    CATEGORIES, PRODUCTS, ZONES, DEFAULT_COUNTRY_ID,
+    find_product, search_products, products_in_category, country_id_for,
+)
+
+SESSION_COOKIE = "AC_SESS_ID"
+CUSTOMER_COOKIE = "customer"
+
+# 1x1 transparent PNG served for every /image/ request
+PIXEL_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000b49444154789c6360000200000500017a5eab3f0000000049454e44ae426082"
+)
+STYLESHEET = b"body { font-family: sans-serif; } .contentpanel { padding: 10px; }"
+
+
+class StoreState:
+    """Accounts, sessions (carts) and orders kept in memory for the lifetime of the server"""
+
+    # The customer cookie is signed with a fixed key so a storage state saved
+    # against one server instance (another xdist worker, a previous run) stays valid
+    SIGNING_KEY = b"local-stand-in-store"
+
+    def __init__(self, accounts: Optional[dict[str, str]] = None):
+        self.lock = threading.Lock()
+        self.accounts: dict[str, dict] = {}
+        self.sessions: dict[str, dict] = {}
+        self.next_order_id = 1000
+        for login_name, password in (accounts or {}).items():
+            self.add_account({
+                "loginname": login_name, "password": password, "firstname": login_name,
+                "lastname": "Customer", "email": f"{login_name}@example.com",
+            })
+
+    def add_account(self, account: dict) -> None:
+        self.accounts[account["loginname"]] = account
+
+    def email_taken(self, email: str) -> bool:
+        return any(account["email"].lower() == email.lower() for account in self.accounts.values())
+
+    def session(self, session_id: str) -> dict:
+        return self.sessions.setdefault(session_id, {"cart": {}, "guest": None, "checkout": False})
+
+    def sign(self, login_name: str) -> str:
+        signature = hmac.new(self.SIGNING_KEY, login_name.encode(), hashlib.sha256).hexdigest()[:32]
+        return f"{login_name}.{signature}"
+
+    def verify(self, token: str) -> Optional[str]:
+        login_name, _, _signature = token.rpartition(".")
+        if login_name and hmac.compare_digest(self.sign(login_name), token) and login_name in self.accounts:
+            return login_name
+        return None
+
+
+class StoreRequestHandler(BaseHTTPRequestHandler):
+    """Routes index.php?rt=... requests the same way the real store does"""
+
+    state: StoreState
+
+    # Silence the default per-request logging
+    def log_message(self, format, *args):
+        pass
+
+    # ======================
+    # Request plumbing
+    # ======================
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        if url.path.startswith("/image/"):
+            return self._send(200, PIXEL_PNG, "image/png")
+        if url.path.startswith("/resources/"):
+            return self._send(200, STYLESHEET, "text/css")
+        if url.path not in ("/", "/index.php"):
+            return self._send(404, b"Not Found", "text/plain")
+
+        self.query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self.form = {}
+        if method == "POST":
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length).decode()
+            self.form = {key: values[0] for key, values in parse_qs(body, keep_blank_values=True).items()}
+
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        self.new_cookies: dict[str, str] = {}
+        self.session_id = cookies[SESSION_COOKIE].value if SESSION_COOKIE in cookies else None
+        if not self.session_id:
+            self.session_id = secrets.token_hex(16)
+            self.new_cookies[SESSION_COOKIE] = self.session_id
+        token = cookies[CUSTOMER_COOKIE].value if CUSTOMER_COOKIE in cookies else ""
+
+        route = self.query.get("rt", "common/home")
+        handler = getattr(self, "route_" + re.sub(r"\W", "_", route), None)
+        with self.state.lock:
+            self.session = self.state.session(self.session_id)
+            self.customer = self.state.accounts.get(self.state.verify(token)) if token else None
+            if handler is None:
+                return self._page(templates.not_found(), "Not Found", status=404)
+            handler(method)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[dict] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        for name, value in getattr(self, "new_cookies", {}).items():
+            self.send_header("Set-Cookie", f"{name}={value}; Path=/; SameSite=Lax" if value else
+                             f"{name}=; Path=/; Max-Age=0")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _page(self, content: str, title: str, status: int = 200) -> None:
+        cart_count = sum(self.session["cart"].values())
+        html = templates.layout(title, content, cart_count=cart_count, logged_in=self.customer is not None)
+        self._send(status, html.encode(), "text/html; charset=utf-8")
+
+    def _redirect(self, route: str) -> None:
+        location = "/" if route == "common/home" else f"/index.php?rt={route}"
+        self._send(303, b"", "text/html", {"Location": location})
+
+    def _cart_rows(self) -> list[tuple[dict, int]]:
+        return [(find_product(product_id), qty) for product_id, qty in self.session["cart"].items()]
+
+    def _login(self, login_name: str) -> None:
+        self.new_cookies[CUSTOMER_COOKIE] = self.state.sign(login_name)
+        self.customer = self.state.accounts[login_name]
+
+    # ======================
+    # Catalog
+    # ======================
+    def route_common_home(self, method):
+        self._page(templates.home(PRODUCTS[:8]), templates.HOME_TITLE)
+
+    def route_product_search(self, method):
+        keyword = self.query.get("keyword", self.query.get("filter_keyword", ""))
+        self._page(templates.search(keyword, search_products(keyword)), "Search")
+
+    def route_product_category(self, method):
+        category_id = int(self.query.get("path", "0") or 0)
+        category = next((c for c in CATEGORIES if c["id"] == category_id), None)
+        if category is None:
+            return self._page(templates.not_found(), "Not Found", status=404)
+        self._page(templates.category(category["name"], products_in_category(category_id)), category["name"])
+
+    def route_product_product(self, method):
+        product = find_product(int(self.query.get("product_id", "0") or 0))
+        if product is None:
+            return self._page(templates.not_found(), "Not Found", status=404)
+        self._page(templates.product(product), product["name"])
+
+    def route_common_zone(self, method):
+        country_id = country_id_for(self.query.get("country_id", "")) or DEFAULT_COUNTRY_ID
+        self._send(200, json.dumps(ZONES[country_id]).encode(), "application/json")
+
+    # ======================
+    # Cart
+    # ======================
+    def route_checkout_cart(self, method):
+        cart = self.session["cart"]
+        if "remove" in self.query:
+            cart.pop(int(self.query["remove"]), None)
+            return self._redirect("checkout/cart")
+        if method == "POST":
+            if "product_id" in self.form:
+                product = find_product(int(self.form["product_id"]))
+                if product and product["stock"] > 0:
+                    qty = max(int(self.form.get("quantity", "1") or 1), 1)
+                    cart[product["id"]] = cart.get(product["id"], 0) + qty
+            for key, value in self.form.items():
+                match = re.fullmatch(r"quantity\[(\d+)\]", key)
+                if match and int(match.group(1)) in cart:
+                    qty = int(value) if value.strip().isdigit() else 0
+                    if qty > 0:
+                        cart[int(match.group(1))] = qty
+                    else:
+                        cart.pop(int(match.group(1)))
+            return self._redirect("checkout/cart")
+        self._page(templates.cart(self._cart_rows()), "Shopping Cart")
+
+    # ======================
+    # Checkout
+    # ======================
+    def route_checkout_shipping(self, method):
+        if not self.session["cart"]:
+            return self._redirect("checkout/cart")
+        if self.customer or self.session["guest"]:
+            return self._redirect("checkout/confirm")
+        self.session["checkout"] = True
+        self._redirect("account/login")
+
+    route_checkout_checkout = route_checkout_shipping
+
+    def route_checkout_guest_step_1(self, method):
+        if method == "POST":
+            errors = [f"{label} is required!" for name, label in
+                      (("firstname", "First Name"), ("lastname", "Last Name"), ("email", "E-Mail"),
+                       ("address_1", "Address 1"), ("city", "City"), ("postcode", "ZIP/Post Code"))
+                      if not self.form.get(name, "").strip()]
+            if self.form.get("zone_id", "FALSE") == "FALSE":
+                errors.append("Please select a region / state!")
+            if not errors:
+                self.session["guest"] = dict(self.form)
+                return self._redirect("checkout/confirm")
+            return self._page(templates.guest_step_1(errors), "Guest Checkout")
+        self._page(templates.guest_step_1([]), "Guest Checkout")
+
+    def route_checkout_confirm(self, method):
+        if not self.session["cart"] or not (self.customer or self.session["guest"]):
+            return self._redirect("checkout/shipping")
+        if method == "POST":
+            self.state.next_order_id += 1
+            self.session.update({"cart": {}, "guest": None, "checkout": False,
+                                 "last_order": self.state.next_order_id})
+            return self._redirect("checkout/success")
+        self._page(templates.confirm(self._cart_rows()), "Checkout Confirmation")
+
+    def route_checkout_success(self, method):
+        self._page(templates.order_success(self.session.get("last_order", 0)), "Your Order Has Been Processed!")
+
+    # ======================
+    # Account
+    # ======================
+    def route_account_login(self, method):
+        guest_allowed = self.session["checkout"] and bool(self.session["cart"])
+        if method == "POST":
+            if self.form.get("account") == "register":
+                return self._redirect("account/create")
+            if self.form.get("account") == "guest":
+                return self._redirect("checkout/guest_step_1")
+            account = self.state.accounts.get(self.form.get("loginname", ""))
+            if account and account["password"] == self.form.get("password"):
+                self._login(account["loginname"])
+                if guest_allowed:
+                    return self._redirect("checkout/confirm")
+                return self._redirect("account/account")
+            return self._page(templates.login(["Error: Incorrect login or password provided."], guest_allowed),
+                              "Account Login")
+        self._page(templates.login([], guest_allowed), "Account Login")
+
+    def route_account_account(self, method):
+        if not self.customer:
+            return self._redirect("account/login")
+        self._page(templates.account(self.customer["firstname"]), "My Account")
+
+    def route_account_logout(self, method):
+        self.new_cookies[CUSTOMER_COOKIE] = ""
+        self.customer = None
+        self.session.update({"cart": {}, "guest": None, "checkout": False})
+        self._page(templates.logout(), "Account Logout")
+
+    def route_account_forgotten_password(self, method):
+        self._page(templates.forgotten(), "Forgot Your Password?")
+
+    route_account_forgotten_loginname = route_account_forgotten_password
+
+    def route_account_create(self, method):
+        if method == "GET":
+            return self._page(templates.register([]), "Create Account")
+        errors = self._validate_registration(self.form)
+        if errors:
+            return self._page(templates.register(errors), "Create Account")
+        self.state.add_account({
+            "loginname": self.form["loginname"], "password": self.form["password"],
+            "firstname": self.form["firstname"], "lastname": self.form["lastname"], "email": self.form["email"],
+        })
+        self._login(self.form["loginname"])
+        self._redirect("account/success")
+
+    def route_account_success(self, method):
+        self._page(templates.account_created(), "Your Account Has Been Created!")
+
+    def _validate_registration(self, form: dict) -> list[str]:
+        def between(name, low, high):
+            return low <= len(form.get(name, "").strip()) <= high
+
+        errors = []
+        if not between("firstname", 1, 32):
+            errors.append("First Name must be between 1 and 32 characters!")
+        if not between("lastname", 1, 32):
+            errors.append("Last Name must be between 1 and 32 characters!")
+        if not re.fullmatch(r"[^@\s]+@[^@\s]+\.[^@\s]+", form.get("email", "")):
+            errors.append("Email Address does not appear to be valid!")
+        elif self.state.email_taken(form["email"]):
+            errors.append("Error: E-Mail Address is already registered!")
+        if not between("address_1", 3, 128):
+            errors.append("Address 1 must be between 3 and 128 characters!")
+        if not between("city", 3, 128):
+            errors.append("City must be between 3 and 128 characters!")
+        if form.get("zone_id", "FALSE") == "FALSE":
+            errors.append("Please select a region / state!")
+        if not between("postcode", 3, 10):
+            errors.append("Zip/postal code must be between 3 and 10 characters!")
+        if not re.fullmatch(r"[\w.@-]{5,64}", form.get("loginname", "")):
+            errors.append("Login name must be alphanumeric only and between 5 and 64 characters!")
+        elif form["loginname"] in self.state.accounts:
+            errors.append("This login name is not available. Try different login name!")
+        if not between("password", 4, 20):
+            errors.append("Password must be between 4 and 20 characters!")
+        elif form.get("confirm") != form.get("password"):
+            errors.append("Password confirmation does not match password!")
+        if form.get("agree") != "1":
+            errors.append("Error: You must agree to the Privacy Policy!")
+        return errors
+
+    # ======================
+    # Content
+    # ======================
+    def route_content_contact(self, method):
+        if method == "POST":
+            errors = []
+            if not 3 <= len(self.form.get("first_name", "").strip()) <= 32:
+                errors.append("Name must be between 3 and 32 characters!")
+            if "@" not in self.form.get("email", ""):
+                errors.append("E-Mail Address does not appear to be valid!")
+            if not 10 <= len(self.form.get("enquiry", "").strip()) <= 3000:
+                errors.append("Enquiry must be between 10 and 3000 characters!")
+            if not errors:
+                return self._redirect("content/contact/success")
+            return self._page(templates.contact(errors), "Contact Us")
+        self._page(templates.contact([]), "Contact Us")
+
+    def route_content_contact_success(self, method):
+        self._page(templates.contact_success(), "Contact Us")
+
+    def route_content_content(self, method):
+        title = {"4": "About Us", "2": "Privacy Policy"}.get(self.query.get("content_id", ""), "Information")
+        self._page(templates.content(title), title)
+
+
+class LocalStoreServer:
+    """Run the stand-in store on a background thread (port 0 picks a free port)"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, accounts: Optional[dict[str, str]] = None):
+        self.state = StoreState(accounts)
+        handler = type("BoundStoreRequestHandler", (StoreRequestHandler,), {"state": self.state})
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "LocalStoreServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="local-store", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "LocalStoreServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,332 @@
+"""
+HTML for the local stand-in store.
+
+The markup only reproduces the classes, ids and texts the page objects in
+pages/ rely on, so a selector change there must be mirrored here.
+"""
+
+from html import escape
+
+from local_store.catalog import CATEGORIES, COUNTRIES, ZONES, DEFAULT_COUNTRY_ID
+
+HOME_TITLE = "A place to practice your automation skills!"
+
+ZONES_SCRIPT = """
+<script>
+function loadZones(countrySelect, zoneSelectId) {
+    fetch('/index.php?rt=common/zone&country_id=' + encodeURIComponent(countrySelect.value))
+        .then(response => response.json())
+        .then(zones => {
+            const zoneSelect = document.getElementById(zoneSelectId);
+            zoneSelect.innerHTML = '<option value="FALSE">--- Please Select ---</option>' +
+                zones.map(zone => '<option value="' + zone + '">' + zone + '</option>').join('');
+        });
+}
+</script>
+"""
+
+
+def product_url(product_id: int) -> str:
+    return f"/index.php?rt=product/product&amp;product_id={product_id}"
+
+
+def layout(title: str, content: str, cart_count: int = 0, logged_in: bool = False) -> str:
+    account_links = ""
+    if logged_in:
+        account_links = (
+            '<li><a href="/index.php?rt=account/account">Account</a></li>'
+            '<li><a href="/index.php?rt=account/logout">Logoff</a></li>'
+        )
+    category_links = "".join(
+        f'<li><a href="/index.php?rt=product/category&amp;path={category["id"]}">{escape(category["name"])}</a></li>'
+        for category in CATEGORIES
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{escape(title)}</title>
+<link rel="stylesheet" href="/resources/stylesheet.css">
+</head>
+<body>
+<header>
+  <div class="headerstrip">
+    <a class="logo" href="/"><img src="/image/logo.png" alt="Automation Test Store" width="120" height="40"></a>
+    <form id="search_form" action="/index.php" method="get">
+      <input type="hidden" name="rt" value="product/search">
+      <input type="text" name="filter_keyword" id="filter_keyword" placeholder="Search Keywords">
+      <div class="button-in-search" onclick="document.getElementById('search_form').submit()"><i class="fa fa-search">&#128269;</i></div>
+    </form>
+    <ul class="nav topcart">
+      {account_links}
+      <li><a href="/index.php?rt=checkout/cart">Cart <span class="label label-orange font14">{cart_count}</span></a></li>
+      <li><a class="menu_checkout" href="/index.php?rt=checkout/shipping">Checkout</a></li>
+    </ul>
+  </div>
+  <nav class="subnav">
+    <ul class="nav-pills categorymenu">
+      <li><a href="/">Home</a></li>
+      {category_links}
+    </ul>
+  </nav>
+</header>
+<div id="maincontainer">
+  <div class="contentpanel">
+{content}
+  </div>
+</div>
+<footer>
+  <a href="/index.php?rt=content/content&amp;content_id=4">About Us</a>
+  <a href="/index.php?rt=content/content&amp;content_id=2">Privacy Policy</a>
+  <a href="/index.php?rt=content/contact">Contact Us</a>
+</footer>
+</body>
+</html>"""
+
+
+def heading(text: str) -> str:
+    return f'<h1 class="heading1"><span class="maintext">{escape(text)}</span></h1>'
+
+
+def alert(messages: list[str]) -> str:
+    if not messages:
+        return ""
+    return f'<div class="alert alert-error alert-danger">{" ".join(escape(m) for m in messages)}</div>'
+
+
+def product_grid(products: list[dict]) -> str:
+    cards = "".join(
+        f"""<div class="col-md-3 col-sm-6 col-xs-12">
+  <div class="fixed_wrapper"><div class="fixed">
+    <a class="prdocutname" href="{product_url(product["id"])}" title="{escape(product["name"])}">{escape(product["name"])}</a>
+  </div></div>
+  <div class="thumbnail"><a href="{product_url(product["id"])}"><img src="/image/product_{product["id"]}.png" alt="{escape(product["name"])}" width="80" height="80"></a></div>
+  <div class="pricetag"><div class="oneprice">${product["price"]:.2f}</div></div>
+</div>"""
+        for product in products
+    )
+    return f'<div class="thumbnails grid row list-inline">{cards}</div>'
+
+
+def home(products: list[dict]) -> str:
+    return f"""<div class="banner_container"><img src="/image/banner_1.png" alt="Banner" width="600" height="200"></div>
+<section class="promo_block"><h2>Featured</h2>{product_grid(products)}</section>"""
+
+
+def search(keyword: str, products: list[dict]) -> str:
+    results = product_grid(products) if products else "<div>There is no product that matches the search criteria.</div>"
+    return f"""{heading("Search")}
+<form action="/index.php" method="get">
+  <input type="hidden" name="rt" value="product/search">
+  <input type="text" name="keyword" id="keyword" value="{escape(keyword)}">
+</form>
+<h4 class="heading4">Products meeting the search criteria</h4>
+{results}"""
+
+
+def category(name: str, products: list[dict]) -> str:
+    return f"{heading(name)}{product_grid(products)}"
+
+
+def product(item: dict) -> str:
+    if item["stock"] > 0:
+        buy = f"""<form id="product" action="/index.php?rt=checkout/cart" method="post">
+  <input type="hidden" name="product_id" value="{item["id"]}">
+  <label for="product_quantity">Qty:</label>
+  <input type="text" id="product_quantity" name="quantity" value="1">
+  <a class="cart" href="#" onclick="document.getElementById('product').submit(); return false;">Add to Cart</a>
+</form>"""
+    else:
+        buy = '<span class="nostock">Out of Stock</span>'
+    return f"""<h1 class="productname"><span class="bgnone">{escape(item["name"])}</span></h1>
+<a class="local_image" href="/image/product_{item["id"]}.png"><img src="/image/product_{item["id"]}.png" alt="{escape(item["name"])}" width="300" height="300"></a>
+<div class="productprice"><span class="productfilneprice">${item["price"]:.2f}</span></div>
+{buy}
+<div id="description"><p>{escape(item["name"])} - stand-in product description.</p></div>"""
+
+
+def cart(rows: list[tuple[dict, int]]) -> str:
+    if not rows:
+        return f"""{heading("Shopping Cart")}
+<div>Your shopping cart is empty!</div>
+<a href="/" class="btn">Continue</a>"""
+    body = "".join(
+        f"""<tr>
+  <td><img src="/image/product_{item["id"]}.png" alt="" width="40" height="40"></td>
+  <td><a href="{product_url(item["id"])}">{escape(item["name"])}</a></td>
+  <td><input type="text" class="short" name="quantity[{item["id"]}]" value="{qty}"></td>
+  <td>${item["price"]:.2f}</td>
+  <td>${item["price"] * qty:.2f}</td>
+  <td><a class="btn btn-sm" href="/index.php?rt=checkout/cart&amp;remove={item["id"]}"><i class="fa fa-trash-o fa-fw">x</i></a></td>
+</tr>"""
+        for item, qty in rows
+    )
+    total = sum(item["price"] * qty for item, qty in rows)
+    return f"""{heading("Shopping Cart")}
+<form id="cart" action="/index.php?rt=checkout/cart" method="post">
+<table class="table table-striped table-bordered">
+  <thead><tr><th>Image</th><th>Name</th><th>Quantity</th><th>Unit Price</th><th>Total</th><th>Remove</th></tr></thead>
+  <tbody>{body}</tbody>
+</table>
+<button id="cart-update" type="submit" class="btn">Update</button>
+</form>
+<table id="totals_table"><tr><td>Total:</td><td>${total:.2f}</td></tr></table>
+<a href="/" class="btn">Continue Shopping</a>
+<a href="/index.php?rt=checkout/shipping" id="cart_checkout1" class="btn">Checkout</a>"""
+
+
+def login(errors: list[str], guest_allowed: bool) -> str:
+    guest_option = ""
+    if guest_allowed:
+        guest_option = """<label><input type="radio" name="account" value="guest" id="accountFrm_accountguest"> Guest Checkout</label>"""
+    return f"""{heading("Account Login")}
+{alert(errors)}
+<section class="newcustomer">
+  <h2>I am a new customer.</h2>
+  <form id="accountFrm" action="/index.php?rt=account/login" method="post">
+    <label><input type="radio" name="account" value="register" id="accountFrm_accountregister" checked> Register Account</label>
+    {guest_option}
+    <button type="submit" class="btn" title="Continue">Continue</button>
+  </form>
+</section>
+<section class="returncustomer">
+  <h2>Returning Customer</h2>
+  <form id="loginFrm" action="/index.php?rt=account/login" method="post">
+    <label>Login Name: <input type="text" name="loginname" id="loginFrm_loginname"></label>
+    <label>Password: <input type="password" name="password" id="loginFrm_password"></label>
+    <a href="/index.php?rt=account/forgotten/password">Forgot your password?</a>
+    <a href="/index.php?rt=account/forgotten/loginname">Forgot your login?</a>
+    <button type="submit" class="btn" title="Login">Login</button>
+  </form>
+</section>"""
+
+
+def _country_options(selected_id: int = DEFAULT_COUNTRY_ID) -> str:
+    return "".join(
+        f'<option value="{country["id"]}"{" selected" if country["id"] == selected_id else ""}>{escape(country["name"])}</option>'
+        for country in COUNTRIES
+    )
+
+
+def _zone_options(country_id: int = DEFAULT_COUNTRY_ID) -> str:
+    return '<option value="FALSE">--- Please Select ---</option>' + "".join(
+        f'<option value="{escape(zone)}">{escape(zone)}</option>' for zone in ZONES[country_id]
+    )
+
+
+def register(errors: list[str]) -> str:
+    fields = [
+        ("firstname", "First Name"), ("lastname", "Last Name"), ("email", "E-Mail"),
+        ("telephone", "Telephone"), ("fax", "Fax"), ("company", "Company"),
+        ("address_1", "Address 1"), ("address_2", "Address 2"), ("city", "City"),
+    ]
+    inputs = "".join(
+        f'<label>{label}: <input type="text" name="{name}" id="AccountFrm_{name}"></label>' for name, label in fields
+    )
+    return f"""{heading("Create Account")}
+{alert(errors)}
+<form id="AccountFrm" action="/index.php?rt=account/create" method="post">
+  {inputs}
+  <label>Region / State: <select name="zone_id" id="AccountFrm_zone_id">{_zone_options()}</select></label>
+  <label>ZIP/Post Code: <input type="text" name="postcode" id="AccountFrm_postcode"></label>
+  <label>Country: <select name="country_id" id="AccountFrm_country_id" onchange="loadZones(this, 'AccountFrm_zone_id')">{_country_options()}</select></label>
+  <label>Login name: <input type="text" name="loginname" id="AccountFrm_loginname"></label>
+  <label>Password: <input type="password" name="password" id="AccountFrm_password"></label>
+  <label>Password Confirm: <input type="password" name="confirm" id="AccountFrm_confirm"></label>
+  <label><input type="radio" name="newsletter" value="1" id="AccountFrm_newsletter1"> Yes</label>
+  <label><input type="radio" name="newsletter" value="0" id="AccountFrm_newsletter0" checked> No</label>
+  <label><input type="checkbox" name="agree" value="1" id="AccountFrm_agree"> I have read and agree to the Privacy Policy</label>
+  <button type="submit" class="btn" title="Continue">Continue</button>
+</form>
+{ZONES_SCRIPT}"""
+
+
+def account_created() -> str:
+    return f"""{heading("Your Account Has Been Created!")}
+<p>Congratulations! Your new account has been successfully created!</p>
+<a href="/index.php?rt=account/account" class="btn">Continue</a>"""
+
+
+def account(firstname: str) -> str:
+    return f"""{heading("My Account")}
+<div class="menu_text">Welcome back {escape(firstname)}</div>"""
+
+
+def logout() -> str:
+    return f"""{heading("Account Logout")}
+<p>You have been logged off your account. It is now safe to leave the computer.</p>
+<a href="/" class="btn">Continue</a>"""
+
+
+def forgotten() -> str:
+    return f"""{heading("Forgot Your Password?")}
+<form action="/index.php?rt=account/forgotten/password" method="post">
+  <label>Login Name: <input type="text" name="loginname"></label>
+  <label>E-Mail: <input type="text" name="email"></label>
+  <button type="submit" class="btn" title="Continue">Continue</button>
+</form>"""
+
+
+def guest_step_1(errors: list[str]) -> str:
+    fields = [
+        ("firstname", "First Name"), ("lastname", "Last Name"), ("email", "E-Mail"),
+        ("telephone", "Telephone"), ("address_1", "Address 1"), ("city", "City"), ("postcode", "ZIP/Post Code"),
+    ]
+    inputs = "".join(
+        f'<label>{label}: <input type="text" name="{name}" id="guestFrm_{name}"></label>' for name, label in fields
+    )
+    return f"""{heading("Guest Checkout - Step 1")}
+{alert(errors)}
+<form id="guestFrm" action="/index.php?rt=checkout/guest_step_1" method="post">
+  {inputs}
+  <label>Region / State: <select name="zone_id" id="guestFrm_zone_id">{_zone_options()}</select></label>
+  <label>Country: <select name="country_id" id="guestFrm_country_id" onchange="loadZones(this, 'guestFrm_zone_id')">{_country_options()}</select></label>
+  <button type="submit" class="btn" title="Continue">Continue</button>
+</form>
+{ZONES_SCRIPT}"""
+
+
+def confirm(rows: list[tuple[dict, int]]) -> str:
+    items = "".join(
+        f"<tr><td>{escape(item['name'])}</td><td>{qty}</td><td>${item['price'] * qty:.2f}</td></tr>"
+        for item, qty in rows
+    )
+    return f"""{heading("Checkout Confirmation")}
+<table class="confirm_products">{items}</table>
+<form action="/index.php?rt=checkout/confirm" method="post">
+  <button type="submit" id="checkout_btn" class="btn" title="Confirm Order">Confirm Order</button>
+</form>"""
+
+
+def order_success(order_id: int) -> str:
+    return f"""{heading("Your Order Has Been Processed!")}
+<p>Your order #{order_id} has been created!</p>
+<a href="/" class="btn">Continue</a>"""
+
+
+def contact(errors: list[str]) -> str:
+    return f"""{heading("Contact Us")}
+{alert(errors)}
+<form id="ContactUsFrm" action="/index.php?rt=content/contact" method="post">
+  <label>First name: <input type="text" name="first_name" id="ContactUsFrm_first_name"></label>
+  <label>Email: <input type="text" name="email" id="ContactUsFrm_email"></label>
+  <label>Enquiry: <textarea name="enquiry" id="ContactUsFrm_enquiry"></textarea></label>
+  <button type="submit" class="btn" title="Submit">Submit</button>
+</form>"""
+
+
+def contact_success() -> str:
+    return f"""{heading("Contact Us")}
+<p>Your enquiry has been successfully sent to the store owner!</p>
+<a href="/" class="btn">Continue</a>"""
+
+
+def content(title: str) -> str:
+    return f"""{heading(title)}
+<p>{escape(title)} - stand-in content page.</p>
+<a href="/"><button type="button" class="btn">Continue</button></a>"""
+
+
+def not_found() -> str:
+    return f"""{heading("Page Not Found!")}
+<p>The page you requested cannot be found!</p>"""
@@ -0,0 +1,156 @@
+"""
+Async mirror of BasePage, for flows that share one event loop (see utils/async_flows.py)
+"""
+
+import time
+from functools import reduce
+from typing import Awaitable, Callable, Optional
+
+from playwright.async_api import Page, Locator, expect, TimeoutError as PlaywrightTimeoutError
+
+from pages.base.base_page import BasePage, SNAPSHOT_SCRIPT
+from pages.base.selectors import Selector
+
+
+def mirror_of(sync_cls: type[BasePage]):
+    """
+    Give an async page object the declarations of its sync twin.
+
+    Selector descriptors (re-registered in the async class's own `selectors`),
+    ready_selector and candidate lists are copied, so a selector is still
+    defined once. Methods are not: the async class implements the ones its
+    flows need with awaits. Readiness overrides and timings use the sync
+    class name, "HomePage=load" applies to both layers.
+    """
+    def decorate(cls):
+        cls.page_name = sync_cls.__name__
+        for klass in reversed(sync_cls.__mro__):
+            if not issubclass(klass, BasePage) or klass is BasePage:
+                continue
+            for name, value in vars(klass).items():
+                if name.startswith("__") or name in cls.__dict__ or name == "selectors":
+                    continue
+                if isinstance(value, (Selector, str, list, tuple)) or value is None:
+                    setattr(cls, name, value)
+                    if isinstance(value, Selector):
+                        value.__set_name__(cls, name)
+        return cls
+    return decorate
+
+
+class AsyncBasePage:
+    # Page object name used for readiness overrides and timings, set by mirror_of
+    page_name = "BasePage"
+    ready_selector: Optional[str] = None
+
+    # Configuration and statistics are the sync layer's, set once from conftest
+    readiness = property(lambda self: BasePage.readiness)
+    base_url = property(lambda self: BasePage.base_url)
+    navigation_timings = property(lambda self: BasePage.navigation_timings)
+    locator_counter = property(lambda self: BasePage.locator_counter)
+    candidate_ranking = property(lambda self: BasePage.candidate_ranking)
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    # Pure locator/URL builders are the sync definitions themselves (unwrapped from the step timer)
+    url_for = BasePage.url_for.__wrapped__
+    link_by_exact_name = BasePage.link_by_exact_name.__wrapped__
+
+    async def navigate(self, url: str, ready: str | Locator | None = None) -> None:
+        """Go to url and wait for ready (defaults to this page's ready_selector)"""
+        start = time.perf_counter()
+        await self.page.goto(url, wait_until=self.readiness.wait_until_for(self.page_name, "navigate"))
+        await self.wait_until_ready(ready)
+        self.navigation_timings.record(f"{self.page_name}.navigate", time.perf_counter() - start)
+
+    # ======================
+    # Readiness Methods
+    # ======================
+    async def wait_until_ready(self, ready: str | Locator | None = None, timeout: int = 30000) -> None:
+        ready = ready or self.ready_selector
+        if ready:
+            await self.wait_for_element(ready, timeout=timeout)
+
+    async def wait_for_ready_state(self, action: Optional[str] = None) -> None:
+        state = self.readiness.wait_until_for(self.page_name, action)
+        if state != "commit":
+            await self.page.wait_for_load_state(state=state)
+
+    async def perform_and_wait(self, action: Callable[[], Awaitable], name: str,
+                               ready: str | Locator | None = None, response: Optional[str] = None) -> None:
+        """Same contract as BasePage.perform_and_wait, action is an async callable"""
+        start = time.perf_counter()
+        if response:
+            async with self.page.expect_response(lambda r: response in r.url):
+                await action()
+            await self.wait_for_ready_state(name)
+        else:
+            async with self.page.expect_navigation(wait_until=self.readiness.wait_until_for(self.page_name, name)):
+                await action()
+        if ready:
+            await self.wait_for_element(ready)
+        self.navigation_timings.record(f"{self.page_name}.{name}", time.perf_counter() - start)
+
+    # ======================
+    # Wait Methods
+    # ======================
+    async def wait_for_element(self, locator: str | Locator, timeout: int = 30000) -> None:
+        if isinstance(locator, str):
+            locator = self.page.locator(locator)
+
+        await locator.wait_for(state="visible", timeout=timeout)
+
+    async def wait_for_text_change(self, locator: str | Locator, previous_text: str, timeout: int = 30000) -> None:
+        if isinstance(locator, str):
+            locator = self.page.locator(locator)
+
+        await expect(locator).not_to_have_text(previous_text, timeout=timeout)
+
+    async def wait_for_select_option(self, locator: str | Locator, label: str, timeout: int = 30000) -> None:
+        if isinstance(locator, str):
+            locator = self.page.locator(locator)
+
+        await locator.locator("option", has_text=label).first.wait_for(state="attached", timeout=timeout)
+
+    # ======================
+    # Parameterized Locators
+    # ======================
+    async def first_of(self, name: str, candidates: list[str], timeout: int = 5000) -> Optional[Locator]:
+        """Same race and learned ordering as BasePage.first_of"""
+        key = f"{self.page_name}.{name}"
+        ordered = self.candidate_ranking.order(key, candidates)
+        self.locator_counter.record(f"{key}.first_of")
+        visible = [self.page.locator(candidate).locator("visible=true") for candidate in ordered]
+        try:
+            await reduce(Locator.or_, visible).first.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+
+        for candidate, locator in zip(ordered, visible):
+            if await locator.count():
+                self.candidate_ranking.record(key, candidate)
+                return locator.first
+        return None
+
+    # ======================
+    # Getting information
+    # ======================
+    async def get_text(self, locator: str | Locator) -> str:
+        if isinstance(locator, str):
+            locator = self.page.locator(locator)
+        text = await locator.text_content()
+        return text.strip() if text else ""
+
+    async def snapshot(self, fields: dict) -> dict:
+        """Same fields format as BasePage.snapshot"""
+        return await self.page.evaluate(SNAPSHOT_SCRIPT, fields)
+
+    # ======================
+    # Assertion Methods
+    # ======================
+    async def assert_element_visible(self, locator: str | Locator) -> None:
+        if isinstance(locator, str):
+            locator = self.page.locator(locator)
+
+        await expect(locator).to_be_visible()
@@ -0,0 +1,39 @@
+from playwright.async_api import Page
+from pages.aio.base_page import AsyncBasePage, mirror_of
+from pages.cart_page import CartPage, CartSnapshot
+
+@mirror_of(CartPage)
+class AsyncCartPage(AsyncBasePage):
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = self.url_for("checkout/cart")
+
+    #=====================================
+    # Actions
+    #=====================================
+    async def navigate_to_cart(self) -> None:
+        await self.navigate(self.url)
+
+    async def proceed_to_checkout(self) -> None:
+        """Navigate to checkout by going to the shipping page"""
+        await self.navigate(self.url_for("checkout/shipping"))
+
+    #=====================================
+    # Obtaining info
+    #=====================================
+    _cart_fields = CartPage._cart_fields
+
+    async def get_cart_snapshot(self) -> CartSnapshot:
+        return CartSnapshot.from_state(await self.snapshot(self._cart_fields()))
+
+    async def get_cart_item_count(self) -> int:
+        return (await self.get_cart_snapshot()).item_count
+
+    #=====================================
+    # Assertions
+    #=====================================
+    async def assert_cart_not_empty(self) -> None:
+        assert not (await self.get_cart_snapshot()).empty, "Cart is empty but should contain items"
+
+    async def assert_product_in_cart(self, product_name: str) -> None:
+        assert (await self.get_cart_snapshot()).row(product_name), f"Product {product_name} not found in cart"
@@ -0,0 +1,59 @@
+from playwright.async_api import Page, expect
+from pages.aio.base_page import AsyncBasePage, mirror_of
+from pages.checkout_page import CheckoutPage
+
+@mirror_of(CheckoutPage)
+class AsyncCheckoutPage(AsyncBasePage):
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = self.url_for("checkout/checkout")
+
+    #=====================================
+    # Actions - Guest Checkout
+    #=====================================
+    async def select_guest_checkout(self) -> None:
+        """Select guest checkout option and continue"""
+        await self.guest_checkout_option.click()
+        await expect(self.guest_checkout_option).to_be_checked()
+
+        button = await self.first_of("select_guest_checkout", self.account_continue_candidates)
+        if button:
+            await self.perform_and_wait(button.click, "select_guest_checkout")
+
+    async def fill_guest_information(self, email: str, firstname: str, lastname: str,
+                                     address: str, city: str, zipcode: str,
+                                     phone: str, country: str = "United States",
+                                     state: str = "California") -> None:
+        """Fill all guest information fields"""
+        await self.guest_email_input.fill(email)
+        await self.guest_firstname_input.fill(firstname)
+        await self.guest_lastname_input.fill(lastname)
+        await self.guest_address_input.fill(address)
+        await self.guest_city_input.fill(city)
+        await self.guest_zipcode_input.fill(zipcode)
+        await self.guest_phone_input.fill(phone)
+
+        await self.guest_country_select.select_option(country)
+
+        # Select state once the zones for the country have been loaded
+        await self.wait_for_select_option(self.guest_state_select, state)
+        await self.guest_state_select.select_option(state)
+
+        button = await self.first_of("fill_guest_information", self.guest_form_continue_candidates)
+        if button:
+            await self.perform_and_wait(button.click, "fill_guest_information")
+
+    #=====================================
+    # Actions - Order Confirmation
+    #=====================================
+    async def confirm_order(self) -> None:
+        await self.perform_and_wait(self.confirm_order_button.click, "confirm_order")
+
+    async def wait_for_order_confirmation(self, timeout: int = 30000) -> None:
+        await self.order_confirmation_message.wait_for(state="visible", timeout=timeout)
+
+    #=====================================
+    # Assertions
+    #=====================================
+    async def assert_order_confirmed(self) -> None:
+        assert await self.order_confirmation_message.is_visible(), "Order confirmation message not visible."
@@ -0,0 +1,38 @@
+from playwright.async_api import Page, expect
+from pages.aio.base_page import AsyncBasePage, mirror_of
+from pages.components.header_component import HeaderComponent
+
+@mirror_of(HeaderComponent)
+class AsyncHeaderComponent(AsyncBasePage):
+    def __init__(self, page: Page):
+        super().__init__(page)
+
+    #==========================================
+    # Actions
+    #==========================================
+    async def search_product_with_button(self, product_name: str) -> None:
+        await expect(self.search_input).to_be_visible()
+        await self.search_input.fill(product_name)
+        await self.perform_and_wait(self.search_button.click, "search_product_with_button",
+                                    ready=self.search_input_results)
+
+    async def go_to_cart(self) -> None:
+        await self.perform_and_wait(self.cart_link.click, "go_to_cart")
+
+    async def wait_for_cart_count_change(self, previous_count: str, timeout: int = 30000) -> None:
+        await self.wait_for_text_change(self.cart_item_count, previous_count, timeout=timeout)
+
+    #==========================================
+    # Verifications & Assertions
+    #==========================================
+    async def get_cart_item_count_text(self) -> str:
+        return await self.get_text(self.cart_item_count)
+
+    _check_search_results = staticmethod(HeaderComponent._check_search_results)
+
+    async def assert_search_results(self, search_term: str) -> None:
+        state = await self.snapshot({
+            "search_value": (self.selectors["search_input_results"], "value"),
+            "product_titles": (self.selectors["product_names"], "texts"),
+        })
+        self._check_search_results(search_term, state)
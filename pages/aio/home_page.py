@@ -0,0 +1,22 @@
+from playwright.async_api import Page
+from pages.aio.base_page import AsyncBasePage, mirror_of
+from pages.aio.header_component import AsyncHeaderComponent
+from pages.home_page import HomePage
+from pages.product_page import ProductPage
+
+@mirror_of(HomePage)
+class AsyncHomePage(AsyncBasePage):
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = self.url_for()
+        self.header = AsyncHeaderComponent(page)
+
+    # ==========================================
+    # Actions - Home Page
+    # ==========================================
+    async def navigate_to_home(self) -> None:
+        await self.navigate(self.url)
+
+    async def click_product(self, product_name: str) -> None:
+        await self.perform_and_wait(self.link_by_exact_name(product_name).click, "click_product",
+                                    ready=ProductPage.ready_selector)
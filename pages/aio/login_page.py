@@ -0,0 +1,29 @@
+from playwright.async_api import Page
+from pages.aio.base_page import AsyncBasePage, mirror_of
+from pages.login_page import LoginPage
+
+@mirror_of(LoginPage)
+class AsyncLoginPage(AsyncBasePage):
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = self.url_for("account/login")
+
+    # ==========================================
+    # Actions - Login
+    # ==========================================
+    async def navigate_to_login(self) -> None:
+        await self.navigate(self.url)
+
+    async def login(self, login_name: str, password: str) -> None:
+        await self.login_name_input.fill(login_name)
+        await self.password_input.fill(password)
+        await self.perform_and_wait(self.login_button.click, "login")
+
+    async def logout(self) -> None:
+        await self.navigate(self.url_for("account/logout"), ready=self.logout_heading)
+
+    # ==========================================
+    # Assertions
+    # ==========================================
+    async def assert_login_successful(self) -> None:
+        await self.assert_element_visible(self.success_message)
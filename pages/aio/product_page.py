@@ -0,0 +1,32 @@
+from playwright.async_api import Page
+from pages.aio.base_page import AsyncBasePage, mirror_of
+from pages.aio.header_component import AsyncHeaderComponent
+from pages.product_page import ProductPage
+
+@mirror_of(ProductPage)
+class AsyncProductPage(AsyncBasePage):
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.header = AsyncHeaderComponent(page)
+
+    #=====================================
+    # Actions
+    #=====================================
+    async def navigate_to_product(self, url: str) -> None:
+        await self.navigate(url)
+
+    async def set_quantity(self, quantity: int) -> None:
+        await self.quantity_input.fill(str(quantity))
+
+    async def add_to_cart(self) -> None:
+        previous_count = await self.header.get_cart_item_count_text()
+        await self.add_to_cart_button.click()
+        # Wait for the cart badge to pick up the new item
+        await self.header.wait_for_cart_count_change(previous_count)
+
+    async def add_to_cart_with_quantity(self, quantity: int) -> None:
+        await self.set_quantity(quantity)
+        await self.add_to_cart()
+
+    async def get_product_name(self) -> str:
+        return await self.get_text(self.product_name)
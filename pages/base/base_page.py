@@ -1,12 +1,117 @@
-from playwright.sync_api import Page, Locator, expect
-from typing import Optional
+from playwright.sync_api import Page, Locator, Response, expect, TimeoutError as PlaywrightTimeoutError
+from typing import Callable, Optional
+from functools import reduce
+from pages.base.readiness import ReadinessPolicy, NavigationTimings
+from pages.base.perf_budgets import PerfBudgets
+from pages.base.perf_metrics import PerfCollector
+from pages.base.selectors import CandidateRanking, LocatorCounter, exact_name_pattern
+from pages.base.timeline import instrument
+from pages.base.trace_buffer import TraceRingBuffer
+import os
+import time
+
+# Reads a declared set of fields in the browser, see BasePage.snapshot
+SNAPSHOT_SCRIPT = """
+(fields) => {
+    const isVisible = (el) => getComputedStyle(el).visibility !== "hidden" && el.getClientRects().length > 0;
+    const text = (el) => el.innerText.trim();
+    const read = (root, spec) => Object.fromEntries(Object.entries(spec).map(([name, [selector, kind]]) => {
+        const els = selector === ":scope" ? [root] : Array.from(root.querySelectorAll(selector));
+        if (typeof kind === "object") return [name, els.map((el) => read(el, kind))];
+        switch (kind) {
+            case "visible": return [name, els.some(isVisible)];
+            case "count": return [name, els.length];
+            case "text": return [name, els.length ? text(els[0]) : null];
+            case "texts": return [name, els.map(text)];
+            case "visible_texts": return [name, els.filter(isVisible).map(text)];
+            case "value": return [name, els.length ? els[0].value : null];
+            default: throw new Error(`Unknown snapshot field kind '${kind}' for '${name}'`);
+        }
+    }));
+    return read(document, fields);
+}
+"""
 
 class BasePage:
+    # Shared by every page object, configured from conftest (--wait-until / --readiness)
+    readiness = ReadinessPolicy()
+    # Store origin every route resolves against, configured from conftest (--base-url / BASE_URL / --local-store)
+    base_url = os.getenv("BASE_URL", "https://automationteststore.com/")
+    navigation_timings = NavigationTimings()
+    # Locators built by page objects, reported per test with --locator-stats
+    locator_counter = LocatorCounter()
+    # Which first_of() candidate usually wins, persisted from conftest so the winner is checked first
+    candidate_ranking = CandidateRanking()
+    # Browser performance entries read after every navigate(), set from conftest with --perf-metrics
+    perf_collector: Optional[PerfCollector] = None
+    # Budgets of @budgeted actions, loaded from perf_budgets.json in conftest (--perf-budgets)
+    perf_budgets = PerfBudgets()
+    # Trace of the running test, cut into one chunk per page (--trace-on-failure)
+    trace_buffer: Optional[TraceRingBuffer] = None
+
+    # Page-specific element that is visible once the page is usable
+    ready_selector: Optional[str] = None
+
     def __init__(self, page: Page):
         self.page = page
 
-    def navigate(self, url: str) -> None:
-        self.page.goto(url, wait_until="networkidle")
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every public page object method shows up as a span in the step timeline
+        instrument(cls)
+
+    def url_for(self, route: str = "") -> str:
+        """Absolute URL of a store route (e.g. 'account/login') on the configured origin, home if empty"""
+        origin = self.base_url.rstrip("/")
+        if not route:
+            return f"{origin}/"
+        return f"{origin}/index.php?rt={route}"
+
+    def navigate(self, url: str, ready: str | Locator | None = None) -> None:
+        """Go to url and wait for ready (defaults to this page's ready_selector)"""
+        if self.trace_buffer:
+            self.trace_buffer.checkpoint()
+        start = time.perf_counter()
+        self.page.goto(url, wait_until=self.readiness.wait_until_for(type(self).__name__, "navigate"))
+        self.wait_until_ready(ready)
+        self.navigation_timings.record(f"{type(self).__name__}.navigate", time.perf_counter() - start)
+        if self.perf_collector:
+            self.perf_collector.collect(self.page)
+
+    # ======================
+    # Readiness Methods
+    # ======================
+    def wait_until_ready(self, ready: str | Locator | None = None, timeout: int = 30000) -> None:
+        """Wait for the given ready element, or the page default one when none is given"""
+        ready = ready or self.ready_selector
+        if ready:
+            self.wait_for_element(ready, timeout=timeout)
+
+    def wait_for_ready_state(self, action: Optional[str] = None) -> None:
+        """Wait for the load state the readiness policy asks for on this page/action"""
+        state = self.readiness.wait_until_for(type(self).__name__, action)
+        if state != "commit":
+            self.page.wait_for_load_state(state=state)
+
+    def perform_and_wait(self, action: Callable[[], None], name: str,
+                         ready: str | Locator | None = None, response: Optional[str] = None) -> None:
+        """Run a page-changing action and wait only as long as the readiness policy requires.
+
+        With response set, waits for that named response instead of a full navigation.
+        With ready set, also waits for that element of the destination page.
+        """
+        if self.trace_buffer:
+            self.trace_buffer.checkpoint()
+        start = time.perf_counter()
+        if response:
+            self.wait_for_response(response, action)
+            self.wait_for_ready_state(name)
+        else:
+            with self.page.expect_navigation(wait_until=self.readiness.wait_until_for(type(self).__name__, name)):
+                action()
+        if ready:
+            self.wait_for_element(ready)
+        self.navigation_timings.record(f"{type(self).__name__}.{name}", time.perf_counter() - start)
     
     # ======================
     # Interaction Methods
@@ -87,6 +192,72 @@ class BasePage:
     def wait_for_load_state(self, state: str = "networkidle") -> None:
         self.page.wait_for_load_state(state=state)
 
+    # ======================
+    # Event-driven Wait Methods
+    # ======================
+    def wait_for_response(self, url_pattern: str, action: Callable[[], None], timeout: int = 30000) -> Response:
+        """Run the action and wait for the response whose URL contains url_pattern"""
+        with self.page.expect_response(lambda response: url_pattern in response.url, timeout=timeout) as response_info:
+            action()
+        return response_info.value
+
+    def wait_for_text_change(self, locator: str | Locator, previous_text: str, timeout: int = 30000) -> None:
+        """Wait until the element text differs from previous_text (survives page navigations)"""
+        if isinstance(locator, str):
+            locator = self.page.locator(locator)
+
+        expect(locator).not_to_have_text(previous_text, timeout=timeout)
+
+    def wait_for_select_option(self, locator: str | Locator, label: str, timeout: int = 30000) -> None:
+        """Wait until a <select> has been populated with an option matching label"""
+        if isinstance(locator, str):
+            locator = self.page.locator(locator)
+
+        locator.locator("option", has_text=label).first.wait_for(state="attached", timeout=timeout)
+
+    # ======================
+    # Parameterized Locators
+    # ======================
+    def link_by_exact_name(self, name: str) -> Locator:
+        """Link whose accessible name is exactly name, ignoring case (regex compiled once per name)"""
+        self.locator_counter.record(f"{type(self).__name__}.link_by_exact_name")
+        return self.page.get_by_role("link", name=exact_name_pattern(name))
+
+    def first_of(self, name: str, candidates: list[str], timeout: int = 5000) -> Optional[Locator]:
+        """
+        Visible element of the best candidate selector, None if none shows up within timeout.
+
+        All candidates are raced in a single wait through locator.or_(), then the winner
+        is picked in learned order (usual winner first) and recorded for the next lookup.
+        """
+        key = f"{type(self).__name__}.{name}"
+        ordered = self.candidate_ranking.order(key, candidates)
+        self.locator_counter.record(f"{key}.first_of")
+        visible = [self.page.locator(candidate).locator("visible=true") for candidate in ordered]
+        try:
+            reduce(Locator.or_, visible).first.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+
+        for candidate, locator in zip(ordered, visible):
+            if locator.count():
+                self.candidate_ranking.record(key, candidate)
+                return locator.first
+        return None
+
+    # ======================
+    # Batched DOM reads
+    # ======================
+    def snapshot(self, fields: dict) -> dict:
+        """
+        Read several fields in a single page.evaluate round-trip instead of one call per locator.
+
+        fields maps a name to (css_selector, kind). kind is one of "visible", "count", "text",
+        "texts", "visible_texts", "value", or a nested fields dict read inside every matched
+        element (table rows). Selectors are plain CSS, ":scope" is the element itself.
+        """
+        return self.page.evaluate(SNAPSHOT_SCRIPT, fields)
+
     # ======================
     # Verification Methods
     # ======================
@@ -150,3 +321,7 @@ class BasePage:
 
         locator.scroll_into_view_if_needed()
     
+
+
+# BasePage's own methods (navigation, waits, assertions) are timed too
+instrument(BasePage)
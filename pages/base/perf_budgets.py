@@ -0,0 +1,114 @@
+"""
+Performance budgets for key page object actions, read from the versioned perf_budgets.json
+"""
+
+import functools
+import json
+import time
+import warnings
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+from playwright.sync_api import Page, Request, Error as PlaywrightError
+
+BUDGET_MODES = ("off", "warn", "fail")
+# What a budget can limit, as measured over one action
+BUDGET_METRICS = ("time_to_ready_ms", "requests", "transfer_kb")
+
+# Bytes over the wire of the given requests, from the page's Resource Timing entries.
+# Each URL counts as many times as it was requested, from its latest entries; transferSize
+# is 0 for cached responses and for cross-origin ones without Timing-Allow-Origin.
+TRANSFER_SCRIPT = """
+(counts) => {
+    const entries = [...performance.getEntriesByType("navigation"), ...performance.getEntriesByType("resource")];
+    let bytes = 0;
+    for (const [url, count] of Object.entries(counts)) {
+        const sizes = entries.filter(entry => entry.name === url).map(entry => entry.transferSize || 0);
+        bytes += sizes.slice(-count).reduce((total, size) => total + size, 0);
+    }
+    return bytes;
+}
+"""
+
+
+class PerfBudgetWarning(UserWarning):
+    """An action went over its budget while budgets only warn"""
+
+
+class PerfBudgets:
+    """
+    Budgets keyed by "PageClass.method", checked around every @budgeted call.
+
+    Time to ready is the duration of the action (it returns once the page is
+    ready), requests and transfer size cover the requests that finished meanwhile.
+    Sizes come from one page.evaluate over Resource Timing rather than one
+    request.sizes() driver call per request.
+    """
+
+    def __init__(self, path: str | Path | None = None, mode: str = "off"):
+        if mode not in BUDGET_MODES:
+            raise ValueError(f"Unknown performance budget mode '{mode}', expected one of {', '.join(BUDGET_MODES)}")
+        self.mode = mode
+        self.version = None
+        self.budgets: dict[str, dict[str, float]] = {}
+        if path and Path(path).exists():
+            data = json.loads(Path(path).read_text())
+            self.version = data["version"]
+            self.budgets = data["budgets"]
+        for key, budget in self.budgets.items():
+            unknown = set(budget) - set(BUDGET_METRICS)
+            if unknown:
+                raise ValueError(f"Unknown budget metric(s) {', '.join(sorted(unknown))} for {key}")
+
+    @contextmanager
+    def measure(self, page: Page, key: str):
+        budget = self.budgets.get(key)
+        if self.mode == "off" or not budget:
+            yield
+            return
+        finished: list[Request] = []
+        page.on("requestfinished", finished.append)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            page.remove_listener("requestfinished", finished.append)
+        # Only actions that completed are judged, a failing one already fails the test
+        self.enforce(key, {
+            "time_to_ready_ms": (time.perf_counter() - start) * 1000,
+            "requests": len(finished),
+            "transfer_kb": self._transfer_bytes(page, finished) / 1024,
+        })
+
+    @staticmethod
+    def _transfer_bytes(page: Page, requests: list[Request]) -> int:
+        counts = Counter(request.url for request in requests)
+        if not counts:
+            return 0
+        try:
+            return page.evaluate(TRANSFER_SCRIPT, dict(counts))
+        except PlaywrightError:
+            return 0
+
+    def enforce(self, key: str, measured: dict[str, float]) -> None:
+        over = [
+            f"{metric}={measured[metric]:.0f} (budget {limit})"
+            for metric, limit in self.budgets[key].items()
+            if measured[metric] > limit
+        ]
+        if not over:
+            return
+        message = f"❌ {key} over its performance budget (v{self.version}): {', '.join(over)}"
+        if self.mode == "fail":
+            raise AssertionError(message)
+        warnings.warn(PerfBudgetWarning(message))
+
+
+def budgeted(func):
+    """Check the action against its "PageClass.method" budget, if the budgets file declares one"""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self.perf_budgets.measure(self.page, f"{type(self).__name__}.{func.__name__}"):
+            return func(self, *args, **kwargs)
+    return wrapper
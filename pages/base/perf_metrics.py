@@ -0,0 +1,136 @@
+"""
+Front-end performance of the store pages: Navigation Timing, paint/LCP and resource entries per route
+"""
+
+import json
+import math
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from playwright.sync_api import Page, Error as PlaywrightError
+
+# Read in the page right after a page object navigation. LCP is only exposed to
+# PerformanceObserver (buffered entries arrive in a task), Chromium only: null elsewhere.
+PERF_SCRIPT = """
+async () => {
+    const [nav] = performance.getEntriesByType("navigation");
+    const paints = Object.fromEntries(performance.getEntriesByType("paint").map((e) => [e.name, e.startTime]));
+    const lcp = await new Promise((resolve) => {
+        let last = null;
+        try {
+            const observer = new PerformanceObserver((list) => {
+                const entries = list.getEntries();
+                last = entries[entries.length - 1].startTime;
+            });
+            observer.observe({ type: "largest-contentful-paint", buffered: true });
+            setTimeout(() => { observer.disconnect(); resolve(last); }, 20);
+        } catch (e) {
+            resolve(null);
+        }
+    });
+    const resources = performance.getEntriesByType("resource");
+    const byType = {};
+    for (const r of resources) byType[r.initiatorType] = (byType[r.initiatorType] || 0) + 1;
+    // 0 means "not reached yet" (e.g. load when navigations only wait for domcontentloaded)
+    const reached = (value) => (value > 0 ? value : null);
+    return {
+        ttfb: nav ? reached(nav.responseStart) : null,
+        dom_content_loaded: nav ? reached(nav.domContentLoadedEventEnd) : null,
+        load: nav ? reached(nav.loadEventEnd) : null,
+        first_contentful_paint: paints["first-contentful-paint"] ?? null,
+        largest_contentful_paint: lcp,
+        resource_count: resources.length,
+        transfer_kb: ((nav ? nav.transferSize : 0) + resources.reduce((sum, r) => sum + r.transferSize, 0)) / 1024,
+        resources_by_type: byType,
+    };
+}
+"""
+
+# Metrics summarised per route, times in ms
+METRICS = (
+    "ttfb",
+    "dom_content_loaded",
+    "load",
+    "first_contentful_paint",
+    "largest_contentful_paint",
+    "resource_count",
+    "transfer_kb",
+)
+PERCENTILES = (50, 90, 95)
+
+
+def route_of(url: str) -> str:
+    """Store route of a URL: the rt query parameter, 'home' for the front page"""
+    parts = urlsplit(url)
+    route = parse_qs(parts.query).get("rt")
+    if route:
+        return route[0]
+    return "home" if parts.path in ("", "/", "/index.php") else parts.path.lstrip("/")
+
+
+def percentile(values: list[float], p: int) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+class PerfCollector:
+    """Samples of the running test, one per BasePage.navigate"""
+
+    def __init__(self):
+        self.pending: list[dict] = []
+
+    def collect(self, page: Page) -> None:
+        try:
+            sample = page.evaluate(PERF_SCRIPT)
+        except PlaywrightError:
+            # The page moved on (redirect, closed...), the measurement is lost but the test is not
+            return
+        sample["route"] = route_of(page.url)
+        self.pending.append(sample)
+
+    def drain(self) -> list[dict]:
+        samples, self.pending = self.pending, []
+        return samples
+
+
+class PerfMetrics:
+    """Samples of the whole run grouped by route"""
+
+    def __init__(self):
+        self.samples: dict[str, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+
+    def add(self, sample: dict) -> None:
+        for metric in METRICS:
+            if sample.get(metric) is not None:
+                self.samples[sample["route"]][metric].append(sample[metric])
+
+    def percentiles(self) -> dict[str, dict]:
+        """{route: {"n": samples, metric: {"p50": .., "p90": .., "p95": ..}}}"""
+        return {
+            route: {
+                "n": max(len(values) for values in metrics.values()),
+                **{
+                    metric: {f"p{p}": round(percentile(values, p), 1) for p in PERCENTILES}
+                    for metric, values in metrics.items()
+                },
+            }
+            for route, metrics in sorted(self.samples.items())
+        }
+
+    def summary(self) -> list[str]:
+        """One line per route and metric"""
+        lines = []
+        for route, stats in self.percentiles().items():
+            lines.append(f"{route}  (n={stats['n']})")
+            for metric in METRICS:
+                if metric in stats:
+                    values = "  ".join(f"{name}={value:9.1f}" for name, value in stats[metric].items())
+                    lines.append(f"    {metric:<26} {values}")
+        return lines
+
+    def write(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.percentiles(), indent=2))
@@ -0,0 +1,70 @@
+"""
+Readiness policy for navigations and page-changing actions
+"""
+
+from collections import defaultdict
+from statistics import mean
+from typing import Optional
+
+# Values accepted by page.goto(wait_until=...) / page.expect_navigation(wait_until=...)
+LOAD_STATES = ("commit", "domcontentloaded", "load", "networkidle")
+
+
+class ReadinessPolicy:
+    """Decide which load state a page object waits for after a navigation or action"""
+
+    def __init__(self, wait_until: str = "domcontentloaded", overrides: Optional[dict[str, str]] = None):
+        self.wait_until = self._validate(wait_until)
+        # Keys are "PageClass" or "PageClass.action"
+        self.overrides = {key: self._validate(state) for key, state in (overrides or {}).items()}
+
+    @staticmethod
+    def _validate(state: str) -> str:
+        if state not in LOAD_STATES:
+            raise ValueError(f"Unknown load state '{state}', expected one of {LOAD_STATES}")
+        return state
+
+    @staticmethod
+    def parse_overrides(entries: list[str]) -> dict[str, str]:
+        """Parse ["HomePage=load", "CartPage.update_qty=networkidle"] into an overrides dict"""
+        overrides = {}
+        for entry in entries:
+            for item in entry.split(","):
+                if not item.strip():
+                    continue
+                key, _, state = item.partition("=")
+                overrides[key.strip()] = state.strip()
+        return overrides
+
+    def wait_until_for(self, page_name: str, action: Optional[str] = None) -> str:
+        """Most specific setting wins: page+action, then page, then the global default"""
+        if action and f"{page_name}.{action}" in self.overrides:
+            return self.overrides[f"{page_name}.{action}"]
+        return self.overrides.get(page_name, self.wait_until)
+
+
+class NavigationTimings:
+    """Navigation latency samples collected per page/action during the run"""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+
+    def record(self, key: str, seconds: float) -> None:
+        self.samples[key].append(seconds)
+
+    def drain(self) -> dict[str, list[float]]:
+        """Samples recorded since the last drain, handed to the test's report"""
+        samples, self.samples = dict(self.samples), defaultdict(list)
+        return samples
+
+    def merge(self, samples: dict[str, list[float]]) -> None:
+        for key, values in samples.items():
+            self.samples[key].extend(values)
+
+    def summary(self) -> list[str]:
+        """One line per page/action, slowest average first"""
+        rows = sorted(self.samples.items(), key=lambda item: mean(item[1]), reverse=True)
+        return [
+            f"{key:<45} n={len(values):<4} avg={mean(values) * 1000:8.1f} ms  max={max(values) * 1000:8.1f} ms"
+            for key, values in rows
+        ]
@@ -0,0 +1,122 @@
+"""
+Declarative selectors: one registry per page class, locators built once per page object
+"""
+
+import json
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+from filelock import FileLock
+
+
+class LocatorCounter:
+    """How many locators page objects constructed, per test and per selector"""
+
+    def __init__(self):
+        # Built since the last drain, in the process running the test
+        self.current = Counter()
+        # Totals of the run, from the tests' reports
+        self.per_test: dict[str, int] = {}
+        self.per_selector = Counter()
+
+    def record(self, key: str) -> None:
+        self.current[key] += 1
+
+    def drain(self) -> dict[str, int]:
+        """Locators built by the test that just ran, per selector, handed to its report"""
+        current, self.current = dict(self.current), Counter()
+        return current
+
+    def add(self, test_id: str, per_selector: dict[str, int]) -> None:
+        """Count of a finished test (tests that built none are not listed)"""
+        if per_selector:
+            self.per_test[test_id] = sum(per_selector.values())
+            self.per_selector.update(per_selector)
+
+    def summary(self, top: int = 10) -> list[str]:
+        tests = sorted(self.per_test.items(), key=lambda item: item[1], reverse=True)[:top]
+        return (
+            [f"{count:>5}  {test_id}" for test_id, count in tests]
+            + ["most built:"]
+            + [f"{count:>5}  {key}" for key, count in self.per_selector.most_common(top)]
+        )
+
+
+class Selector:
+    """
+    Class-level selector of a page object.
+
+    The selector string is registered in the class's `selectors` dict (inherited
+    registries are copied, not shared). On first access through a page object the
+    Locator is built and stored on the instance, so later accesses are plain
+    attribute reads.
+    """
+
+    def __init__(self, selector: str, has_text: str | None = None, first: bool = False):
+        self.selector = selector
+        self.has_text = has_text
+        self.first = first
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+        if "selectors" not in owner.__dict__:
+            owner.selectors = dict(getattr(owner, "selectors", {}))
+        owner.selectors[name] = self.selector
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        locator = instance.page.locator(self.selector, has_text=self.has_text)
+        if self.first:
+            locator = locator.first
+        instance.locator_counter.record(f"{type(instance).__name__}.{self.name}")
+        # Shadows this (non-data) descriptor on the instance, the next access does not come back here
+        instance.__dict__[self.name] = locator
+        return locator
+
+
+@lru_cache(maxsize=256)
+def exact_name_pattern(name: str) -> re.Pattern:
+    """Case-insensitive whole-name regex, compiled once per name"""
+    return re.compile(f"^{re.escape(name)}$", re.IGNORECASE)
+
+
+class CandidateRanking:
+    """
+    How often each candidate selector won a first-of lookup, per page/action.
+
+    The usual winner is checked first on the next lookup. Counts are persisted
+    to path; save() merges this process's new wins into the file under a lock,
+    so xdist workers add up instead of overwriting each other.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else None
+        self.wins: dict[str, Counter] = defaultdict(Counter)
+        self._new: dict[str, Counter] = defaultdict(Counter)
+        if self.path and self.path.exists():
+            for key, counts in json.loads(self.path.read_text()).items():
+                self.wins[key].update(counts)
+
+    def order(self, key: str, candidates: list[str]) -> list[str]:
+        """Candidates by past wins, ties keep the declared order"""
+        return sorted(candidates, key=lambda candidate: -self.wins[key][candidate])
+
+    def record(self, key: str, winner: str) -> None:
+        self.wins[key][winner] += 1
+        self._new[key][winner] += 1
+
+    def save(self) -> None:
+        if not self.path or not self._new:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with FileLock(f"{self.path}.lock"):
+            stored = json.loads(self.path.read_text()) if self.path.exists() else {}
+            for key, counts in self._new.items():
+                merged = Counter(stored.get(key, {}))
+                merged.update(counts)
+                stored[key] = dict(merged)
+            self.path.write_text(json.dumps(stored, indent=2, sort_keys=True))
+        self._new.clear()
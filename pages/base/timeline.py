@@ -0,0 +1,110 @@
+"""
+Per-test timeline of nested spans: Allure steps and every page object action
+"""
+
+import functools
+import inspect
+import json
+import re
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class StepTimeline:
+    """Spans of the running test, nested in the order they were opened"""
+
+    def __init__(self):
+        self.active = False
+        self.test_id = ""
+        self.spans: list[dict] = []
+        self._stack: list[dict] = []
+        self._started = 0.0
+
+    def start(self, test_id: str) -> None:
+        self.test_id = test_id
+        self.spans = []
+        self._stack = []
+        self._started = time.perf_counter()
+        self.active = True
+
+    def begin(self, kind: str, name: str) -> dict:
+        span = {
+            "kind": kind,
+            "name": name,
+            "depth": len(self._stack),
+            "start": round(time.perf_counter() - self._started, 4),
+            "duration": None,
+        }
+        self.spans.append(span)
+        self._stack.append(span)
+        return span
+
+    def end(self, span: dict, error: str | None = None) -> None:
+        span["duration"] = round(time.perf_counter() - self._started - span["start"], 4)
+        if error:
+            span["error"] = error
+        # Spans left open inside this one (an exception skipped their end) close with it
+        while self._stack and self._stack.pop() is not span:
+            pass
+
+    @contextmanager
+    def span(self, kind: str, name: str):
+        span = self.begin(kind, name)
+        try:
+            yield span
+        except BaseException as e:
+            self.end(span, error=type(e).__name__)
+            raise
+        self.end(span)
+
+    def stop(self) -> dict:
+        """Close the test and return its timeline"""
+        self.active = False
+        for span in reversed(self._stack):
+            self.end(span)
+        return {
+            "test": self.test_id,
+            "duration": round(time.perf_counter() - self._started, 4),
+            "spans": self.spans,
+        }
+
+    @staticmethod
+    def breakdown(timeline: dict) -> str:
+        """Indented span tree with durations, for humans"""
+        lines = [f"{timeline['duration'] * 1000:9.1f} ms  total  {timeline['test']}"]
+        for span in timeline["spans"]:
+            duration = span["duration"] or 0.0
+            error = f"  [{span['error']}]" if "error" in span else ""
+            lines.append(f"{duration * 1000:9.1f} ms  {'  ' * span['depth']}{span['kind']}: {span['name']}{error}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def write(timeline: dict, directory: str | Path) -> Path:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / (re.sub(r"[^\w.-]+", "_", timeline["test"]).strip("_") + ".json")
+        path.write_text(json.dumps(timeline, indent=2))
+        return path
+
+
+# Timeline shared by every page object and the Allure step listener
+timeline = StepTimeline()
+
+
+def timed(func):
+    """Record the call as an action span of the running test (pass-through when no test is timed)"""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not timeline.active:
+            return func(self, *args, **kwargs)
+        with timeline.span("action", f"{type(self).__name__}.{func.__name__}"):
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+def instrument(cls) -> None:
+    """Wrap every public method defined on cls (not inherited ones, those are wrapped on their own class)"""
+    for name, attr in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.isfunction(attr):
+            setattr(cls, name, timed(attr))
@@ -0,0 +1,66 @@
+"""
+Lightweight Playwright tracing kept as a ring of the last chunks, written out only when the test failed
+"""
+
+import re
+import shutil
+import tempfile
+from collections import deque
+from pathlib import Path
+
+from playwright.sync_api import BrowserContext
+
+
+class TraceRingBuffer:
+    """
+    DOM snapshots only (no screenshots, no sources), cut into one chunk per page.
+
+    Page objects call checkpoint() before every navigation, so a chunk holds
+    the navigation and everything done on the page it led to. Only the last
+    `size` chunks are kept on disk; older ones are deleted as new ones close.
+    """
+
+    def __init__(self, context: BrowserContext, size: int = 3):
+        self.context = context
+        self.size = size
+        self.chunks: deque[Path] = deque()
+        self._directory = Path(tempfile.mkdtemp(prefix="trace-ring-"))
+        self._counter = 0
+
+    def start(self, title: str) -> None:
+        # start() opens the first chunk
+        self.context.tracing.start(title=title, snapshots=True, screenshots=False, sources=False)
+
+    def _close_chunk(self) -> None:
+        self._counter += 1
+        path = self._directory / f"{self._counter:03}.zip"
+        self.context.tracing.stop_chunk(path=path)
+        self.chunks.append(path)
+
+    def checkpoint(self) -> None:
+        """Close the current chunk into the ring and open the next one"""
+        self._close_chunk()
+        # The open chunk counts as one of the `size` kept
+        while len(self.chunks) > self.size - 1:
+            self.chunks.popleft().unlink(missing_ok=True)
+        self.context.tracing.start_chunk()
+
+    def finish(self, keep_to: str | Path | None = None) -> list[Path]:
+        """Stop tracing; with keep_to, move the buffered chunks plus the open one there (oldest first)"""
+        kept = []
+        if keep_to:
+            self._close_chunk()
+            keep_to = Path(keep_to)
+            keep_to.mkdir(parents=True, exist_ok=True)
+            for index, chunk in enumerate(self.chunks, start=1):
+                kept.append(Path(shutil.move(chunk, keep_to / f"trace-{index:02}.zip")))
+        else:
+            # Closing without a path throws the chunk away without writing it
+            self.context.tracing.stop_chunk()
+        self.context.tracing.stop()
+        shutil.rmtree(self._directory, ignore_errors=True)
+        return kept
+
+    @staticmethod
+    def directory_for(root: str | Path, test_id: str) -> Path:
+        return Path(root) / re.sub(r"[^\w.-]+", "_", test_id).strip("_")
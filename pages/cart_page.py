@@ -1,14 +1,70 @@
+from dataclasses import dataclass
 from playwright.sync_api import Page, Locator
 from pages.base.base_page import BasePage
+from pages.base.perf_budgets import budgeted
+from pages.base.selectors import Selector
 from pages.components.header_component import HeaderComponent
 from pages.components.footer_component import FooterComponent
 
+
+@dataclass
+class CartRow:
+    name: str
+    quantity: int
+    # Every cell text of the row (name, model, prices...), as displayed
+    cells: list[str]
+
+    def matches(self, product_name: str) -> bool:
+        return product_name.lower() in " ".join(self.cells).lower()
+
+
+@dataclass
+class CartSnapshot:
+    """Cart page state read in one round-trip, see CartPage.get_cart_snapshot"""
+    empty: bool
+    rows: list[CartRow]
+    # Totals table as label -> displayed amount, e.g. {"Total": "$38.00"}
+    totals: dict[str, str]
+
+    @classmethod
+    def from_state(cls, state: dict) -> "CartSnapshot":
+        """Build from the snapshot() result of CartPage._cart_fields()"""
+        # Product rows are the ones with a quantity input, the totals table shares the row selector
+        rows = [
+            CartRow(
+                name=next((name for name in row["names"] if name), ""),
+                quantity=int(row["quantity"]) if row["quantity"].strip().isdigit() else 0,
+                cells=row["cells"],
+            )
+            for row in state["rows"] if row["quantity"] is not None
+        ]
+        totals = {
+            row["cells"][0].rstrip(":"): row["cells"][-1]
+            for row in state["totals"] if len(row["cells"]) >= 2
+        }
+        empty = "shopping cart is empty" in (state["content"] or "").lower()
+        return cls(empty=empty, rows=[] if empty else rows, totals=totals)
+
+    @property
+    def item_count(self) -> int:
+        return len(self.rows)
+
+    def row(self, product_name: str) -> CartRow | None:
+        return next((row for row in self.rows if row.matches(product_name)), None)
+
+    def quantity_for(self, product_name: str) -> int:
+        row = self.row(product_name)
+        return row.quantity if row else 0
+
+
 class CartPage(BasePage):
+    ready_selector = "div.contentpanel"
+
     def __init__(self, page: Page):
         super().__init__(page)
     
         # Cart URL
-        self.url = "https://automationteststore.com/index.php?rt=checkout/cart"
+        self.url = self.url_for("checkout/cart")
 
         # Reusable components
         self.header = HeaderComponent(page)
@@ -18,17 +74,9 @@ class CartPage(BasePage):
     # Locators - Cart Structure
     #=====================================
 
-    @property
-    def cart_table(self):
-        return self.page.locator("table.table-striped")
-    
-    @property
-    def cart_items(self):
-        return self.page.locator("table.table-striped tbody tr")
-    
-    @property
-    def empty_cart_message(self):
-        return self.page.locator("div.contentpanel:has-text('shopping cart is empty')")
+    cart_table = Selector("table.table-striped")
+    cart_items = Selector("table.table-striped tbody tr")
+    empty_cart_message = Selector("div.contentpanel:has-text('shopping cart is empty')")
     
     #=====================================
     # Locators - Product elements on cart
@@ -46,24 +94,17 @@ class CartPage(BasePage):
         # Remove often via a trash icon 
         return row.locator("a[href*='remove'], a:has(i.fa-trash)").first
 
-    @property
-    def get_update_button(self):
-        """This button updates the shopping cart after you change a qty"""
-        return self.page.locator("button#cart-update")
+    # This button updates the shopping cart after you change a qty
+    get_update_button = Selector("button#cart-update")
     
     #=====================================
     # Locators - Checkout & Continue
     #=====================================
 
-    @property
-    def checkout_button(self):
-        # Use the checkout link in the header menu with valid href
-        # This one goes to checkout/shipping
-        return self.page.locator("a.menu_checkout").first
-
-    @property
-    def continue_shopping_button(self):
-        return self.page.locator("a:has-text('Continue Shopping')").first
+    # Use the checkout link in the header menu with valid href
+    # This one goes to checkout/shipping
+    checkout_button = Selector("a.menu_checkout", first=True)
+    continue_shopping_button = Selector("a:has-text('Continue Shopping')", first=True)
     
     #=====================================
     # Actions - Navigation
@@ -71,12 +112,12 @@ class CartPage(BasePage):
 
     def navigate_to_cart(self) -> None:
         self.navigate(self.url)
-        self.wait_for_load_state("networkidle")
     
     #=====================================
     # Actions - Cart Management
     #=====================================
 
+    @budgeted
     def update_qty(self, product_name: str, new_qty: int) -> None:
         # Getting the row for the product
         row = self.get_product_row_by_name(product_name)
@@ -87,56 +128,62 @@ class CartPage(BasePage):
         # Clear and write a new qty
         qty_input.fill(str(new_qty))
 
-        # Try to click update button if it exists
-        try:
-            update_btn = self.get_update_button
-            if update_btn.is_visible(timeout=3000):
-                update_btn.click()
-            else:
-                # If no update button, press Enter on the input field
+        def submit_update() -> None:
+            # Try to click update button if it exists
+            try:
+                update_btn = self.get_update_button
+                if update_btn.is_visible(timeout=3000):
+                    update_btn.click()
+                else:
+                    # If no update button, press Enter on the input field
+                    qty_input.press("Enter")
+            except:
+                # If button doesn't exist or timeout, press Enter on the input field
                 qty_input.press("Enter")
-        except:
-            # If button doesn't exist or timeout, press Enter on the input field
-            qty_input.press("Enter")
         
-        # Wait for update
-        self.wait_for_load_state("networkidle")
+        # Wait for the cart to be reloaded with the new qty
+        self.perform_and_wait(submit_update, "update_qty", ready=self.ready_selector)
     
     def remove_product(self, product_name: str) -> None:
         # Getting the row for the product
         row = self.get_product_row_by_name(product_name)
         
         remove_button = self.remove_button_in_row(row)
-        remove_button.click()
-
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(remove_button.click, "remove_product", ready=self.ready_selector)
     
     def proceed_to_checkout(self) -> None:
         """Navigate to checkout by going to the shipping page"""
         # Navigate directly to shipping/checkout
-        self.navigate("https://automationteststore.com/index.php?rt=checkout/shipping")
-        self.wait_for_load_state("networkidle")
+        self.navigate(self.url_for("checkout/shipping"))
     
     def continue_shopping(self) -> None:
-        self.continue_shopping_button.click()
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(self.continue_shopping_button.click, "continue_shopping")
     
     #=====================================
     # Actions - Obtaining info
     #=====================================
     
+    def _cart_fields(self) -> dict:
+        return {
+            "content": ("div.contentpanel", "text"),
+            "rows": (self.selectors["cart_items"], {
+                "names": ("a[href*='product_id']", "texts"),
+                "quantity": ("input[type='text'][name*='quantity']", "value"),
+                "cells": ("td", "texts"),
+            }),
+            "totals": ("#totals_table tr", {"cells": ("td", "texts")}),
+        }
+
+    def get_cart_snapshot(self) -> CartSnapshot:
+        """Rows, quantities and totals of the cart in a single round-trip"""
+        return CartSnapshot.from_state(self.snapshot(self._cart_fields()))
+
     def get_cart_item_count(self) -> int:
         """Obtaining the count of unique items on the cart"""
-        if self.is_cart_empty():
-            return 0
-        # Count product rows
-        return self.cart_items.count()
+        return self.get_cart_snapshot().item_count
     
     def get_quantity_for_product(self, product_name: str) -> int:
-        row = self.get_product_row_by_name(product_name)
-        qty_input = self.qty_input_in_row(row)
-        qty_value = qty_input.input_value()
-        return int(qty_value) if qty_value else 0
+        return self.get_cart_snapshot().quantity_for(product_name)
     
     #=====================================
     # Verifications
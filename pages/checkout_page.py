@@ -1,14 +1,18 @@
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
 from pages.base.base_page import BasePage
+from pages.base.perf_budgets import budgeted
+from pages.base.selectors import Selector
 from pages.components.header_component import HeaderComponent
 from pages.components.footer_component import FooterComponent
 
 class CheckoutPage(BasePage):
+    ready_selector = "div.contentpanel"
+
     def __init__(self, page: Page):
         super().__init__(page)
         
         # Checkout URL
-        self.url = "https://automationteststore.com/index.php?rt=checkout/checkout"
+        self.url = self.url_for("checkout/checkout")
         
         # Reusable components
         self.header = HeaderComponent(page)
@@ -18,93 +22,63 @@ class CheckoutPage(BasePage):
     # Locators - Checkout Options
     #=====================================
     
-    @property
-    def guest_checkout_option(self):
-        """Radio button for guest checkout"""
-        return self.page.locator("input[name='account'][value='guest']")
-    
-    @property
-    def register_checkout_option(self):
-        """Radio button for register during checkout"""
-        return self.page.locator("input[name='account'][value='register']")
-    
-    @property
-    def login_checkout_option(self):
-        """Radio button for login during checkout"""
-        return self.page.locator("input[name='account'][value='login']")
+    # Radio button for guest checkout
+    guest_checkout_option = Selector("input[name='account'][value='guest']")
+    # Radio button for register during checkout
+    register_checkout_option = Selector("input[name='account'][value='register']")
+    # Radio button for login during checkout
+    login_checkout_option = Selector("input[name='account'][value='login']")
     
     #=====================================
     # Locators - Guest Checkout Form
     #=====================================
     
-    @property
-    def guest_email_input(self):
-        return self.page.locator("input#guestFrm_email")
-    
-    @property
-    def guest_firstname_input(self):
-        return self.page.locator("input#guestFrm_firstname")
-    
-    @property
-    def guest_lastname_input(self):
-        return self.page.locator("input#guestFrm_lastname")
-    
-    @property
-    def guest_address_input(self):
-        return self.page.locator("input#guestFrm_address_1")
-    
-    @property
-    def guest_city_input(self):
-        return self.page.locator("input#guestFrm_city")
-    
-    @property
-    def guest_zipcode_input(self):
-        return self.page.locator("input#guestFrm_postcode")
-    
-    @property
-    def guest_state_select(self):
-        return self.page.locator("select#guestFrm_zone_id")
-    
-    @property
-    def guest_country_select(self):
-        return self.page.locator("select#guestFrm_country_id")
-    
-    @property
-    def guest_phone_input(self):
-        return self.page.locator("input#guestFrm_telephone")
+    guest_email_input = Selector("input#guestFrm_email")
+    guest_firstname_input = Selector("input#guestFrm_firstname")
+    guest_lastname_input = Selector("input#guestFrm_lastname")
+    guest_address_input = Selector("input#guestFrm_address_1")
+    guest_city_input = Selector("input#guestFrm_city")
+    guest_zipcode_input = Selector("input#guestFrm_postcode")
+    guest_state_select = Selector("select#guestFrm_zone_id")
+    guest_country_select = Selector("select#guestFrm_country_id")
+    guest_phone_input = Selector("input#guestFrm_telephone")
     
     #=====================================
     # Locators - Login Form
     #=====================================
     
-    @property
-    def login_email_input(self):
-        return self.page.locator("input[name='login_name']")
-    
-    @property
-    def login_password_input(self):
-        return self.page.locator("input[name='password']")
-    
-    @property
-    def login_submit_button(self):
-        return self.page.locator("button:has-text('Login')")
+    login_email_input = Selector("input[name='login_name']")
+    login_password_input = Selector("input[name='password']")
+    login_submit_button = Selector("button:has-text('Login')")
     
     
     #=====================================
     # Locators - Confirmation
     #=====================================
     
-    @property
-    def confirm_order_button(self):
-        return self.page.locator("button:has-text('Confirm Order')")
+    confirm_order_button = Selector("button:has-text('Confirm Order')")
+    continue_button = Selector("button:has-text('Continue')")
+    order_confirmation_message = Selector("h1:has-text('Your Order Has Been Processed!')")
     
-    @property
-    def continue_button(self):
-        return self.page.locator("button:has-text('Continue')")
+    #=====================================
+    # Candidates - Continue buttons (raced by first_of, usual winner first)
+    #=====================================
     
-    @property
-    def order_confirmation_message(self):
-        return self.page.locator("h1:has-text('Your Order Has Been Processed!')")
+    account_continue_candidates = [
+        "button:has-text('Continue')",
+        "button:has-text('Checkout')",
+        "button[type='submit']",
+        "input[type='submit']",
+    ]
+    guest_form_continue_candidates = [
+        "button:has-text('Continue')",
+        "button:has-text('Next')",
+        "button:has-text('Checkout')",
+        "input[type='submit'][value*='Continue']",
+        "input[type='submit'][value*='Next']",
+        "button[type='submit']",
+        "input[type='submit']",
+    ]
     
     
     #=====================================
@@ -113,7 +87,6 @@ class CheckoutPage(BasePage):
     
     def navigate_to_checkout(self) -> None:
         self.navigate(self.url)
-        self.wait_for_load_state("networkidle")
     
     #=====================================
     # Actions - Guest Checkout
@@ -122,25 +95,12 @@ class CheckoutPage(BasePage):
     def select_guest_checkout(self) -> None:
         """Select guest checkout option and continue"""
         self.guest_checkout_option.click()
-        self.page.wait_for_timeout(500)
+        expect(self.guest_checkout_option).to_be_checked()
         
-        # After selecting guest, look for a continue/checkout button
-        # Try to find and click a button that proceeds with guest checkout
-        continue_buttons = [
-            self.page.locator("button:has-text('Continue')").first,
-            self.page.locator("button:has-text('Checkout')").first,
-            self.page.locator("button[type='submit']").first,
-            self.page.locator("input[type='submit']").first,
-        ]
-        
-        for button in continue_buttons:
-            try:
-                if button.is_visible():
-                    button.click()
-                    self.wait_for_load_state("networkidle")
-                    return
-            except:
-                pass
+        # After selecting guest, click the button that proceeds with guest checkout
+        button = self.first_of("select_guest_checkout", self.account_continue_candidates)
+        if button:
+            self.perform_and_wait(button.click, "select_guest_checkout")
     
     def fill_guest_information(self, email: str, firstname: str, lastname: str, 
                                address: str, city: str, zipcode: str, 
@@ -158,29 +118,14 @@ class CheckoutPage(BasePage):
         # Select country
         self.guest_country_select.select_option(country)
         
-        # Select state
+        # Select state once the zones for the country have been loaded
+        self.wait_for_select_option(self.guest_state_select, state)
         self.guest_state_select.select_option(state)
         
         # After filling guest info, click continue/checkout button to proceed to shipping/payment
-        self.page.wait_for_timeout(500)
-        continue_buttons = [
-            self.page.locator("button:has-text('Continue')").first,
-            self.page.locator("button:has-text('Next')").first,
-            self.page.locator("button:has-text('Checkout')").first,
-            self.page.locator("input[type='submit'][value*='Continue']").first,
-            self.page.locator("input[type='submit'][value*='Next']").first,
-            self.page.locator("button[type='submit']").first,
-            self.page.locator("input[type='submit']").first,
-        ]
-        
-        for button in continue_buttons:
-            try:
-                if button.is_visible(timeout=2000):
-                    button.click()
-                    self.wait_for_load_state("networkidle")
-                    return
-            except:
-                pass
+        button = self.first_of("fill_guest_information", self.guest_form_continue_candidates)
+        if button:
+            self.perform_and_wait(button.click, "fill_guest_information")
     
     #=====================================
     # Actions - Login Checkout
@@ -189,23 +134,21 @@ class CheckoutPage(BasePage):
     def select_login_checkout(self) -> None:
         """Select login checkout option"""
         self.login_checkout_option.click()
-        self.wait_for_load_state("networkidle")
     
     def login_during_checkout(self, email: str, password: str) -> None:
         """Login during checkout process"""
         self.login_email_input.fill(email)
         self.login_password_input.fill(password)
-        self.login_submit_button.click()
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(self.login_submit_button.click, "login_during_checkout")
     
     #=====================================
     # Actions - Order Confirmation
     #=====================================
     
+    @budgeted
     def confirm_order(self) -> None:
         """Click confirm order button"""
-        self.confirm_order_button.click()
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(self.confirm_order_button.click, "confirm_order")
     
     #=====================================
     # Verifications
@@ -233,6 +176,10 @@ class CheckoutPage(BasePage):
             except:
                 return url_check
     
+    def is_on_confirm_page(self) -> bool:
+        """Verify if the order is ready to be confirmed (logged-in users skip the account step)"""
+        return self.confirm_order_button.is_visible()
+    
     def is_order_confirmed(self) -> bool:
         """Verify if order was successfully confirmed"""
         return self.order_confirmation_message.is_visible()
@@ -256,5 +203,9 @@ class CheckoutPage(BasePage):
             print(f"DEBUG: Guest option visible: {self.guest_checkout_option.is_visible() if 'guest_checkout_option' in dir(self) else 'N/A'}")
             raise
     
+    def assert_on_confirm_page(self) -> None:
+        """Assert that the confirm order step is displayed"""
+        self.assert_element_visible(self.confirm_order_button)
+    
     def assert_order_confirmed(self) -> None:
         assert self.is_order_confirmed(), "Order confirmation message not visible."
\ No newline at end of file
@@ -1,5 +1,6 @@
 from playwright.sync_api import Page
 from pages.base.base_page import BasePage
+from pages.base.selectors import Selector
 
 class FooterComponent(BasePage):
     def __init__(self, page: Page):
@@ -9,64 +10,37 @@ class FooterComponent(BasePage):
     # Locators - Footer Links
     #==========================================    
 
-    @property
-    def about_us_link(self):
-        return self.page.locator("footer a:has-text('About Us')")
-    
-    @property
-    def contact_us_link(self):
-        return self.page.locator("footer a:has-text('Contact Us')")
-    
-    @property
-    def privacy_policy_link(self):
-        return self.page.locator("footer a:has-text('Privacy Policy')")
+    about_us_link = Selector("footer a:has-text('About Us')")
+    contact_us_link = Selector("footer a:has-text('Contact Us')")
+    privacy_policy_link = Selector("footer a:has-text('Privacy Policy')")
     
     #==========================================
     # Locators - Contact Form
     #==========================================
-    @property
-    def contact_firstname_input(self):
-        firstname = self.page.locator("input#ContactUsFrm_first_name")
-        return firstname
-    
-    @property
-    def contact_email_input(self):
-        return self.page.locator("input#ContactUsFrm_email")
-    
-    @property
-    def contact_enquiry_textarea(self):
-        return self.page.locator("textarea#ContactUsFrm_enquiry")
+    contact_firstname_input = Selector("input#ContactUsFrm_first_name")
+    contact_email_input = Selector("input#ContactUsFrm_email")
+    contact_enquiry_textarea = Selector("textarea#ContactUsFrm_enquiry")
    
     #==========================================
     # Locators - Buttons and Success Message
     #==========================================
-    @property
-    def continue_about_us(self):
-        return self.page.locator("button:has-text('Continue')")
-    
-    @property
-    def continue_privacy_policy(self):
-        return self.page.locator("button:has-text('Continue')")
-    
-    @property
-    def submit_inquiry(self):
-        return self.page.locator("button:has-text('Submit')")
-    
-    @property
-    def success_message(self):
-        return self.page.locator("//*[contains(text(), 'sent to the store owner')]")
+    continue_about_us = Selector("button:has-text('Continue')")
+    continue_privacy_policy = Selector("button:has-text('Continue')")
+    submit_inquiry = Selector("button:has-text('Submit')")
+    success_message = Selector("//*[contains(text(), 'sent to the store owner')]")
 
     #==========================================
     # Actions - Footer Links
     #==========================================
     def click_about_us(self) -> None:
-        self.about_us_link.click()
+        self.perform_and_wait(self.about_us_link.click, "click_about_us")
 
     def click_contact_us(self) -> None:
-        self.contact_us_link.click()
+        self.perform_and_wait(self.contact_us_link.click, "click_contact_us",
+                              ready=self.contact_firstname_input)
 
     def click_privacy_policy(self) -> None:
-        self.privacy_policy_link.click()
+        self.perform_and_wait(self.privacy_policy_link.click, "click_privacy_policy")
     
     #==========================================
     # Actions - Contact Form
@@ -76,15 +50,14 @@ class FooterComponent(BasePage):
         self.contact_firstname_input.fill(firstname)
         self.contact_email_input.fill(email)
         self.contact_enquiry_textarea.fill(enquiry)
-        self.submit_inquiry.click()
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(self.submit_inquiry.click, "fill_and_submit_contact_form")
     
     #==========================================
     # Actions - Scroll to Footer
     #==========================================
     def scroll_to_footer(self) -> None:
         self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        self.wait_for_load_state("networkidle")
+        self.wait_for_element("footer")
     
     #==========================================
     # Verifications - Footer Links
@@ -1,6 +1,7 @@
 from playwright.sync_api import Page, expect
 from pages.base.base_page import BasePage
-import re
+from pages.base.perf_budgets import budgeted
+from pages.base.selectors import Selector
 
 class HeaderComponent(BasePage):
     def __init__(self, page: Page):
@@ -10,97 +11,68 @@ class HeaderComponent(BasePage):
     # Locators - Logo & Search
     #==========================================    
     
-    @property
-    def logo(self):
-        return self.page.locator("a.logo")
-    
-    @property
-    def search_input(self):
-        return self.page.locator("input[name='filter_keyword']")
-    
-    @property
-    def search_input_results(self):
-        return self.page.locator("input[name='keyword']")
-    
-    @property
-    def search_button(self):
-        return self.page.locator("i.fa-search")
-    
-    @property
-    def search_results(self):
-        return self.page.locator("h4").filter(has_text="Products meeting the search criteria")
-    
-    @property
-    def product_names(self):
-        return self.page.locator("a.prdocutname")
+    logo = Selector("a.logo")
+    search_input = Selector("input[name='filter_keyword']")
+    search_input_results = Selector("input[name='keyword']")
+    search_button = Selector("i.fa-search")
+    search_results = Selector("h4", has_text="Products meeting the search criteria")
+    product_names = Selector("a.prdocutname")
     
     #==========================================
     # Locators - Navigation Links
     #==========================================
 
-    @property
-    def main_navigation_links(self):
-        return self.page.locator("nav.subnav ul.nav-pills")
+    main_navigation_links = Selector("nav.subnav ul.nav-pills")
+    home_link = Selector("nav.subnav ul.nav-pills >> text=Home")
     
-    @property
-    def home_link(self):
-        return self.page.locator("nav.subnav ul.nav-pills >> text=Home")
-    
-    @property
     def get_category_link(self, category_name: str):
-        return self.page.get_by_role("link", name=re.compile(f"^{category_name}$", re.IGNORECASE))
+        return self.link_by_exact_name(category_name)
     
-    @property
-    def account_menu_link(self):
-        return self.page.locator("ul.nav.topcart a[href*='account/account']")
+    account_menu_link = Selector("ul.nav.topcart a[href*='account/account']")
     
     #==========================================
     # Locators - Cart
     #==========================================
 
-    @property
-    def cart_link(self):
-        return self.page.locator("ul.nav.topcart a[href*='checkout/cart']")
-    
-    @property
-    def cart_item_count(self):
-        return self.page.locator("ul.nav.topcart span.label")
+    cart_link = Selector("ul.nav.topcart a[href*='checkout/cart']")
+    cart_item_count = Selector("ul.nav.topcart span.label")
     
     #==========================================
     # Actions - Navigation Links
     #==========================================
     def click_logo(self) -> None:
-        self.logo.click()
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(self.logo.click, "click_logo")
     
+    @budgeted
     def search_product_with_button(self, product_name: str) -> None:
         expect(self.search_input).to_be_visible()
         self.search_input.fill(product_name)
-        self.search_button.click()
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(self.search_button.click, "search_product_with_button",
+                              ready=self.search_input_results)
     
     def search_product_with_key(self, product_name: str) -> None:
         expect(self.search_input).to_be_visible()
         self.search_input.fill(product_name)
-        self.search_input.press("Enter")
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(lambda: self.search_input.press("Enter"), "search_product_with_key",
+                              ready=self.search_input_results)
     
     
     def navigate_to_category(self, category_name: str) -> None:
         category_link = self.get_category_link(category_name)
-        category_link.click()
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(category_link.click, "navigate_to_category")
     
     def click_home_link(self) -> None:
-        self.home_link.click()
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(self.home_link.click, "click_home_link")
     
     #==========================================
     # Actions - Shopping Cart
     #==========================================
     def go_to_cart(self) -> None:
-        self.cart_link.click()
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(self.cart_link.click, "go_to_cart")
+
+    def wait_for_cart_count_change(self, previous_count: str, timeout: int = 30000) -> None:
+        """Wait until the cart badge no longer shows previous_count"""
+        self.wait_for_text_change(self.cart_item_count, previous_count, timeout=timeout)
     
     #==========================================
     # Verifications
@@ -136,19 +108,27 @@ class HeaderComponent(BasePage):
         assert actual_count == expected_count, f"Expected cart item count to be '{expected_count}', but got '{actual_count}'."
     
     def assert_search_results(self, search_term: str) -> None:
+        # Echoed search term and result titles in one round-trip
+        state = self.snapshot({
+            "search_value": (self.selectors["search_input_results"], "value"),
+            "product_titles": (self.selectors["product_names"], "texts"),
+        })
+        self._check_search_results(search_term, state)
+
+    @staticmethod
+    def _check_search_results(search_term: str, state: dict) -> None:
         # Search term echoed in input
-        search_value = self.search_input_results.input_value()
+        search_value = state["search_value"] or ""
         assert search_term.lower() in search_value.lower(), (
             f"Expected search term '{search_term}' to be present in search input, "
             f"but got '{search_value}'"
         )
 
         # Product exists
-        product_count = self.product_names.count()
-        assert product_count > 0, "No products were displayed in search results"
+        product_titles = state["product_titles"]
+        assert len(product_titles) > 0, "No products were displayed in search results"
 
         # At least one product name contains the search term
-        product_titles = self.product_names.all_inner_texts()
         match_found = any(
             search_term.lower() in title.lower()
             for title in product_titles
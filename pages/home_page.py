@@ -1,13 +1,17 @@
 from playwright.sync_api import Page
 from pages.base.base_page import BasePage
+from pages.base.perf_budgets import budgeted
+from pages.base.selectors import Selector
 from pages.components.header_component import HeaderComponent
 from pages.components.footer_component import FooterComponent
-import re
+from pages.product_page import ProductPage
 
 class HomePage(BasePage):
+    ready_selector = "div.banner_container"
+
     def __init__(self, page: Page):
         super().__init__(page)
-        self.url = "https://automationteststore.com/"
+        self.url = self.url_for()
         self.header = HeaderComponent(page)
         self.footer = FooterComponent(page)
     
@@ -15,34 +19,23 @@ class HomePage(BasePage):
     # Locators
     # ==========================================
 
-    @property
-    def main_banner(self):
-        return self.page.locator("div.banner_container")
-    
-    @property
-    def featured_products_section(self):
-        return self.page.locator("section.promo_block")
+    main_banner = Selector("div.banner_container")
+    featured_products_section = Selector("section.promo_block")
+    all_product_cards = Selector("div.thumbnails div.col-md-3")
     
-    @property
-    def all_product_cards(self):
-        return self.page.locator("div.thumbnails div.col-md-3")
-    
-    @property
     def get_product_by_name(self, product_name: str):
-        return self.page.get_by_role("link", name=re.compile(f"^{product_name}$", re.IGNORECASE))
+        return self.link_by_exact_name(product_name)
 
     # ==========================================
     # Actions - Home Page
     # ==========================================
+    @budgeted
     def navigate_to_home(self):
         self.navigate(self.url)
-
-        # Wait for the page to be fully loaded
-        self.wait_for_load_state("networkidle")
     
     def click_product(self, product_name: str) -> None:
-        self.get_product_by_name(product_name).click()
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(self.get_product_by_name(product_name).click, "click_product",
+                              ready=ProductPage.ready_selector)
     
     # ==========================================
     # Verifications - Home Page
@@ -66,11 +59,23 @@ class HomePage(BasePage):
     # Assertions - Home Page
     # ==========================================
     def assert_on_home_page(self) -> None:
-        assert self.is_on_home_page(), "Not on the Home Page."
+        # Banner, header and footer read in one round-trip
+        state = self.snapshot({
+            "banner": (self.selectors["main_banner"], "visible"),
+            "logo": (self.header.selectors["logo"], "visible"),
+            "search input": (self.header.selectors["search_input"], "visible"),
+            "search button": (self.header.selectors["search_button"], "visible"),
+            "navigation": (self.header.selectors["main_navigation_links"], "visible"),
+            "footer links": ("footer a", "visible_texts"),
+        })
+        assert self.page.url == self.url and state["banner"], "Not on the Home Page."
 
         # Also assert header and footer components are visible
-        self.header.assert_header_visible()
-        self.footer.assert_footer_links_visible()
+        hidden = [name for name in ("logo", "search input", "search button", "navigation") if not state[name]]
+        assert not hidden, f"Header elements not visible on the Home Page: {hidden}"
+        missing = [label for label in ("About Us", "Privacy Policy", "Contact Us")
+                   if not any(label in text for text in state["footer links"])]
+        assert not missing, f"Footer links not visible on the Home Page: {missing}"
 
     def assert_products_visible(self, product_name: str) -> None:
         product_count = self.get_product_count()
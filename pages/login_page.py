@@ -1,52 +1,35 @@
 from playwright.sync_api import Page
 from pages.base.base_page import BasePage
+from pages.base.selectors import Selector
 
 class LoginPage(BasePage):
+    ready_selector = "input[name='loginname']"
+
     def __init__(self, page: Page):
         # Initialize the base page with the provided Page object
         super().__init__(page)
-        self.url = "https://automationteststore.com/index.php?rt=account/login"
+        self.url = self.url_for("account/login")
     
     # ==========================================
     # Locators
     # ==========================================
 
-    @property
-    def login_name_input(self):
-        return self.page.locator("input[name='loginname']")
-    
-    @property
-    def password_input(self):
-        return self.page.locator("input[name='password']")
-    
-    @property
-    def login_button(self):
-        return self.page.locator("button:has-text('Login')")
+    login_name_input = Selector("input[name='loginname']")
+    password_input = Selector("input[name='password']")
+    login_button = Selector("button:has-text('Login')")
+    forgot_password_link = Selector("a:has-text('Forgot your password')")
     
-    @property
-    def forgot_password_link(self):
-        return self.page.locator("a:has-text('Forgot your password')")
+    error_message = Selector("text=Error: Incorrect login or password provided.")
     
-    @property
-    def error_message(self):
-        return self.page.get_by_text("Error: Incorrect login or password provided.")
-    
-    @property
-    def success_message(self):
-        return self.page.locator("//*[contains(text(), 'Welcome back')]")
-    
-    @property
-    def logout_link(self):
-        return self.page.locator("a[href*='account/logout']")
+    success_message = Selector("//*[contains(text(), 'Welcome back')]")
+    logout_link = Selector("a[href*='account/logout']")
+    logout_heading = Selector("h1:has-text('Account Logout')")
     
     # ==========================================
     # Actions - Login
     # ==========================================
     def navigate_to_login(self):
         self.navigate(self.url)
-
-        # Wait for the page to be fully loaded
-        self.wait_for_load_state("networkidle")
     
     def enter_login_name(self, login_name: str) -> None:
         self.login_name_input.fill(login_name)
@@ -68,13 +51,11 @@ class LoginPage(BasePage):
         """Full login process."""
         self.enter_login_name(login_name)
         self.enter_password(password)
-        self.click_login_button()
-        self.wait_for_load_state("networkidle")
+        self.perform_and_wait(self.click_login_button, "login")
     
     def logout(self) -> None:
         """Logout from the account by navigating to logout URL."""
-        self.navigate("https://automationteststore.com/index.php?rt=account/logout")
-        self.page.wait_for_timeout(1000)
+        self.navigate(self.url_for("account/logout"), ready=self.logout_heading)
     
     # ==========================================
     # Verifications
@@ -1,9 +1,12 @@
 from playwright.sync_api import Page
 from pages.base.base_page import BasePage
+from pages.base.selectors import Selector
 from pages.components.header_component import HeaderComponent
 from pages.components.footer_component import FooterComponent
 
 class ProductPage(BasePage):
+    ready_selector = "h1.productname"
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -15,45 +18,28 @@ class ProductPage(BasePage):
     # Locators - Product Info
     #=====================================
 
-    @property
-    def product_name(self):
-        return self.page.locator("h1.productname")
-        
-    @property
-    def product_price(self):
-        return self.page.locator("div.productprice")
-        
-    @property
-    def product_description(self):
-        return self.page.locator("div#description")
-        
-    @property
-    def product_main_image(self):
-        return self.page.locator("a.local_image")
+    product_name = Selector("h1.productname")
+    product_price = Selector("div.productprice")
+    product_description = Selector("div#description")
+    product_main_image = Selector("a.local_image")
         
     #=====================================
     # Locators - Options & Qty
     #=====================================
 
-    @property
-    def quantity_input(self):
-        return self.page.locator("input#product_quantity")
-        
-    @property
-    def add_to_cart_button(self):
-        return self.page.locator("a.cart")
+    quantity_input = Selector("input#product_quantity")
+    add_to_cart_button = Selector("a.cart")
         
         
     #=====================================
     # Locators - Size, Color, etc.
     #=====================================
 
-    @property
     def get_option_dropdown(self, option_name: str):
         """option_name: 'Size', 'Color'"""
-        # Options are on id with option
-        # i.e. (id="option350" is color, etc.)
-        return self.page.locator(f"select[name=*'option']")
+        # Options are selects with id="option<id>" (i.e. id="option350" is color, etc.), labelled by name
+        self.locator_counter.record("ProductPage.get_option_dropdown")
+        return self.page.get_by_label(option_name)
         
     #=====================================
     # Actions 
@@ -63,8 +49,10 @@ class ProductPage(BasePage):
        self.quantity_input.fill(str(quantity)) 
         
     def add_to_cart(self) -> None:
+        previous_count = self.header.get_cart_item_count_text()
         self.add_to_cart_button.click()
-        self.page.wait_for_timeout(1000)
+        # Wait for the cart badge to pick up the new item
+        self.header.wait_for_cart_count_change(previous_count)
         
     def add_to_cart_with_quantity(self, quantity: int) -> None:
         self.set_quantity(quantity)
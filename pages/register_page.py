@@ -1,118 +1,61 @@
 from playwright.sync_api import Page
 from pages.base.base_page import BasePage
+from pages.base.selectors import Selector
 
 class RegisterPage(BasePage):
+    ready_selector = "input#AccountFrm_email"
+
     def __init__(self, page: Page):
         super().__init__(page)
-        self.url = "https://automationteststore.com/index.php?rt=account/create"
+        self.url = self.url_for("account/create")
     
     # ==========================================
     # Locators - Personal Information
     # ==========================================
 
-    @property
-    def first_name_input(self):
-        return self.page.locator("input[name='firstname']")
-    
-    @property
-    def last_name_input(self):
-        return self.page.locator("input[name='lastname']")
-    
-    @property
-    def email_input(self):
-        return self.page.locator("input#AccountFrm_email")
-    
-    @property
-    def telephone_input(self):
-        return self.page.locator("input[name='telephone']")
-    
-    @property
-    def fax_input(self):
-        return self.page.locator("input[name='fax']")
+    first_name_input = Selector("input[name='firstname']")
+    last_name_input = Selector("input[name='lastname']")
+    email_input = Selector("input#AccountFrm_email")
+    telephone_input = Selector("input[name='telephone']")
+    fax_input = Selector("input[name='fax']")
     
     # ==========================================
     # Locators - Address Information
     # ==========================================
 
-    @property
-    def company_input(self):
-        return self.page.locator("input[name='company']")
-    
-    @property
-    def address_1_input(self):
-        return self.page.locator("input[name='address_1']")
-    
-    @property
-    def address_2_input(self):
-        return self.page.locator("input[name='address_2']")
-    
-    @property
-    def city_input(self):
-        return self.page.locator("input[name='city']")
-    
-    @property
-    def region_dropdown(self):
-        return self.page.locator("select[name='zone_id']")
-    
-    @property
-    def zipcode_input(self):
-        return self.page.locator("input[name='postcode']")
-    
-    @property
-    def country_dropdown(self):
-        return self.page.locator("select[name='country_id']")
+    company_input = Selector("input[name='company']")
+    address_1_input = Selector("input[name='address_1']")
+    address_2_input = Selector("input[name='address_2']")
+    city_input = Selector("input[name='city']")
+    region_dropdown = Selector("select[name='zone_id']")
+    zipcode_input = Selector("input[name='postcode']")
+    country_dropdown = Selector("select[name='country_id']")
     
     # ==========================================
     # Locators - Login Information
     # ==========================================
 
-    @property
-    def login_name_input(self):
-        return self.page.locator("input[name='loginname']")
-    
-    @property
-    def password_input(self):
-        return self.page.locator("input[name='password']")
-    
-    @property
-    def confirm_password_input(self):
-        return self.page.locator("input[name='confirm']")
+    login_name_input = Selector("input[name='loginname']")
+    password_input = Selector("input[name='password']")
+    confirm_password_input = Selector("input[name='confirm']")
     
     # ==========================================
     # Locators - Newsletter & Privacy
     # ==========================================
 
-    @property
-    def newsletter_yes_radio(self):
-        return self.page.locator("input[name='newsletter'][value='1']")
-    
-    @property
-    def newsletter_no_radio(self):
-        return self.page.locator("input[name='newsletter'][value='0']")
-    
-    @property
-    def privacy_policy_checkbox(self):
-        return self.page.locator("input[name='agree']")
+    newsletter_yes_radio = Selector("input[name='newsletter'][value='1']")
+    newsletter_no_radio = Selector("input[name='newsletter'][value='0']")
+    privacy_policy_checkbox = Selector("input[name='agree']")
     
     # ==========================================
     # Locators - Buttons & Messages
     # ==========================================
 
-    @property
-    def continue_button(self):
-        return self.page.locator("button:has-text('Continue')")
-    
-    @property
-    def page_heading(self):
-        return self.page.locator("h1:has-text('Create Account')")
-    
-    @property
-    def success_message(self):
-        return self.page.locator("span.maintext:has-text('Your Account Has Been Created!')")
-    
-    @property
-    def error_message(self):
-        return self.page.locator("div.alert.alert-danger")
+    continue_button = Selector("button:has-text('Continue')")
+    page_heading = Selector("h1:has-text('Create Account')")
+    success_message = Selector("span.maintext:has-text('Your Account Has Been Created!')")
+    error_message = Selector("div.alert.alert-danger")
+    logout_heading = Selector("h1:has-text('Account Logout')")
     
     
     # ==========================================
@@ -120,7 +63,6 @@ class RegisterPage(BasePage):
     # ==========================================
     def navigate_to_register(self):
         self.navigate(self.url)
-        self.wait_for_load_state("networkidle")
     
     def enter_first_name(self, first_name: str) -> None:
         self.first_name_input.fill(first_name)
@@ -193,7 +135,7 @@ class RegisterPage(BasePage):
     
     def logout(self) -> None:
         """Logout from the account by navigating to logout URL."""
-        self.navigate("https://automationteststore.com/index.php?rt=account/logout")
+        self.navigate(self.url_for("account/logout"), ready=self.logout_heading)
     
     # ==========================================
     # Full Registration Process
@@ -221,7 +163,7 @@ class RegisterPage(BasePage):
 
         # Select country first to load regions
         self.select_country(user_data["country"])
-        self.page.wait_for_timeout(3000)  # Wait for regions to load
+        self.wait_for_select_option(self.region_dropdown, user_data["region"])
         self.select_region(user_data["region"])
         self.enter_zipcode(user_data["zipcode"])
 
@@ -249,7 +191,7 @@ class RegisterPage(BasePage):
 
     def is_registration_successful(self) -> bool:
         """Check if registration was successful."""
-        self.wait_for_load_state("networkidle")
+        self.wait_for_ready_state("is_registration_successful")
         return self.success_message.is_visible()
 
     def is_error_displayed(self) -> bool:
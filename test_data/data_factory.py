@@ -0,0 +1,122 @@
+"""
+Collision-free test data for parallel runs: seeded per run, namespaced per xdist worker
+"""
+
+import itertools
+import random
+import re
+from collections import deque
+
+from faker import Faker
+
+# Regions the register and checkout forms offer for the United States, on the live and the local store
+REGIONS = ("California", "Florida", "New York", "Texas")
+
+
+def base36(number: int) -> str:
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    text = ""
+    while True:
+        number, rest = divmod(number, 36)
+        text = digits[rest] + text
+        if not number:
+            return text
+
+
+class DataFactory:
+    """
+    Users, addresses and unique values for one process of the run.
+
+    Whatever the store requires to be unique (emails, login names) carries a
+    token made of the run seed, a run id, the xdist worker and a counter that
+    only goes up. The run id is random and never derived from the seed, so a
+    run reproduced with the same seed still registers values the store has
+    not seen; two workers of a run never produce the same token either.
+    Names, addresses and phones come from a Faker seeded with the run seed and
+    the worker, so the same seed gives a worker the same data in the same
+    order. They are generated batch_size at a time, ahead of the tests.
+    """
+
+    def __init__(self, seed: int | None = None, worker: str = "main", batch_size: int = 50,
+                 run_id: str | None = None):
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+        # Picked once by the xdist controller and handed to every worker
+        self.run_id = run_id or base36(random.SystemRandom().getrandbits(30))
+        self.worker = worker
+        self.batch_size = batch_size
+        self.faker = Faker("en_US")
+        self.faker.seed_instance(f"{self.seed}:{worker}")
+        # xdist worker "gw3" -> "w3", a run without xdist -> "m"
+        self._namespace = (f"{base36(self.seed)}_{self.run_id}_"
+                           f"{'w' + worker[2:] if worker.startswith('gw') else 'm'}")
+        self._counter = itertools.count(1)
+        self._users: deque[dict] = deque()
+        self._addresses: deque[dict] = deque()
+
+    def token(self) -> str:
+        """Unique across workers and runs, e.g. 1x4f9k_8q2zd1_w3_17"""
+        return f"{self._namespace}_{next(self._counter)}"
+
+    def email(self, prefix: str = "test") -> str:
+        return f"{prefix}.{self.token()}@example.com"
+
+    def login_name(self, prefix: str = "user") -> str:
+        return f"{prefix}_{self.token()}"
+
+    # ======================
+    # Pre-generated batches
+    # ======================
+    def _address(self) -> dict:
+        return {
+            "address_1": self.faker.street_address(),
+            "address_2": self.faker.secondary_address(),
+            "city": self.faker.city(),
+            "region": self.faker.random_element(REGIONS),
+            "zipcode": self.faker.postcode(),
+            "country": "United States",
+        }
+
+    def _person(self) -> dict:
+        return {
+            "first_name": self.faker.first_name(),
+            "last_name": self.faker.last_name(),
+            "telephone": self.faker.numerify("555-####"),
+            "fax": self.faker.numerify("##########"),
+            "company": self.faker.company(),
+            **self._address(),
+        }
+
+    def address(self) -> dict:
+        if not self._addresses:
+            self._addresses.extend(self._address() for _ in range(self.batch_size))
+        return dict(self._addresses.popleft())
+
+    def user(self, password: str = "Test12345!") -> dict:
+        """Registration form data, with an email and login name no other test of the run uses"""
+        if not self._users:
+            self._users.extend(self._person() for _ in range(self.batch_size))
+        user = self._users.popleft()
+        # Unique values are drawn when the user is handed out, so the counter follows test order
+        handle = re.sub(r"[^a-z]", "", (user["first_name"] + user["last_name"]).lower())
+        return {
+            **user,
+            "email": self.email(handle or "user"),
+            "login_name": self.login_name(),
+            "password": password,
+            "newsletter": True,
+        }
+
+    def guest(self) -> dict:
+        """Guest checkout form data, in the field names CheckoutPage.fill_guest_information takes"""
+        user = self.user()
+        return {
+            "email": user["email"],
+            "firstname": user["first_name"],
+            "lastname": user["last_name"],
+            "address": user["address_1"],
+            "city": user["city"],
+            "zipcode": user["zipcode"],
+            "phone": user["telephone"],
+            "country": user["country"],
+            "state": user["region"],
+        }
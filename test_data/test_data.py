@@ -2,64 +2,63 @@
 Utility module for test data and helper functions
 """
 
+from test_data.data_factory import DataFactory
+
+
 class TestDataGenerator:
     """Generate test data for various test scenarios"""
-    
+
+    # Seeded and namespaced per xdist worker from conftest, random seed outside pytest
+    factory = DataFactory()
+
     @staticmethod
     def generate_guest_checkout_data():
         """Generate guest checkout data"""
         return {
-            "email": "testguest@example.com",
-            "firstname": "John",
-            "lastname": "Doe",
-            "address": "123 Main Street",
-            "city": "New York",
-            "zipcode": "10001",
-            "phone": "555-1234",
+            **TestDataGenerator.factory.guest(),
             "product_search": "shirt",
-            "country": "United States",
-            "state": "New York"
         }
     
     @staticmethod
-    def generate_registered_user_data():
-        """Generate registered user credentials"""
+    def generate_registered_user_data(account: dict):
+        """Generate registered user credentials of an account leased from the pool"""
         return {
-            "email": "registereduser@example.com",
-            "password": "TestPassword123!",
-            "username": "registereduser"
+            "email": account["email"],
+            "password": account["password"],
+            "username": account["login_name"]
         }
     
     @staticmethod
-    def generate_registered_user_checkout_data():
+    def generate_registered_user_checkout_data(account: dict):
         """Generate checkout data for registered user"""
         return {
             "product_search": "conditioner",
-            "email": "registereduser@example.com"
+            "email": account["email"]
         }
     
     @staticmethod
     def generate_multiple_products_data():
         """Generate data for multiple products cart test"""
+        guest = TestDataGenerator.factory.guest()
         return {
             "product_1_search": "hands",
             "product_1_alternatives": ["conditioner", "shampoo", "cream"],
             "product_2_search": "perfume",
             "product_2_alternatives": ["makeup", "shoes", "apparel"],
-            "email": "testmultiproduct@example.com",
-            "firstname": "Jane",
-            "lastname": "Smith",
-            "address": "456 Oak Avenue",
-            "city": "Los Angeles",
-            "zipcode": "90001",
-            "phone": "555-5678"
+            "email": guest["email"],
+            "firstname": guest["firstname"],
+            "lastname": guest["lastname"],
+            "address": guest["address"],
+            "city": guest["city"],
+            "zipcode": guest["zipcode"],
+            "phone": guest["phone"]
         }
     @staticmethod
     def generate_data_for_contact_us():
         """Generate data for inquiry"""
         return {
             "firstname": "John",
-            "email": "testguest@example.com",
+            "email": TestDataGenerator.factory.email("contact"),
             "enquiry": "I'm interested in buying hair conditioner on bulk. Would you give me a sweet discount? Thanks"
         }
 
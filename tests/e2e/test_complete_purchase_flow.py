@@ -5,28 +5,20 @@ These tests verify the full checkout process for different user types
 import pytest
 import allure
 from playwright.sync_api import Page
-from pages.home_page import HomePage
-from pages.product_page import ProductPage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
-from pages.login_page import LoginPage
-from utils.helpers import ProductHelpers
-from dotenv import load_dotenv
-import os
 
 
 @allure.epic("E2E Purchase Flow")
 @allure.feature("Guest Checkout")
 @allure.severity(allure.severity_level.CRITICAL)
 @pytest.mark.e2e
-def test_complete_purchase_flow_as_guest(page: Page, guest_checkout_data):
+def test_complete_purchase_flow_as_guest(page: Page, cart_seeder, product_index, guest_checkout_data):
     """
     E2E test for complete purchase flow as guest
     
     Steps:
-    1. Navigate to home
-    2. Search for product
-    3. Add product to cart
+    1-3. Seed the cart with the product (the UI add-to-cart path is covered by the regression suite)
     4. View cart
     5. Proceed to checkout as guest
     6. Fill checkout information
@@ -34,31 +26,16 @@ def test_complete_purchase_flow_as_guest(page: Page, guest_checkout_data):
     8. Verify order successful
     """
     # Initialize page objects
-    home_page = HomePage(page)
-    product_page = ProductPage(page)
     cart_page = CartPage(page)
     checkout_page = CheckoutPage(page)
     
-    with allure.step("Navigate to home page"):
-        # Step 1: Navigate to home
-        home_page.navigate_to_home()
-        home_page.assert_on_home_page()
-    
-    with allure.step("Search for product"):
-        # Step 2: Search for product
-        home_page.header.search_product_with_button(guest_checkout_data["product_search"])
-        page.wait_for_load_state("networkidle")
-    
-    with allure.step("Select first product from results and add it to the cart"):
-        # Step 3: Add product to cart
-        first_product = page.locator("a.prdocutname, a.productname").first
-        assert first_product.count() > 0, f"❌ Product '{guest_checkout_data['product_search']}' not found in search results"
-        first_product.click()
-        page.wait_for_load_state("domcontentloaded")
-        product_page.assert_on_product_page()
-        product_page.add_to_cart()
+    with allure.step("Seed the cart with the product"):
+        # Steps 1-3: Add a purchasable product matching the search term over HTTP and open the cart
+        product = product_index.find(guest_checkout_data["product_search"])
+        assert product, f"❌ No purchasable product matches '{guest_checkout_data['product_search']}'"
+        cart_seeder.seed([(product["id"], 1)])
+        cart_page.navigate_to_cart()
         print(f"{guest_checkout_data["product_search"]} was added successfully")
-        page.wait_for_load_state("networkidle")
     
     with allure.step("Verify the product was added successfully and the cart is not empty"):
         # Step 4: Assert cart product
@@ -74,7 +51,6 @@ def test_complete_purchase_flow_as_guest(page: Page, guest_checkout_data):
     with allure.step("Fill checkout information"):
         # Step 6: Fill checkout information
         checkout_page.select_guest_checkout()
-        page.wait_for_load_state("networkidle")
     
         checkout_page.fill_guest_information(
             email=guest_checkout_data["email"],
@@ -106,50 +82,31 @@ def test_complete_purchase_flow_as_guest(page: Page, guest_checkout_data):
 @allure.feature("Registered User Checkout")
 @allure.severity(allure.severity_level.CRITICAL)
 @pytest.mark.e2e
-def test_complete_purchase_flow_as_registered_user(page: Page, registered_user_checkout_data):
+@pytest.mark.logged_in
+def test_complete_purchase_flow_as_registered_user(page: Page, cart_seeder, product_index,
+                                                   registered_user_checkout_data):
     """
     E2E test for complete purchase flow as registered user
     
     Steps:
-    1. Navigate to home
-    2. Search for product
-    3. Add product to cart
+    1-3. Seed the cart with the product (the UI add-to-cart path is covered by the regression suite)
     4. View cart
-    5. Proceed to checkout and login
+    5. Proceed to checkout (the session is already logged in)
     6. Fill shipping information
     7. Confirm order
     8. Verify order successful
     """
     # Initialize page objects
-    home_page = HomePage(page)
-    product_page = ProductPage(page)
     cart_page = CartPage(page)
     checkout_page = CheckoutPage(page)
-    login_page = LoginPage(page)
-
-    # Load environment variables from .env file
-    load_dotenv()
-    
-    with allure.step("Navigate to home page"):
-        # Step 1: Navigate to home
-        home_page.navigate_to_home()
-        home_page.assert_on_home_page()
     
-    with allure.step("Search for product"):
-        # Step 2: Search for product
-        home_page.header.search_product_with_button(registered_user_checkout_data["product_search"])
-        page.wait_for_load_state("networkidle")
-    
-    with allure.step("Select first product from results and add it to the cart"):
-        # Step 3: Add product to cart
-        first_product = page.locator("a.prdocutname, a.productname").first
-        assert first_product.count() > 0, f"❌ Product '{registered_user_checkout_data['product_search']}' not found in search results"
-        first_product.click()
-        page.wait_for_load_state("domcontentloaded")
-        product_page.assert_on_product_page()
-        product_page.add_to_cart()
+    with allure.step("Seed the cart with the product"):
+        # Steps 1-3: Add a purchasable product over HTTP (on the logged-in session) and open the cart
+        product = product_index.find(registered_user_checkout_data["product_search"])
+        assert product, f"❌ No purchasable product matches '{registered_user_checkout_data['product_search']}'"
+        cart_seeder.seed([(product["id"], 1)])
+        cart_page.navigate_to_cart()
         print(f"{registered_user_checkout_data["product_search"]} was added successfully")
-        page.wait_for_load_state("networkidle")
     
     with allure.step("Verify the product got added and the cart is not empty"):
         # Step 4: Assert cart product
@@ -157,18 +114,10 @@ def test_complete_purchase_flow_as_registered_user(page: Page, registered_user_c
         cart_page.assert_product_in_cart(registered_user_checkout_data["product_search"])
         print(f"{registered_user_checkout_data["product_search"]} is included in the cart")
 
-    with allure.step("Proceed to checkout and login with an existing user"):
-        # Step 5: Proceed to checkout and login
+    with allure.step("Proceed to checkout with the logged-in user"):
+        # Step 5: Proceed to checkout, no login form since the context is authenticated
         cart_page.proceed_to_checkout()
-        checkout_page.assert_on_checkout_page()
-
-        valid_login_name = os.getenv("VALID_LOGIN_NAME")
-        valid_password = os.getenv("VALID_PASSWORD")
-    
-        login_page.login(valid_login_name, valid_password)
-        page.wait_for_load_state("networkidle")
-
-    print("Login with registered user was successful")
+        checkout_page.assert_on_confirm_page()
     
     with allure.step("Click on confirm order"):
         # Step 6: Confirm order
@@ -187,14 +136,12 @@ def test_complete_purchase_flow_as_registered_user(page: Page, registered_user_c
 @allure.feature("Cart management with more than one product")
 @allure.severity(allure.severity_level.CRITICAL)
 @pytest.mark.e2e
-def test_cart_management_multiple_products_flow(page: Page, multiple_products_data):
+def test_cart_management_multiple_products_flow(page: Page, cart_seeder, product_index, multiple_products_data):
     """
     E2E test for cart management with multiple products
     
     Steps:
-    1. Add product 1 to cart (with alternatives if not found)
-    2. Continue shopping
-    3. Add product 2 to cart (with alternatives if not found)
+    1-3. Seed the cart with product 1 and product 2 (first purchasable match of each term or its alternatives)
     4. View cart with both products
     5. Update quantity of product 1
     6. Remove product 2
@@ -202,53 +149,31 @@ def test_cart_management_multiple_products_flow(page: Page, multiple_products_da
     8. Complete purchase as guest
     """
     # Initialize page objects
-    home_page = HomePage(page)
-    product_page = ProductPage(page)
     cart_page = CartPage(page)
     checkout_page = CheckoutPage(page)
     
-    with allure.step("Navigate to home page and add a product"):
-        # Step 1: Navigate to home and add product 1
-        home_page.navigate_to_home()
-        page.wait_for_load_state("networkidle")
-    
-        product_1_name, product_1_found = ProductHelpers.search_and_add_product(
-            home_page, product_page, page,
-            multiple_products_data["product_1_search"],
-            multiple_products_data.get("product_1_alternatives", [])
+    with allure.step("Seed the cart with two products"):
+        # Steps 1-3: Look both products up in the catalog index and add them over HTTP
+        product_1 = product_index.first_available(
+            [multiple_products_data["product_1_search"]] + multiple_products_data.get("product_1_alternatives", [])
         )
-    
-        assert product_1_found, "❌ Could not find product 1 or any alternatives"
-    
-    with allure.step("Continue shopping"):
-        # Step 2: Continue shopping
-        home_page.navigate_to_home()
-        page.wait_for_load_state("networkidle")
-    
-    with allure.step("Add another product"):
-        # Step 3: Add product 2 to cart
-        product_2_name, product_2_found = ProductHelpers.search_and_add_product(
-            home_page, product_page, page,
-            multiple_products_data["product_2_search"],
-            multiple_products_data.get("product_2_alternatives", [])
+        product_2 = product_index.first_available(
+            [multiple_products_data["product_2_search"]] + multiple_products_data.get("product_2_alternatives", [])
         )
-    
-        if not product_2_found:
-            print("⚠️  Product 2 not found, continuing with only product 1")
+        assert product_1 and product_2, "❌ Could not find two purchasable products in the catalog"
+        cart_seeder.seed([(product_1["id"], 1), (product_2["id"], 1)])
+        product_1_name, product_2_name = product_1["name"], product_2["name"]
     
     with allure.step("View your cart to ensure is not empty"):
         # Step 4: View cart
         cart_page.navigate_to_cart()
         cart_page.assert_cart_not_empty()
     
-        # Verify product 1 is in cart
+        # Verify both products are in cart
         assert cart_page.is_product_in_cart(product_1_name), f"Product 1 '{product_1_name}' not in cart"
         print(f"✓ Product 1 '{product_1_name}' verified in cart")
-    
-        # Verify product 2 is in cart if it was found
-        if product_2_found:
-            assert cart_page.is_product_in_cart(product_2_name), f"Product 2 '{product_2_name}' not in cart"
-            print(f"✓ Product 2 '{product_2_name}' verified in cart")
+        assert cart_page.is_product_in_cart(product_2_name), f"Product 2 '{product_2_name}' not in cart"
+        print(f"✓ Product 2 '{product_2_name}' verified in cart")
     
     with allure.step("Update the quantity of the first product you added"):
         # Step 5: Update quantity of product 1
@@ -260,13 +185,11 @@ def test_cart_management_multiple_products_flow(page: Page, multiple_products_da
         print(f"✓ Product 1 quantity updated to {new_qty}")
     
     with allure.step("Remove the second product you added"):
-        # Step 6: Remove product 2 if it was found
-        if product_2_found:
-            cart_page.remove_product(product_2_name)
-            page.wait_for_load_state("networkidle")
-            assert not cart_page.is_product_in_cart(product_2_name), \
-                "Product 2 should be removed from cart"
-            print(f"✓ Product 2 '{product_2_name}' removed from cart")
+        # Step 6: Remove product 2
+        cart_page.remove_product(product_2_name)
+        assert not cart_page.is_product_in_cart(product_2_name), \
+            "Product 2 should be removed from cart"
+        print(f"✓ Product 2 '{product_2_name}' removed from cart")
     
     with allure.step("Proceed to checkout"):
         # Step 7: Proceed to checkout with product 1
@@ -276,7 +199,6 @@ def test_cart_management_multiple_products_flow(page: Page, multiple_products_da
     with allure.step("Complete purchase as guest"):
         # Step 8: Complete purchase as guest
         checkout_page.select_guest_checkout()
-        page.wait_for_load_state("networkidle")
     
         checkout_page.fill_guest_information(
             email=multiple_products_data["email"],
@@ -0,0 +1,31 @@
+"""
+Search journeys on the async page objects, run concurrently on one event loop (--flow-concurrency)
+"""
+import pytest
+from pages.aio.home_page import AsyncHomePage
+from pages.aio.product_page import AsyncProductPage
+
+@pytest.mark.regression
+@pytest.mark.async_flow
+@pytest.mark.parametrize("search_term", ["shoes", "shirt", "cream", "perfume"])
+async def test_search_from_home(flow, search_term):
+    home_page = AsyncHomePage(flow.page)
+    await home_page.navigate_to_home()
+
+    await home_page.header.search_product_with_button(search_term)
+    await home_page.header.assert_search_results(search_term)
+
+    print(f"Search for '{search_term}' shows matching products")
+
+@pytest.mark.regression
+@pytest.mark.async_flow
+async def test_open_product_from_search(flow):
+    home_page = AsyncHomePage(flow.page)
+    product_page = AsyncProductPage(flow.page)
+    await home_page.navigate_to_home()
+
+    await home_page.header.search_product_with_button("shoes")
+    await flow.page.locator("a.prdocutname, a.productname").first.click()
+    await product_page.wait_until_ready()
+
+    assert await product_page.get_product_name(), "Product page shows no product name"
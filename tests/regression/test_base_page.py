@@ -18,11 +18,11 @@ def test_base_page_methods(page: Page, base_url: str):
     # Hover over an element
     hover_locator = page.get_by_role("link", name="Hair Care")
     base_page.hover_over_element(hover_locator)
-    base_page.page.wait_for_timeout(3000)  # Wait for 3 seconds
+    base_page.wait_for_element(hover_locator)
    
     # fill an input field
     search_input_locator = page.locator("input[name='filter_keyword']")
     base_page.click_element(search_input_locator)
     base_page.fill_input(search_input_locator, "Shoes")
     base_page.click_element(page.locator(".fa.fa-search"))  
-    base_page.page.wait_for_timeout(3000)  # Wait for 3 seconds
\ No newline at end of file
+    base_page.wait_for_url("product/search")
\ No newline at end of file
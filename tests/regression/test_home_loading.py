@@ -2,6 +2,7 @@ import pytest
 from playwright.sync_api import Page, expect
 
 @pytest.mark.regression
+@pytest.mark.allow_resources("image")
 def test_home_page_loads(page: Page, base_url: str):
     # Navigate to the home page
     page.goto(base_url)
@@ -57,7 +57,6 @@ def test_contact_us(page: Page, generate_data_for_contact_us):
 
     # Click on contact us and verify navigation
     footer.click_contact_us()
-    page.wait_for_load_state("networkidle")
     
     # Fill form and submit
     footer.fill_and_submit_contact_form(
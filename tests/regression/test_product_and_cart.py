@@ -50,7 +50,6 @@ def test_add_product_to_cart(page: Page):
 
     # Add to cart
     product_page.add_to_cart()
-    page.wait_for_load_state("networkidle")
 
     # Assert we're on the cart
     cart_page.assert_cart_not_empty()
@@ -75,7 +74,6 @@ def test_add_multiple_quantities_to_cart(page: Page):
 
     # Add several units i.e. 3
     product_page.add_to_cart_with_quantity(3)
-    page.wait_for_load_state("networkidle")
 
     # Assert cart's not empty
     cart_page.assert_cart_not_empty()
@@ -85,37 +83,20 @@ def test_add_multiple_quantities_to_cart(page: Page):
 @allure.feature("Shopping Cart")
 @allure.severity(allure.severity_level.CRITICAL)
 @pytest.mark.regression
-def test_remove_product_from_cart(page: Page):
-    home_page = HomePage(page)
-    product_page = ProductPage(page)
+def test_remove_product_from_cart(page: Page, cart_seeder, product_index):
     cart_page = CartPage(page)
 
-    # Navigate and search product
-    home_page.navigate_to_home()
-    home_page.header.search_product_with_button("shampoo")
-
-    # Click on the product
-    first_product = page.locator("a.prdocutname, a.productname").first
-    first_product.click()
-    page.wait_for_load_state("domcontentloaded")
-
-    # Add to cart
-    product_page.add_to_cart()
-    page.wait_for_load_state("networkidle")
-
-    # Add another product
-    home_page.header.search_product_with_button("perfume")
-    first_product = page.locator("a.prdocutname, a.productname").first
-    first_product.click()
-    page.wait_for_load_state("domcontentloaded")
-    product_page.add_to_cart()
-    page.wait_for_load_state("networkidle")
+    # Start on a cart holding a shampoo and a perfume
+    shampoo = product_index.find("shampoo")
+    perfume = product_index.find("perfume")
+    assert shampoo, "❌ No purchasable shampoo in the product index"
+    assert perfume, "❌ No purchasable perfume in the product index"
+    cart_seeder.seed([(shampoo["id"], 1), (perfume["id"], 1)])
+    cart_page.navigate_to_cart()
 
     # Remove the products
     cart_page.remove_product("shampoo")
-    page.wait_for_load_state("domcontentloaded")
     cart_page.remove_product("perfume")
-    page.wait_for_load_state("domcontentloaded")
 
     # Assert cart's empty
     cart_page.assert_cart_empty()
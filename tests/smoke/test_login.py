@@ -27,14 +27,15 @@ def test_login_page_elements_visible(page: Page):
 @allure.feature("Login Flow")
 @allure.severity(allure.severity_level.CRITICAL)
 @pytest.mark.smoke
-def test_login_with_valid_credentials(page: Page):
+def test_login_with_valid_credentials(page: Page, registered_account: dict):
     login_page = LoginPage(page)
 
     with allure.step("Navigate to login"):
         login_page.navigate_to_login()
     
-    valid_login_name = os.getenv("VALID_LOGIN_NAME")
-    valid_password = os.getenv("VALID_PASSWORD")
+    # Account leased from the pool, no other worker logs in with it meanwhile
+    valid_login_name = registered_account["login_name"]
+    valid_password = registered_account["password"]
 
     with allure.step("Enter valid credentials and login"):
         login_page.enter_login_name(valid_login_name)
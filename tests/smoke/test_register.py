@@ -3,29 +3,12 @@ import allure
 from playwright.sync_api import Page
 from pages.register_page import RegisterPage
 from pages.login_page import LoginPage
-from faker import Faker
-
-faker = Faker()
+from test_data.data_factory import DataFactory
 
 @pytest.fixture
-def user_data():
-    return {
-        "first_name": faker.first_name(),
-        "last_name": faker.last_name(),
-        "email": faker.email(),
-        "telephone": faker.phone_number(),
-        "fax": faker.numerify(text='##########'),
-        "company": faker.company(),
-        "address_1": faker.street_address(),
-        "address_2": faker.secondary_address(),
-        "city": faker.city(),
-        "region": "California",
-        "zipcode": faker.postcode(),
-        "country": "United States",
-        "login_name": f"user_{faker.random_number(digits=5)}",
-        "password": "Test12345!",
-        "newsletter": True
-    }
+def user_data(data_factory: DataFactory):
+    # Email and login name are unique across the run's workers
+    return data_factory.user()
 
 @allure.feature("User Registration")
 @allure.severity(allure.severity_level.CRITICAL)
@@ -89,7 +72,7 @@ def test_registration_without_privacy_policy_agreement(page: Page, user_data: di
     with allure.step("Select country dropdown to enable the region dropdown"):
         # Select country first to load regions
         register_page.country_dropdown.select_option(label=user_data["country"])
-        page.wait_for_load_state("domcontentloaded")  # Wait for regions to load
+        register_page.wait_for_select_option(register_page.region_dropdown, user_data["region"])
         register_page.region_dropdown.select_option(label=user_data["region"])
 
     with allure.step("Fill all input fields"):
@@ -132,7 +115,7 @@ def test_registration_with_mismatched_passwords(page: Page, user_data: dict):
     with allure.step("Select country dropdown to enable the region dropdown"):
         # Select country first to load regions
         register_page.country_dropdown.select_option(label=user_data["country"])
-        page.wait_for_load_state("domcontentloaded")  # Wait for regions to load
+        register_page.wait_for_select_option(register_page.region_dropdown, user_data["region"])
         register_page.region_dropdown.select_option(label=user_data["region"])
 
     with allure.step("Fill form with mistmatched passwords"):
@@ -184,7 +167,6 @@ def test_registration_with_existing_email(page: Page, user_data: dict):
     with allure.step("Logout before attempting to register a new user"):
         # Logout before attempting to register again
         login_page.logout()
-        page.wait_for_load_state("networkidle")
 
     with allure.step("Navigate to user registration form"):
         register_page.navigate_to_register()
@@ -193,7 +175,7 @@ def test_registration_with_existing_email(page: Page, user_data: dict):
         # Now, attempt to register again with the same email
         # Select country first to load regions
         register_page.country_dropdown.select_option(label=user_data["country"])
-        page.wait_for_load_state("domcontentloaded")  # Wait for regions to load
+        register_page.wait_for_select_option(register_page.region_dropdown, user_data["region"])
         register_page.region_dropdown.select_option(label=user_data["region"])
         # Fill every input field
         register_page.first_name_input.fill(user_data["first_name"])
@@ -0,0 +1,204 @@
+"""
+Pool of registered accounts, leased exclusively so registered-user tests can run in parallel
+
+    python -m utils.account_pool --provision 8 --base-url https://automationteststore.com/
+    python -m utils.account_pool --list
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlsplit
+
+from dotenv import load_dotenv
+from filelock import FileLock
+from playwright.sync_api import Browser, sync_playwright
+
+from local_store import LocalStoreServer
+from pages.base.base_page import BasePage
+from pages.register_page import RegisterPage
+from test_data.data_factory import DataFactory
+
+
+def pool_path(root: str | Path, base_url: str) -> Path:
+    """One pool per store host, accounts do not exist anywhere else"""
+    return Path(root) / ".cache" / f"account_pool_{urlsplit(base_url).hostname}.json"
+
+
+def registrar(browser: Browser) -> Callable[[dict], None]:
+    """Register a DataFactory.user() through the store's own form, in a context thrown away afterwards"""
+    def register(user: dict) -> None:
+        context = browser.new_context()
+        try:
+            register_page = RegisterPage(context.new_page())
+            register_page.navigate_to_register()
+            register_page.register_user(user)
+            register_page.assert_registration_successful()
+        finally:
+            context.close()
+    return register
+
+
+def stand_in_account(account: dict) -> dict:
+    """A pooled account in the shape the stand-in store keeps (it only knows accounts it was given)"""
+    return {
+        "loginname": account["login_name"], "password": account["password"],
+        "firstname": account["first_name"], "lastname": account["last_name"], "email": account["email"],
+    }
+
+
+class AccountPool:
+    """
+    Accounts and their leases in one JSON file, shared by xdist workers and later runs.
+
+    Every read-modify-write happens under a file lock. A lease names its owner
+    and process; leases of processes no longer alive on this host (a crashed or
+    interrupted run) are taken back on the next lease(). When every account is
+    taken, lease() registers a new one: it is written to the file as leased
+    first, so the slow registration itself runs without holding the lock.
+    """
+
+    def __init__(self, path: str | Path, factory: DataFactory | None = None):
+        self.path = Path(path)
+        self.factory = factory or DataFactory()
+        self._lock = FileLock(f"{self.path}.lock")
+
+    def _load(self) -> dict:
+        if self.path.exists():
+            return json.loads(self.path.read_text())
+        return {"version": 1, "accounts": [], "leases": {}}
+
+    def _save(self, data: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, indent=2))
+
+    def _new_account(self, known: list[dict]) -> tuple[dict, dict]:
+        """(form data to register, what the pool keeps of it), never a login name or email the pool holds"""
+        taken = {account["login_name"] for account in known} | {account["email"] for account in known}
+        user = self.factory.user()
+        while user["login_name"] in taken or user["email"] in taken:
+            user = self.factory.user()
+        return user, {key: user[key] for key in ("login_name", "password", "email", "first_name", "last_name")}
+
+    @staticmethod
+    def _is_stale(lease: dict) -> bool:
+        if lease.get("host") != socket.gethostname() or os.name != "posix":
+            return False
+        try:
+            os.kill(lease["pid"], 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass
+        return False
+
+    def accounts(self) -> list[dict]:
+        with self._lock:
+            return self._load()["accounts"]
+
+    def leases(self) -> dict[str, dict]:
+        with self._lock:
+            return self._load()["leases"]
+
+    def provision(self, count: int, register: Callable[[dict], None]) -> list[dict]:
+        """Register accounts until the pool holds count of them, ahead of the runs that lease them"""
+        created = []
+        while len(known := self.accounts()) < count:
+            user, account = self._new_account(known)
+            register(user)
+            with self._lock:
+                data = self._load()
+                data["accounts"].append(account)
+                self._save(data)
+            created.append(account)
+        return created
+
+    def lease(self, owner: str, register: Callable[[dict], None]) -> dict:
+        """An account nobody else holds, registered on the spot if the pool is exhausted"""
+        lease = {"owner": owner, "host": socket.gethostname(), "pid": os.getpid(), "since": time.time()}
+        with self._lock:
+            data = self._load()
+            for login_name in [name for name, held in data["leases"].items() if self._is_stale(held)]:
+                del data["leases"][login_name]
+            for account in data["accounts"]:
+                if account["login_name"] not in data["leases"]:
+                    data["leases"][account["login_name"]] = lease
+                    self._save(data)
+                    return account
+            user, account = self._new_account(data["accounts"])
+            data["accounts"].append(account)
+            data["leases"][account["login_name"]] = lease
+            self._save(data)
+        try:
+            register(user)
+        except Exception:
+            with self._lock:
+                data = self._load()
+                data["accounts"] = [kept for kept in data["accounts"] if kept["login_name"] != account["login_name"]]
+                data["leases"].pop(account["login_name"], None)
+                self._save(data)
+            raise
+        return account
+
+    def release(self, account: dict) -> None:
+        with self._lock:
+            data = self._load()
+            data["leases"].pop(account["login_name"], None)
+            self._save(data)
+
+    def lease_many(self, count: int, owner: str, register: Callable[[dict], None]) -> list[dict]:
+        """count accounts at once, none kept if one of them cannot be had"""
+        accounts = []
+        try:
+            for index in range(count):
+                accounts.append(self.lease(f"{owner} {index}", register))
+        except Exception:
+            for account in accounts:
+                self.release(account)
+            raise
+        return accounts
+
+
+def main(argv: list[str] | None = None) -> int:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Provision or inspect the pool of registered test accounts")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--local-store", action="store_true", help="Pool of the bundled stand-in store")
+    target.add_argument("--base-url", default=os.getenv("BASE_URL", "https://automationteststore.com/"))
+    parser.add_argument("--provision", type=int, metavar="N", help="Register accounts until the pool holds N")
+    parser.add_argument("--list", action="store_true", help="Print the accounts and who holds them")
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    args = parser.parse_args(argv)
+
+    root = Path(__file__).parent.parent
+    server = LocalStoreServer().start() if args.local_store else None
+    base_url = server.url if server else args.base_url
+    pool = AccountPool(pool_path(root, base_url))
+    try:
+        if args.provision:
+            BasePage.base_url = base_url
+            with sync_playwright() as playwright:
+                browser = getattr(playwright, args.browser).launch()
+                created = pool.provision(args.provision, registrar(browser))
+                browser.close()
+            print(f"Registered {len(created)} account(s) on {base_url}, the pool holds {len(pool.accounts())}")
+    finally:
+        if server:
+            server.stop()
+
+    if args.list:
+        leases = pool.leases()
+        for account in pool.accounts():
+            held = leases.get(account["login_name"])
+            print(f"{account['login_name']:<32} {account['email']:<48} "
+                  f"{f'leased by {held['owner']} (pid {held['pid']})' if held else 'free'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+"""
+Allure step listener feeding the step timeline
+"""
+
+from allure_commons import hookimpl
+
+from pages.base.timeline import StepTimeline
+
+
+class AllureStepTimer:
+    """Open a timeline span for every allure.step(), registered on allure_commons.plugin_manager"""
+
+    def __init__(self, timeline: StepTimeline):
+        self.timeline = timeline
+        self._spans: dict[str, dict] = {}
+
+    @hookimpl
+    def start_step(self, uuid, title, params):
+        if self.timeline.active:
+            self._spans[uuid] = self.timeline.begin("step", title)
+
+    @hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        span = self._spans.pop(uuid, None)
+        if span is not None:
+            self.timeline.end(span, error=exc_type.__name__ if exc_type else None)
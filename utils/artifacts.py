@@ -0,0 +1,50 @@
+"""
+Failure artifacts (screenshot + page source) captured once and shared by every consumer
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+
+import allure
+from allure_commons.types import AttachmentType
+from playwright.sync_api import Page
+
+
+class FailureArtifacts:
+    """Capture failure artifacts once, attach them to Allure and write them to disk in the background"""
+
+    def __init__(self, screenshots_dir: str = "screenshots"):
+        self.screenshots_dir = screenshots_dir
+        # A single writer thread keeps file writes ordered and off the test thread
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-writer")
+        self._pending: list[Future] = []
+
+    def capture(self, page: Page, test_name: str) -> None:
+        """Take one full-page screenshot and one page source, reuse them for Allure and screenshots/"""
+        screenshot = page.screenshot(full_page=True)
+        page_source = page.content()
+
+        allure.attach(screenshot, name="screenshot", attachment_type=AttachmentType.PNG)
+        allure.attach(page_source, name="page_source", attachment_type=AttachmentType.HTML)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        screenshot_path = os.path.join(self.screenshots_dir, f"{test_name}_{timestamp}.png")
+        self._pending.append(self._writer.submit(self._write, screenshot_path, screenshot))
+
+    @staticmethod
+    def _write(path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        print(f"Screenshot saved to {path}")
+
+    def flush(self) -> None:
+        """Wait for pending writes and surface any write error"""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def shutdown(self) -> None:
+        self.flush()
+        self._writer.shutdown(wait=True)
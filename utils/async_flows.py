@@ -0,0 +1,162 @@
+"""
+Async flows: `async def` tests marked async_flow, run K at a time on one event loop per worker
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from typing import Awaitable, Callable
+
+from _pytest.skipping import evaluate_skip_marks
+from playwright.async_api import async_playwright, BrowserContext, Page
+
+
+class FlowHandle:
+    """What a flow receives as its `flow` argument: its own context and page on the shared browser"""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.context: BrowserContext | None = None
+        self.page: Page | None = None
+        self.duration: float | None = None
+        self.error: BaseException | None = None
+
+
+class AsyncFlowRunner:
+    """
+    Background thread running an event loop that owns an async Playwright browser.
+
+    The sync API used by the rest of the suite leaves its own loop marked as
+    running on the main thread between calls, so the flows cannot share it:
+    they get a thread and loop of their own, and the main thread blocks on
+    each batch.
+    """
+
+    def __init__(self, browser_name: str = "chromium", launch_options: dict | None = None,
+                 context_args: dict | None = None):
+        self.browser_name = browser_name
+        self.launch_options = launch_options or {}
+        self.context_args = context_args or {}
+        self._playwright = None
+        self._browser = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-flows", daemon=True)
+        self._thread.start()
+
+    def run_batch(self, flows: list[tuple[Callable[[FlowHandle], Awaitable], FlowHandle]]) -> None:
+        """Run every flow concurrently, each one's outcome ends up on its handle"""
+        asyncio.run_coroutine_threadsafe(self._run_batch(flows), self._loop).result()
+
+    async def _start(self) -> None:
+        """Driver and browser together: a driver whose browser failed to launch is stopped right away"""
+        playwright = await async_playwright().start()
+        try:
+            self._browser = await getattr(playwright, self.browser_name).launch(**self.launch_options)
+        except BaseException:
+            await playwright.stop()
+            raise
+        self._playwright = playwright
+
+    async def _run_batch(self, flows) -> None:
+        if self._browser is None:
+            await self._start()
+        await asyncio.gather(*(self._run_flow(flow, handle) for flow, handle in flows))
+
+    async def _run_flow(self, flow, handle: FlowHandle) -> None:
+        start = time.perf_counter()
+        try:
+            handle.context = await self._browser.new_context(**self.context_args)
+            handle.page = await handle.context.new_page()
+            await flow(handle)
+        except Exception as e:
+            handle.error = e
+        finally:
+            handle.duration = time.perf_counter() - start
+            if handle.context:
+                await handle.context.close()
+
+    async def _stop(self) -> None:
+        try:
+            if self._browser is not None:
+                await self._browser.close()
+        finally:
+            await self._playwright.stop()
+
+    def close(self) -> None:
+        if self._playwright is not None:
+            asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class FlowBatch:
+    """Flows that run together: the first one to be called runs all, the others read their outcome"""
+
+    def __init__(self, items: list):
+        self.items = items
+        self.handles: dict[str, FlowHandle] = {}
+
+    def handle_for(self, item, runner: AsyncFlowRunner, base_url: str) -> FlowHandle:
+        if not self.handles:
+            self.handles = {flow.nodeid: FlowHandle(base_url) for flow in self.items}
+            try:
+                runner.run_batch([
+                    (functools.partial(flow.obj, **self.parameters(flow)), self.handles[flow.nodeid])
+                    for flow in self.items
+                ])
+            except Exception as e:
+                # e.g. the browser did not launch: no flow that did not finish may read as passed
+                for handle in self.handles.values():
+                    if handle.duration is None:
+                        handle.error = e
+        return self.handles[item.nodeid]
+
+    @staticmethod
+    def parameters(item) -> dict:
+        """@pytest.mark.parametrize values of the flow, the only arguments besides `flow`"""
+        params = getattr(item, "callspec", None)
+        names = list(inspect.signature(item.obj).parameters)[1:]
+        return {name: params.params[name] for name in names if params and name in params.params}
+
+    @staticmethod
+    def assign(items: list, size: int) -> list["FlowBatch"]:
+        """Cut the async_flow items of every module (and browser) into batches of size, in collection order"""
+        by_module: dict[tuple, list] = {}
+        for item in items:
+            # A skipped flow never sets up, its body must not run with the batch either
+            if item.get_closest_marker("async_flow") and not evaluate_skip_marks(item):
+                names = list(inspect.signature(item.obj).parameters)
+                if (not inspect.iscoroutinefunction(item.obj) or names[:1] != ["flow"]
+                        or len(FlowBatch.parameters(item)) != len(names) - 1):
+                    raise ValueError(
+                        f"{item.nodeid}: async_flow tests must be 'async def test_...(flow, <parametrize args>)'"
+                    )
+                params = getattr(item, "callspec", None)
+                browser = params.params.get("browser_name") if params else None
+                by_module.setdefault((item.nodeid.split("::")[0], browser), []).append(item)
+        batches = []
+        for module_items in by_module.values():
+            for start in range(0, len(module_items), size):
+                batch = FlowBatch(module_items[start:start + size])
+                for item in batch.items:
+                    item.flow_batch = batch
+                batches.append(batch)
+        return batches
+
+
+def phase_duration(report) -> float:
+    """
+    Seconds a test report stands for.
+
+    A batch runs while its first flow is set up, so that setup report holds
+    the whole batch; the setup of every flow reports the flow's own time
+    instead (FlowHandle.duration, left in user_properties by the flow fixture).
+    """
+    if report.when == "setup":
+        for name, seconds in report.user_properties:
+            if name == "flow_duration" and seconds is not None:
+                return seconds
+    return report.duration
@@ -0,0 +1,41 @@
+"""
+Authenticated storage-state cache shared by logged-in tests
+"""
+
+import time
+from pathlib import Path
+from typing import Callable
+
+from filelock import FileLock
+
+
+class AuthStateCache:
+    """Playwright storage state of a logged-in user, cached on disk with a TTL"""
+
+    def __init__(self, path: str | Path, ttl_seconds: int = 1800):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+
+    def is_fresh(self) -> bool:
+        """True if the state file exists and is younger than the TTL"""
+        if not self.path.exists():
+            return False
+        return time.time() - self.path.stat().st_mtime < self.ttl_seconds
+
+    def get(self, login: Callable[[str], None]) -> str:
+        """
+        Return the path of a fresh storage state file.
+
+        When the cached state is missing or expired, login(path) is called to
+        write a new one. The file lock makes xdist workers wait for the first
+        one to log in instead of all logging in at once.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with FileLock(f"{self.path}.lock"):
+            if not self.is_fresh():
+                login(str(self.path))
+        return str(self.path)
+
+    def invalidate(self) -> None:
+        """Drop the cached state so the next get() logs in again"""
+        self.path.unlink(missing_ok=True)
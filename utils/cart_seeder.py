@@ -0,0 +1,47 @@
+"""
+Fill the shopping cart over HTTP instead of through search, product page and add-to-cart clicks
+"""
+
+import html
+import re
+from urllib.parse import urljoin
+
+from playwright.sync_api import Page
+
+from pages.cart_page import CartPage
+
+
+class CartSeeder:
+    """Post add-to-cart forms on the page's own request context.
+
+    context.request shares the cookie jar with the browser context, so the
+    session the server puts the items in is the one the page sees afterwards.
+    """
+
+    def __init__(self, page: Page):
+        self.request = page.context.request
+        self.cart_page = CartPage(page)
+
+    def add(self, product_id: int, quantity: int = 1, options: dict | None = None) -> None:
+        """Same form the product page submits, options as {option_id: value_id} for products that need them"""
+        form = {"product_id": str(product_id), "quantity": str(quantity)}
+        for option_id, value_id in (options or {}).items():
+            form[f"option[{option_id}]"] = str(value_id)
+        # The POST redirects to the cart page, which lists the product if it was accepted
+        response = self.request.post(self.cart_page.url, form=form)
+        assert response.ok, f"❌ Add to cart for product {product_id} failed with HTTP {response.status}"
+        assert re.search(rf"product_id={product_id}\b", response.text()), \
+            f"❌ Product {product_id} is not in the cart after seeding (out of stock or missing options?)"
+
+    def seed(self, items: list[tuple[int, int]]) -> None:
+        """Add every (product_id, quantity) pair"""
+        for product_id, quantity in items:
+            self.add(product_id, quantity)
+
+    def clear(self) -> None:
+        """Follow every remove link of the cart page, e.g. to hand an account back with an empty cart"""
+        response = self.request.get(self.cart_page.url)
+        assert response.ok, f"❌ Opening the cart failed with HTTP {response.status}"
+        for link in dict.fromkeys(re.findall(r"""href=["']([^"']*[?&](?:amp;)?remove=[^"']+)["']""", response.text())):
+            removed = self.request.get(urljoin(self.cart_page.url, html.unescape(link)))
+            assert removed.ok, f"❌ Removing a cart item failed with HTTP {removed.status}"
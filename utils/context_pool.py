@@ -0,0 +1,113 @@
+"""
+Warm browser contexts reused across the tests of one worker, reset between tests instead of recreated
+"""
+
+import json
+import time
+from statistics import mean
+
+from playwright.sync_api import Browser, BrowserContext, Error
+
+from pages.base.readiness import NavigationTimings
+
+# Timing keys recorded by the pool
+NEW_CONTEXT = "new_context"
+RESET_CONTEXT = "reset_context"
+
+
+class ContextPool:
+    """Hand out idle contexts created with the same arguments, reset them on release.
+
+    A reset clears cookies, permissions, localStorage and closes every page,
+    which is enough for tests that only share the HTTP cache. Routes are taken
+    off by whoever installed them (unroute_all only exists from Playwright
+    1.41 on, where it is used as a safety net). Tests that
+    need a brand new context (HAR recording, traces, videos, or the
+    isolated_context marker) should not go through the pool.
+    """
+
+    def __init__(self, browser: Browser, timings: NavigationTimings):
+        self.browser = browser
+        self.timings = timings
+        self._idle: dict[str, list[BrowserContext]] = {}
+        self._keys: dict[BrowserContext, str] = {}
+
+    @staticmethod
+    def _key(args: dict) -> str:
+        # storage_state is replayed onto a reset context, so it does not split the pool
+        return json.dumps({k: v for k, v in args.items() if k != "storage_state"}, sort_keys=True, default=str)
+
+    @staticmethod
+    def can_pool(args: dict) -> bool:
+        """Only cookie-only storage states can be put back onto a reset context"""
+        storage_state = args.get("storage_state")
+        if not storage_state:
+            return True
+        with open(storage_state, encoding="utf-8") as f:
+            return not any(origin["localStorage"] for origin in json.load(f)["origins"])
+
+    def acquire(self, args: dict) -> BrowserContext:
+        key = self._key(args)
+        idle = self._idle.setdefault(key, [])
+        if idle:
+            context = idle.pop()
+        else:
+            start = time.perf_counter()
+            context = self.browser.new_context(**{k: v for k, v in args.items() if k != "storage_state"})
+            self.timings.record(NEW_CONTEXT, time.perf_counter() - start)
+        if args.get("storage_state"):
+            with open(args["storage_state"], encoding="utf-8") as f:
+                context.add_cookies(json.load(f)["cookies"])
+        self._keys[context] = key
+        return context
+
+    def release(self, context: BrowserContext) -> None:
+        key = self._keys.pop(context)
+        start = time.perf_counter()
+        try:
+            self.reset(context)
+        except Exception:
+            # A context that cannot be reset is not worth keeping, and is not handed out again
+            try:
+                context.close()
+            except Error:
+                pass
+            return
+        self.timings.record(RESET_CONTEXT, time.perf_counter() - start)
+        self._idle[key].append(context)
+
+    @staticmethod
+    def reset(context: BrowserContext) -> None:
+        """Bring a used context back to the state of a new one, keeping its HTTP cache"""
+        for page in context.pages:
+            page.close()
+        if hasattr(context, "unroute_all"):
+            context.unroute_all(behavior="ignoreErrors")
+        context.clear_cookies()
+        context.clear_permissions()
+
+        # localStorage can only be cleared from a page on its origin, serve a blank one
+        origins = [origin["origin"] for origin in context.storage_state()["origins"] if origin["localStorage"]]
+        if origins:
+            page = context.new_page()
+            page.route("**/*", lambda route: route.fulfill(body="<html></html>", content_type="text/html"))
+            for origin in origins:
+                page.goto(origin)
+                page.evaluate("() => localStorage.clear()")
+            page.close()
+
+    def close(self) -> None:
+        for contexts in self._idle.values():
+            for context in contexts:
+                context.close()
+        self._idle.clear()
+
+    @staticmethod
+    def savings(timings: NavigationTimings) -> str | None:
+        """Setup time saved by resetting instead of creating a context for every reuse"""
+        created = timings.samples.get(NEW_CONTEXT)
+        resets = timings.samples.get(RESET_CONTEXT)
+        if not created or not resets:
+            return None
+        saved = len(resets) * (mean(created) - mean(resets))
+        return f"contexts created: {len(created)}, reused: {len(resets)}, setup saved: ~{saved:.2f} s"
@@ -0,0 +1,71 @@
+"""
+HAR record-and-replay of store traffic, one HAR per test sharing one content directory
+"""
+
+import json
+import re
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext
+
+HAR_MODES = ("off", "record", "replay")
+
+
+class HarArchive:
+    """Per-test HAR files with response bodies stored once by content hash.
+
+    Bodies are recorded as attachments named after their SHA-1, and every HAR
+    lives in the same directory, so a stylesheet or logo loaded by fifty tests
+    is written to disk once and referenced fifty times.
+    """
+
+    def __init__(self, directory: str | Path, mode: str = "off"):
+        if mode not in HAR_MODES:
+            raise ValueError(f"Unknown HAR mode '{mode}', expected one of: {', '.join(HAR_MODES)}")
+        self.directory = Path(directory)
+        self.mode = mode
+
+    def path_for(self, name: str) -> Path:
+        """HAR file for a test node id (or any other name)"""
+        return self.directory / (re.sub(r"[^\w.-]+", "_", name).strip("_") + ".har")
+
+    def context_args(self, name: str, base_url: str) -> dict:
+        """browser.new_context() arguments that record the store traffic of one test"""
+        if self.mode != "record":
+            return {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        origin = urlsplit(base_url)
+        return {
+            "record_har_path": str(self.path_for(name)),
+            "record_har_content": "attach",
+            "record_har_mode": "minimal",
+            "record_har_url_filter": f"{origin.scheme}://{origin.netloc}/**",
+        }
+
+    def replay(self, context: BrowserContext, name: str) -> None:
+        """Serve every request of the context from the recorded HAR, anything missing is aborted"""
+        if self.mode != "replay":
+            return
+        path = self.path_for(name)
+        if not path.exists():
+            raise FileNotFoundError(f"No HAR recorded for '{name}' ({path}), run once with --har-mode=record")
+        context.route_from_har(path, not_found="abort")
+
+    def prune(self) -> list[Path]:
+        """Delete content files no HAR references any more (left over from earlier recordings)"""
+        if not self.directory.exists():
+            return []
+        referenced = set()
+        for har in self.directory.glob("*.har"):
+            for entry in json.loads(har.read_text(encoding="utf-8"))["log"]["entries"]:
+                for part in (entry["request"].get("postData", {}), entry["response"]["content"]):
+                    if "_file" in part:
+                        referenced.add(part["_file"])
+        removed = [
+            path for path in self.directory.iterdir()
+            if path.is_file() and path.suffix != ".har" and path.name not in referenced
+        ]
+        for path in removed:
+            path.unlink()
+        return removed
@@ -5,6 +5,9 @@ Helper functions for test automation
 from datetime import datetime
 import re
 
+from pages.base.base_page import BasePage
+from test_data.test_data import TestDataGenerator
+
 
 class WaitHelpers:
     """Helper functions for waiting and synchronization"""
@@ -16,9 +19,8 @@ class WaitHelpers:
     
     @staticmethod
     def generate_unique_email(base_email: str = "test") -> str:
-        """Generate unique email with timestamp"""
-        timestamp = WaitHelpers.generate_timestamp("%Y%m%d%H%M%S")
-        return f"{base_email}_{timestamp}@example.com"
+        """Generate an email no other test of the run (on any worker) gets"""
+        return TestDataGenerator.factory.email(base_email)
 
 
 class StringHelpers:
@@ -68,8 +70,8 @@ class URLHelpers:
     
     @staticmethod
     def get_base_url() -> str:
-        """Get base URL for the application"""
-        return "https://automationteststore.com/"
+        """Get base URL for the application (the origin page objects are routed to)"""
+        return BasePage.base_url
     
     @staticmethod
     def get_full_url(path: str) -> str:
@@ -90,51 +92,27 @@ class ProductHelpers:
     """Helper functions for product operations in tests"""
     
     @staticmethod
-    def search_and_add_product(home_page, product_page, page, search_term, alternatives=None):
+    def add_first_available_product(product_page, product_index, search_term, alternatives=None):
         """
-        Search for a product and add to cart.
-        If product not found, tries alternatives.
+        Open the first purchasable product matching search_term (or an alternative) and add it to cart.
+        The match comes from the catalog index, so no search is probed live.
         
         Args:
-            home_page: HomePage object
             product_page: ProductPage object
-            page: Page object from Playwright
-            search_term: Product name to search for
-            alternatives: List of alternative products to try if first not found
+            product_index: ProductIndex fixture
+            search_term: Product name to look for
+            alternatives: List of alternative products to use if the first has no purchasable match
             
         Returns:
             (product_name_added, success): Tuple with product name and success status
         """
-        search_terms = [search_term]
-        if alternatives:
-            search_terms.extend(alternatives)
-        
-        for term in search_terms:
-            try:
-                home_page.header.search_product_with_button(term)
-                page.wait_for_timeout(2000)
-                
-                # Check if any product results found
-                first_product = page.locator("a.prdocutname, a.productname").first
-                if first_product.count() == 0:
-                    print(f"⚠️  No products found for '{term}', trying next alternative...")
-                    home_page.navigate_to_home()
-                    page.wait_for_timeout(1000)
-                    continue
-                
-                # Product found, click and add to cart
-                first_product.click()
-                page.wait_for_timeout(2000)
-                product_page.assert_on_product_page()
-                product_page.add_to_cart()
-                page.wait_for_timeout(2000)
-                print(f"✓ Successfully added product: {term}")
-                return term, True
-            except Exception as e:
-                print(f"⚠️  Error with product '{term}': {str(e)}")
-                home_page.navigate_to_home()
-                page.wait_for_timeout(1000)
-                continue
+        product = product_index.first_available([search_term] + (alternatives or []))
+        if product is None:
+            print(f"⚠️  No purchasable product for '{search_term}' or its alternatives")
+            return None, False
         
-        return None, False
-
+        product_page.navigate(product["url"])
+        product_page.assert_on_product_page()
+        product_page.add_to_cart()
+        print(f"✓ Successfully added product: {product['name']}")
+        return product["name"], True
@@ -0,0 +1,31 @@
+"""
+Static checks run before the suite starts
+"""
+
+import ast
+from pathlib import Path
+
+
+class HardWaitLinter:
+    """Find fixed sleeps (page.wait_for_timeout) in the automation code"""
+
+    # Directories scanned relative to the project root
+    CHECKED_DIRS = ("pages", "utils", "tests", "test_data")
+
+    # Method calls considered a hard-coded sleep
+    FORBIDDEN_CALLS = ("wait_for_timeout",)
+
+    @staticmethod
+    def find_hard_waits(root: str | Path) -> list[str]:
+        """Return 'path:line' for every forbidden call found under the checked directories"""
+        root = Path(root)
+        offenders = []
+        for directory in HardWaitLinter.CHECKED_DIRS:
+            for path in sorted((root / directory).rglob("*.py")):
+                tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+                for node in ast.walk(tree):
+                    if (isinstance(node, ast.Call)
+                            and isinstance(node.func, ast.Attribute)
+                            and node.func.attr in HardWaitLinter.FORBIDDEN_CALLS):
+                        offenders.append(f"{path.relative_to(root)}:{node.lineno}")
+        return offenders
@@ -0,0 +1,324 @@
+"""
+Virtual-user load runner: N concurrent shoppers replaying a purchase journey on the async page objects
+
+    python -m utils.load_runner --local-store --users 20 --ramp-up 10 --duration 60
+    python -m utils.load_runner --base-url https://automationteststore.com/ --users 5 --think-time 2-5
+    python -m utils.load_runner --local-store --journey registered_purchase --users 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from dotenv import load_dotenv
+from playwright.async_api import async_playwright, Browser, Page
+from playwright.sync_api import sync_playwright
+
+from local_store import LocalStoreServer
+from pages.aio.cart_page import AsyncCartPage
+from pages.aio.checkout_page import AsyncCheckoutPage
+from pages.aio.home_page import AsyncHomePage
+from pages.aio.login_page import AsyncLoginPage
+from pages.aio.product_page import AsyncProductPage
+from pages.base.base_page import BasePage
+from pages.base.perf_metrics import percentile, PERCENTILES
+from test_data.test_data import TestDataGenerator
+from utils.account_pool import AccountPool, pool_path, registrar, stand_in_account
+from utils.product_index import ProductIndex
+
+
+class ThinkTime:
+    """Pause between a shopper's steps: "1-3" uniform seconds, "exp:2" exponential with a 2 s mean, "0" none"""
+
+    def __init__(self, spec: str = "1-3"):
+        self.spec = spec
+        if spec.startswith("exp:"):
+            mean = float(spec[4:])
+            self._draw = lambda: random.expovariate(1 / mean) if mean > 0 else 0.0
+        elif "-" in spec:
+            low, high = map(float, spec.split("-", 1))
+            self._draw = lambda: random.uniform(low, high)
+        else:
+            self._draw = lambda: float(spec)
+
+    async def pause(self) -> None:
+        seconds = self._draw()
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+
+class LoadStats:
+    """Step latencies and errors of every virtual user, all on one event loop so no locking"""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, Counter] = defaultdict(Counter)
+        self.journeys = Counter()
+        self.started = time.perf_counter()
+        self.finished: float | None = None
+
+    @asynccontextmanager
+    async def step(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.errors[name][type(e).__name__] += 1
+            raise
+        self.latencies[name].append(time.perf_counter() - start)
+
+    def report(self) -> dict:
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        steps = {}
+        for name in dict.fromkeys([*self.latencies, *self.errors]):
+            values, errors = self.latencies[name], sum(self.errors[name].values())
+            steps[name] = {
+                "ok": len(values),
+                "errors": errors,
+                "error_rate": round(errors / (len(values) + errors), 4),
+                **{f"p{p}_ms": round(percentile(values, p) * 1000, 1) for p in PERCENTILES if values},
+                "error_types": dict(self.errors[name]),
+            }
+        total = sum(self.journeys.values())
+        return {
+            "elapsed_s": round(elapsed, 1),
+            "journeys": dict(self.journeys),
+            "journeys_per_minute": round(self.journeys["completed"] / elapsed * 60, 2) if elapsed else 0.0,
+            "journey_error_rate": round(self.journeys["failed"] / total, 4) if total else 0.0,
+            "steps": steps,
+        }
+
+    @staticmethod
+    def summary(report: dict) -> list[str]:
+        lines = [
+            f"{report['elapsed_s']} s, journeys {report['journeys']}, "
+            f"{report['journeys_per_minute']} completed/min, journey error rate {report['journey_error_rate']:.1%}",
+            f"{'step':<24} {'ok':>6} {'err':>5} {'err%':>6} " + " ".join(f"{f'p{p}':>9}" for p in PERCENTILES),
+        ]
+        for name, step in report["steps"].items():
+            latencies = " ".join(f"{step.get(f'p{p}_ms', 0.0):7.1f}ms" for p in PERCENTILES)
+            lines.append(f"{name:<24} {step['ok']:>6} {step['errors']:>5} {step['error_rate']:>6.1%} {latencies}")
+        return lines
+
+
+async def _search_and_add(page: Page, product: dict, stats: LoadStats, think: ThinkTime) -> AsyncCartPage:
+    """Search the product, open it, add it to the cart and check the cart lists it"""
+    home_page = AsyncHomePage(page)
+    product_page = AsyncProductPage(page)
+    cart_page = AsyncCartPage(page)
+
+    async with stats.step("search"):
+        await home_page.header.search_product_with_button(product["name"])
+    await think.pause()
+    async with stats.step("product"):
+        await product_page.navigate_to_product(product["url"])
+    await think.pause()
+    async with stats.step("add_to_cart"):
+        await product_page.add_to_cart()
+    await think.pause()
+    async with stats.step("cart"):
+        await cart_page.navigate_to_cart()
+        await cart_page.assert_product_in_cart(product["name"])
+    await think.pause()
+    return cart_page
+
+
+async def guest_purchase_journey(page: Page, product: dict, shopper: dict, stats: LoadStats,
+                                 think: ThinkTime) -> None:
+    """test_complete_purchase_flow_as_guest as a shopper would do it: search, open, add, check out"""
+    checkout_page = AsyncCheckoutPage(page)
+
+    async with stats.step("home"):
+        await AsyncHomePage(page).navigate_to_home()
+    await think.pause()
+    cart_page = await _search_and_add(page, product, stats, think)
+    async with stats.step("checkout_as_guest"):
+        await cart_page.proceed_to_checkout()
+        await checkout_page.select_guest_checkout()
+    await think.pause()
+    async with stats.step("guest_information"):
+        await checkout_page.fill_guest_information(
+            email=shopper["email"], firstname=shopper["firstname"], lastname=shopper["lastname"],
+            address=shopper["address"], city=shopper["city"], zipcode=shopper["zipcode"],
+            phone=shopper["phone"], country=shopper["country"], state=shopper["state"],
+        )
+    await think.pause()
+    async with stats.step("confirm_order"):
+        await checkout_page.confirm_order()
+        await checkout_page.wait_for_order_confirmation()
+
+
+async def registered_purchase_journey(page: Page, product: dict, shopper: dict, stats: LoadStats,
+                                      think: ThinkTime) -> None:
+    """Login, search, add to cart, check out on the account's saved address, then log out again"""
+    login_page = AsyncLoginPage(page)
+    checkout_page = AsyncCheckoutPage(page)
+
+    async with stats.step("login"):
+        await login_page.navigate_to_login()
+        await login_page.login(shopper["login_name"], shopper["password"])
+        await login_page.assert_login_successful()
+    await think.pause()
+    cart_page = await _search_and_add(page, product, stats, think)
+    async with stats.step("confirm_order"):
+        await cart_page.proceed_to_checkout()
+        await checkout_page.confirm_order()
+        await checkout_page.wait_for_order_confirmation()
+    await think.pause()
+    async with stats.step("logout"):
+        await login_page.logout()
+
+
+# Journeys by name, each takes (page, product, shopper, stats, think)
+JOURNEYS = {
+    "guest_purchase": guest_purchase_journey,
+    "registered_purchase": registered_purchase_journey,
+}
+
+
+class LoadRunner:
+    """
+    Start users evenly over ramp_up seconds, each looping the journey until the duration is over.
+
+    Guests are new shoppers on every journey; registered_purchase needs one
+    account per user (accounts[user]), so no two users share a cart.
+    """
+
+    def __init__(self, base_url: str, search_terms: list[str], users: int = 10, ramp_up: float = 10.0,
+                 duration: float = 60.0, think: ThinkTime | None = None, browser_name: str = "chromium",
+                 headless: bool = True, journey: str = "guest_purchase", accounts: list[dict] | None = None):
+        if journey == "registered_purchase" and len(accounts or []) < users:
+            raise ValueError(f"registered_purchase needs one account per user ({users}), got {len(accounts or [])}")
+        self.base_url = base_url
+        self.journey = JOURNEYS[journey]
+        self.accounts = accounts
+        self.search_terms = search_terms
+        self.products: list[dict] = []
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.think = think or ThinkTime()
+        self.browser_name = browser_name
+        self.headless = headless
+        self.stats = LoadStats()
+
+    async def run(self) -> dict:
+        BasePage.base_url = self.base_url
+        # Sync API on a thread of its own, this thread's loop is already running
+        self.products = await asyncio.to_thread(purchasable_products, self.base_url, self.search_terms)
+        if not self.products:
+            raise RuntimeError(f"No purchasable product matches {self.search_terms} on {self.base_url}")
+        async with async_playwright() as playwright:
+            browser = await getattr(playwright, self.browser_name).launch(headless=self.headless)
+            self.stats = LoadStats()
+            deadline = self.stats.started + self.duration
+            await asyncio.gather(*(self._user(browser, user, deadline) for user in range(self.users)))
+            self.stats.finished = time.perf_counter()
+            await browser.close()
+        return self.stats.report()
+
+    async def _user(self, browser: Browser, user: int, deadline: float) -> None:
+        await asyncio.sleep(self.ramp_up * user / self.users)
+        while time.perf_counter() < deadline:
+            shopper = self.accounts[user] if self.accounts else TestDataGenerator.generate_guest_checkout_data()
+            # Every journey starts from a fresh browser session
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
+                await self.journey(page, random.choice(self.products), shopper, self.stats, self.think)
+                self.stats.journeys["completed"] += 1
+            except Exception:
+                # Counted on its step already, the user starts over like a shopper would
+                self.stats.journeys["failed"] += 1
+            finally:
+                await context.close()
+            await self.think.pause()
+
+
+def purchasable_products(base_url: str, terms: list[str]) -> list[dict]:
+    """Products the journey can buy as is, from the cached catalog index (crawled if stale)"""
+    index = ProductIndex(
+        ProductIndex.cache_path(Path(__file__).parent.parent, base_url),
+        ttl_seconds=int(os.getenv("PRODUCT_INDEX_TTL", "86400")),
+    )
+    with sync_playwright() as playwright:
+        request = playwright.request.new_context()
+        try:
+            index.load(request, base_url)
+        finally:
+            request.dispose()
+    return [product for product in map(index.find, terms) if product]
+
+
+def lease_accounts(pool: AccountPool, count: int, base_url: str, browser_name: str = "chromium") -> list[dict]:
+    """One pooled account per virtual user, registered through the store's form if the pool runs short"""
+    BasePage.base_url = base_url
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, browser_name).launch()
+        try:
+            return pool.lease_many(count, "load_runner", registrar(browser))
+        finally:
+            browser.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Run a purchase journey as concurrent virtual users")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--local-store", action="store_true", help="Start the bundled stand-in store and target it")
+    target.add_argument("--base-url", default=os.getenv("BASE_URL", "https://automationteststore.com/"))
+    parser.add_argument("--journey", default="guest_purchase", choices=sorted(JOURNEYS),
+                        help="registered_purchase leases one pooled account per user (registering missing ones)")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Seconds over which users start")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds during which users start new journeys")
+    parser.add_argument("--think-time", default="1-3", help='"1-3" uniform seconds, "exp:2" exponential mean, "0"')
+    parser.add_argument("--products", default="shirt,shoes,cream,perfume,conditioner",
+                        help="Search terms, each user buys a purchasable product matching one of them")
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--json", type=Path, help="Also write the report there")
+    parser.add_argument("--max-error-rate", type=float, default=0.01,
+                        help="Exit with 1 when more journeys than this fraction failed")
+    args = parser.parse_args(argv)
+    # Users start at ramp_up * user / users, one starting after the duration would never run
+    if args.ramp_up >= args.duration:
+        parser.error(f"--ramp-up ({args.ramp_up}) must be shorter than --duration ({args.duration})")
+
+    server = LocalStoreServer().start() if args.local_store else None
+    base_url = server.url if server else args.base_url
+    pool, accounts = None, None
+    try:
+        if args.journey == "registered_purchase":
+            pool = AccountPool(pool_path(Path(__file__).parent.parent, base_url), TestDataGenerator.factory)
+            accounts = lease_accounts(pool, args.users, base_url, args.browser)
+            for account in accounts if server else []:
+                server.state.add_account(stand_in_account(account))
+        runner = LoadRunner(base_url, args.products.split(","), args.users, args.ramp_up, args.duration,
+                            ThinkTime(args.think_time), args.browser, headless=not args.headed,
+                            journey=args.journey, accounts=accounts)
+        report = asyncio.run(runner.run())
+    finally:
+        for account in accounts or []:
+            pool.release(account)
+        if server:
+            server.stop()
+
+    report.update({"base_url": base_url, "journey": args.journey, "users": args.users, "ramp_up_s": args.ramp_up, "think_time": args.think_time})
+    for line in LoadStats.summary(report):
+        print(line)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2))
+    return 1 if report["journey_error_rate"] > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
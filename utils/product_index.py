@@ -0,0 +1,149 @@
+"""
+Product catalog index (name -> id, URL, stock) crawled once per TTL instead of searching live
+"""
+
+import json
+import re
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import parse_qs, urljoin, urlsplit
+
+from filelock import FileLock
+from playwright.sync_api import APIRequestContext
+
+# Category listings are paginated, ask for everything on one page
+CATEGORY_LIMIT = 200
+
+
+class _LinkParser(HTMLParser):
+    """Collect (href, class, title, text) of every <a> in a page"""
+
+    def __init__(self):
+        super().__init__()
+        self.links: list[dict] = []
+        self._current: dict | None = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            self._current = {**dict(attrs), "text": ""}
+            self.links.append(self._current)
+
+    def handle_data(self, data):
+        if self._current is not None:
+            self._current["text"] += data
+
+    def handle_endtag(self, tag):
+        if tag == "a":
+            self._current = None
+
+
+def _links(html: str) -> list[dict]:
+    parser = _LinkParser()
+    parser.feed(html)
+    return parser.links
+
+
+def _query(href: str) -> dict[str, str]:
+    return {key: values[0] for key, values in parse_qs(urlsplit(href).query).items()}
+
+
+def _route(url: str) -> str:
+    """URL without scheme and host, e.g. /index.php?rt=product/product&product_id=50"""
+    return urlsplit(url)._replace(scheme="", netloc="").geturl()
+
+
+class ProductIndex:
+    """
+    Every product of the store with its id, URL and whether it can be added to the cart as is.
+
+    The file keeps routes, not absolute URLs: the stand-in store of every
+    xdist worker listens on its own port but serves the same catalog, so one
+    crawl serves them all. URLs are resolved against the caller's base_url.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path: str | Path, ttl_seconds: int = 86400):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.products: list[dict] = []
+
+    @staticmethod
+    def cache_path(root: str | Path, base_url: str) -> Path:
+        """One index per store host"""
+        return Path(root) / ".cache" / f"product_index_{urlsplit(base_url).hostname}.json"
+
+    def _read(self, base_url: str) -> list[dict] | None:
+        """Products of the index file if it is younger than the TTL and was built for this store's host"""
+        if not self.path.exists() or time.time() - self.path.stat().st_mtime >= self.ttl_seconds:
+            return None
+        data = json.loads(self.path.read_text())
+        if data.get("version") != self.VERSION or data["host"] != urlsplit(base_url).hostname:
+            return None
+        return data["products"]
+
+    def is_fresh(self, base_url: str) -> bool:
+        return self._read(base_url) is not None
+
+    def load(self, request: APIRequestContext, base_url: str) -> "ProductIndex":
+        """Read the cached index, crawling the store first when it is missing or stale"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # xdist workers wait for the first one to crawl instead of all crawling at once,
+        # and read under the lock so they never see a file being rewritten
+        with FileLock(f"{self.path}.lock"):
+            products = self._read(base_url)
+            if products is None:
+                products = [{**product, "url": _route(product["url"])} for product in self.crawl(request, base_url)]
+                self.path.write_text(json.dumps({
+                    "version": self.VERSION, "host": urlsplit(base_url).hostname, "products": products,
+                }, indent=2))
+        self.products = [{**product, "url": urljoin(base_url, product["url"])} for product in products]
+        return self
+
+    @staticmethod
+    def crawl(request: APIRequestContext, base_url: str) -> list[dict]:
+        """Walk home -> every category -> every product page"""
+        home = request.get(base_url).text()
+        category_paths = {
+            _query(link["href"])["path"] for link in _links(home)
+            if "rt=product/category" in link.get("href", "") and "path" in _query(link["href"])
+        }
+
+        products: dict[int, dict] = {}
+        for path in sorted(category_paths):
+            listing = request.get(
+                urljoin(base_url, "index.php"),
+                params={"rt": "product/category", "path": path, "limit": CATEGORY_LIMIT},
+            )
+            for link in _links(listing.text()):
+                if not re.search(r"\b(prdocutname|productname)\b", link.get("class", "")):
+                    continue
+                product_id = int(_query(link["href"])["product_id"])
+                products.setdefault(product_id, {
+                    "id": product_id,
+                    "name": " ".join((link.get("title") or link["text"]).split()),
+                    "url": urljoin(base_url, link["href"]),
+                })
+
+        for product in products.values():
+            html = request.get(product["url"]).text()
+            product["in_stock"] = 'class="nostock"' not in html
+            # Products with required options (size, colour...) cannot be added with a bare product_id
+            product["has_options"] = 'name="option[' in html
+        return sorted(products.values(), key=lambda product: product["id"])
+
+    def find(self, term: str, purchasable: bool = True) -> dict | None:
+        """First product whose name contains term (case-insensitive), only ones that can be bought as is by default"""
+        term = term.lower()
+        for product in self.products:
+            if term not in product["name"].lower():
+                continue
+            if purchasable and (not product["in_stock"] or product["has_options"]):
+                continue
+            return product
+        return None
+
+    def first_available(self, terms: list[str]) -> dict | None:
+        """Purchasable product for the first term that has one"""
+        return next((product for product in map(self.find, terms) if product), None)
@@ -0,0 +1,149 @@
+"""
+Opt-in network filtering: stub images, drop fonts/media and third-party trackers
+"""
+
+import json
+import weakref
+from collections import Counter
+from pathlib import Path
+from threading import Lock
+from urllib.parse import urlsplit
+
+from filelock import FileLock
+from playwright.sync_api import BrowserContext, Request, Response, Route
+
+# Resource types a policy can filter, and what happens to them
+STUBBED_TYPES = ("image",)
+ABORTED_TYPES = ("font", "media")
+
+# Third-party hosts no assertion looks at (matched as a suffix of the request host)
+TRACKER_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+    "facebook.net", "facebook.com", "hotjar.com", "clarity.ms", "addthis.com", "sharethis.com",
+    "fonts.googleapis.com", "fonts.gstatic.com",
+)
+
+# 1x1 transparent PNG returned instead of real images so <img> elements still load
+STUB_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000b49444154789c6360000200000500017a5eab3f0000000049454e44ae426082"
+)
+
+
+class ResourceStats:
+    """Requests and bytes saved across the run.
+
+    Blocked requests never download, so their size is looked up from the
+    Content-Length seen when the same URL was loaded unfiltered (this run or a
+    previous one, persisted in sizes_file).
+
+    The process that ran the test counts into a pending bucket; drain() hands
+    it to the test's report and add() sums the reports up, so under xdist the
+    controller's totals cover every worker.
+    """
+
+    def __init__(self, sizes_file: str | Path):
+        self.sizes_file = Path(sizes_file)
+        self.known_sizes: dict[str, int] = {}
+        if self.sizes_file.exists():
+            self.known_sizes = json.loads(self.sizes_file.read_text())
+        self.blocked = Counter()
+        self.bytes_saved = 0
+        self.unknown_size = 0
+        self._learned: dict[str, int] = {}
+        self._pending = {"blocked": Counter(), "bytes_saved": 0, "unknown_size": 0}
+        # Requests answered with STUB_PNG, their responses carry the stub's length, not the resource's
+        self._stubbed = weakref.WeakSet()
+        self._lock = Lock()
+
+    def record_response(self, response: Response) -> None:
+        # Only resources a policy could filter are worth remembering
+        if response.request.resource_type not in STUBBED_TYPES + ABORTED_TYPES + ("script", "stylesheet"):
+            return
+        if response.request in self._stubbed:
+            return
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            with self._lock:
+                self.known_sizes[response.url] = self._learned[response.url] = int(length)
+
+    def record_blocked(self, request: Request, reason: str, stubbed: bool = False) -> None:
+        with self._lock:
+            if stubbed:
+                self._stubbed.add(request)
+            self._pending["blocked"][reason] += 1
+            if request.url in self.known_sizes:
+                self._pending["bytes_saved"] += self.known_sizes[request.url]
+            else:
+                self._pending["unknown_size"] += 1
+
+    def drain(self) -> dict | None:
+        """Counts since the last drain, None if nothing was blocked"""
+        with self._lock:
+            pending = self._pending
+            self._pending = {"blocked": Counter(), "bytes_saved": 0, "unknown_size": 0}
+        if not pending["blocked"]:
+            return None
+        return {**pending, "blocked": dict(pending["blocked"])}
+
+    def add(self, counts: dict) -> None:
+        self.blocked.update(counts["blocked"])
+        self.bytes_saved += counts["bytes_saved"]
+        self.unknown_size += counts["unknown_size"]
+
+    def save(self) -> None:
+        """Merge the sizes learned by this process into the file the other workers write too"""
+        if not self._learned:
+            return
+        self.sizes_file.parent.mkdir(parents=True, exist_ok=True)
+        with FileLock(f"{self.sizes_file}.lock"):
+            sizes = json.loads(self.sizes_file.read_text()) if self.sizes_file.exists() else {}
+            sizes.update(self._learned)
+            self.sizes_file.write_text(json.dumps(sizes))
+
+    def summary(self) -> list[str]:
+        if not self.blocked:
+            return []
+        by_reason = ", ".join(f"{reason}={count}" for reason, count in self.blocked.most_common())
+        return [
+            f"requests blocked: {sum(self.blocked.values())} ({by_reason})",
+            f"bytes saved: {self.bytes_saved / 1024:.1f} KiB"
+            + (f" (+{self.unknown_size} requests of unknown size)" if self.unknown_size else ""),
+        ]
+
+
+class ResourcePolicy:
+    """context.route handler that filters the resources a test does not need"""
+
+    def __init__(self, stats: ResourceStats, allowed_types: tuple[str, ...] = ()):
+        self.stats = stats
+        self.allowed_types = set(allowed_types)
+
+    def reason_to_block(self, request: Request) -> str | None:
+        """Return why the request is filtered, None to let it through"""
+        host = urlsplit(request.url).hostname or ""
+        if any(host == tracker or host.endswith("." + tracker) for tracker in TRACKER_HOSTS):
+            return "third-party"
+        if request.resource_type in self.allowed_types:
+            return None
+        if request.resource_type in STUBBED_TYPES + ABORTED_TYPES:
+            return request.resource_type
+        return None
+
+    def handle(self, route: Route, request: Request) -> None:
+        reason = self.reason_to_block(request)
+        if reason is None:
+            route.fallback()
+            return
+        self.stats.record_blocked(request, reason, stubbed=request.resource_type in STUBBED_TYPES)
+        if request.resource_type in STUBBED_TYPES:
+            route.fulfill(status=200, content_type="image/png", body=STUB_PNG)
+        else:
+            route.abort("blockedbyclient")
+
+    def install(self, context: BrowserContext) -> None:
+        context.route("**/*", self.handle)
+
+    def uninstall(self, context: BrowserContext) -> None:
+        """Take the handler off again, pooled contexts outlive the test"""
+        context.unroute("**/*", self.handle)
@@ -0,0 +1,207 @@
+"""
+Local SQLite history of every run (outcome, duration and step timings per test) and slow-down detection
+
+    python -m utils.run_history              # latest run against the 10 before it
+    python -m utils.run_history --last 20 --z 2.5
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import mean, stdev
+
+from utils.async_flows import phase_duration
+
+DEFAULT_PATH = Path(__file__).parent.parent / ".cache" / "run_history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT NOT NULL,
+    environment TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    steps TEXT NOT NULL,
+    PRIMARY KEY (run_id, nodeid)
+);
+CREATE INDEX IF NOT EXISTS results_by_test ON results (nodeid, run_id);
+"""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class RunHistory:
+    """Results of the current run, fed from pytest_runtest_logreport and stored once at the end"""
+
+    def __init__(self, path: str | Path = DEFAULT_PATH):
+        self.path = Path(path)
+        self.started_at = _now()
+        self.results: dict[str, dict] = {}
+
+    def connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.executescript(SCHEMA)
+        return connection
+
+    def add(self, report) -> None:
+        result = self.results.setdefault(report.nodeid, {"outcome": "passed", "duration": 0.0, "steps": []})
+        result["duration"] += phase_duration(report)
+        # The first phase that did not pass decides, setup/teardown failures are errors
+        if result["outcome"] == "passed" and not report.passed:
+            result["outcome"] = "error" if report.failed and report.when != "call" else report.outcome
+        for name, spans in report.user_properties:
+            if name == "step_timeline":
+                result["steps"] = spans
+
+    def save(self, environment: dict) -> int | None:
+        """Store the run, returns its id (None when no test reported)"""
+        if not self.results:
+            return None
+        with self.connect() as connection:
+            run_id = connection.execute(
+                "INSERT INTO runs (started_at, finished_at, environment) VALUES (?, ?, ?)",
+                (self.started_at, _now(), json.dumps(environment, sort_keys=True)),
+            ).lastrowid
+            connection.executemany(
+                "INSERT INTO results (run_id, nodeid, outcome, duration, steps) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (run_id, nodeid, result["outcome"], round(result["duration"], 4), json.dumps(result["steps"]))
+                    for nodeid, result in self.results.items()
+                ],
+            )
+        connection.close()
+        return run_id
+
+
+def _step_totals(steps_json: str) -> dict[str, float]:
+    """Total seconds per step/action name of one test run"""
+    totals: dict[str, float] = defaultdict(float)
+    for span in json.loads(steps_json):
+        totals[f"{span['kind']}: {span['name']}"] += span["duration"] or 0.0
+    return totals
+
+
+# What a baseline run must share with the run it is compared to: the store, stand-in or replay and blocking
+# change durations far more than any regression would
+SAME_ENVIRONMENT = ("base_url", "har_mode", "block_resources")
+
+
+def find_regressions(connection: sqlite3.Connection, last: int = 10, z_threshold: float = 3.0,
+                     min_increase: float = 0.2, min_seconds: float = 0.25, min_runs: int = 3,
+                     run_id: int | None = None, same_environment: tuple[str, ...] = SAME_ENVIRONMENT) -> list[dict]:
+    """
+    Passed tests of run_id (the latest by default) slower than their previous `last` passed runs.
+
+    Only runs whose environment has the same same_environment values count as
+    baseline. A slow-down counts when it is at least z_threshold standard
+    deviations above the baseline mean, min_increase relative and min_seconds
+    absolute, so that both noisy and very fast tests stay quiet. Worst
+    (largest increase) first.
+    """
+    if run_id is None:
+        run_id = connection.execute("SELECT MAX(id) FROM runs").fetchone()[0]
+        if run_id is None:
+            return []
+    environment = json.loads(connection.execute("SELECT environment FROM runs WHERE id = ?", (run_id,)).fetchone()[0])
+    comparable = {
+        previous
+        for previous, previous_environment in connection.execute("SELECT id, environment FROM runs WHERE id < ?",
+                                                                 (run_id,))
+        if all(json.loads(previous_environment).get(key) == environment.get(key) for key in same_environment)
+    }
+    regressions = []
+    current = connection.execute(
+        "SELECT nodeid, duration, steps FROM results WHERE run_id = ? AND outcome = 'passed'", (run_id,)
+    ).fetchall()
+    for nodeid, duration, steps in current:
+        baseline = [
+            (previous_duration, previous_steps) for previous, previous_duration, previous_steps in connection.execute(
+                "SELECT run_id, duration, steps FROM results WHERE nodeid = ? AND run_id < ? AND outcome = 'passed' "
+                "ORDER BY run_id DESC",
+                (nodeid, run_id),
+            )
+            if previous in comparable
+        ][:last]
+        if len(baseline) < min_runs:
+            continue
+        durations = [row[0] for row in baseline]
+        average, spread = mean(durations), stdev(durations)
+        increase = duration - average
+        z = increase / spread if spread else (float("inf") if increase > 0 else 0.0)
+        if z < z_threshold or increase < min_seconds or increase < min_increase * average:
+            continue
+
+        # Which steps grew, against their average over the same baseline runs
+        before: dict[str, list[float]] = defaultdict(list)
+        for _, baseline_steps in baseline:
+            for step, seconds in _step_totals(baseline_steps).items():
+                before[step].append(seconds)
+        steps = sorted(
+            ((step, seconds - (sum(before[step]) / len(baseline))) for step, seconds in _step_totals(steps).items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        regressions.append({
+            "nodeid": nodeid,
+            "duration": duration,
+            "baseline_mean": average,
+            "baseline_stdev": spread,
+            "baseline_runs": len(baseline),
+            "z": z,
+            "steps": [(step, delta) for step, delta in steps[:3] if delta > 0],
+        })
+    return sorted(regressions, key=lambda regression: regression["duration"] - regression["baseline_mean"], reverse=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Flag tests that got significantly slower than in previous runs")
+    parser.add_argument("--db", default=DEFAULT_PATH, type=Path, help="History database (default: %(default)s)")
+    parser.add_argument("--last", default=10, type=int, help="Previous runs each test is compared with")
+    parser.add_argument("--run", type=int, help="Run id to check (default: the latest)")
+    parser.add_argument("--z", default=3.0, type=float, help="Standard deviations above the baseline mean")
+    parser.add_argument("--min-increase", default=0.2, type=float, help="Relative slow-down, 0.2 = 20%%")
+    parser.add_argument("--min-seconds", default=0.25, type=float, help="Absolute slow-down in seconds")
+    parser.add_argument("--min-runs", default=3, type=int, help="Previous passed runs a test needs to be judged")
+    parser.add_argument("--top", default=10, type=int, help="Offenders printed")
+    parser.add_argument("--same-environment", default=True, action=argparse.BooleanOptionalAction,
+                        help=f"Only compare with runs of the same {', '.join(SAME_ENVIRONMENT)} (default: on)")
+    args = parser.parse_args(argv)
+
+    if not args.db.exists():
+        print(f"No run history at {args.db}, run the suite first")
+        return 0
+    connection = RunHistory(args.db).connect()
+    regressions = find_regressions(connection, args.last, args.z, args.min_increase, args.min_seconds,
+                                   args.min_runs, args.run, SAME_ENVIRONMENT if args.same_environment else ())
+    connection.close()
+
+    if not regressions:
+        print(f"No significant slow-down against the last {args.last} runs")
+        return 0
+    print(f"{len(regressions)} test(s) significantly slower than their last {args.last} runs:")
+    for regression in regressions[:args.top]:
+        print(
+            f"  +{regression['duration'] - regression['baseline_mean']:6.2f}s  "
+            f"{regression['duration']:6.2f}s vs {regression['baseline_mean']:6.2f}s "
+            f"± {regression['baseline_stdev']:.2f} (z={regression['z']:.1f}, n={regression['baseline_runs']})  "
+            f"{regression['nodeid']}"
+        )
+        for step, delta in regression["steps"]:
+            print(f"           +{delta:6.2f}s  {step}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Duration-aware scheduling for pytest-xdist: longest tests first, from a local history of past runs
+"""
+
+import json
+from collections import defaultdict
+from pathlib import Path
+from statistics import mean
+
+from xdist.scheduler import LoadScheduling
+
+from utils.async_flows import phase_duration
+
+
+class DurationHistory:
+    """Per-test durations (setup + call + teardown) smoothed over previous runs"""
+
+    def __init__(self, path: str | Path, smoothing: float = 0.5):
+        self.path = Path(path)
+        # Weight of the latest run against the stored value
+        self.smoothing = smoothing
+        self.durations: dict[str, float] = {}
+        if self.path.exists():
+            self.durations = json.loads(self.path.read_text())
+        self._current: dict[str, float] = defaultdict(float)
+
+    def add(self, report) -> None:
+        """Fed from pytest_runtest_logreport, skipped tests say nothing about their duration"""
+        if not report.skipped:
+            self._current[report.nodeid] += phase_duration(report)
+
+    def estimate(self, nodeid: str) -> float:
+        """Known duration, else the average of the same file, else the average of everything"""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        path = nodeid.split("::")[0]
+        same_file = [seconds for known, seconds in self.durations.items() if known.split("::")[0] == path]
+        if same_file:
+            return mean(same_file)
+        return mean(self.durations.values()) if self.durations else 0.0
+
+    def save(self) -> None:
+        for nodeid, seconds in self._current.items():
+            previous = self.durations.get(nodeid, seconds)
+            self.durations[nodeid] = round(self.smoothing * seconds + (1 - self.smoothing) * previous, 3)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.durations, indent=2, sort_keys=True))
+
+
+class DurationScheduling(LoadScheduling):
+    """Longest-processing-time-first scheduling.
+
+    Workers only run a test once they know the next one, so each worker is
+    kept at two pending tests and topped up with the longest remaining test
+    whenever it finishes one. The opening round goes out in snake order so
+    the two longest tests never share a worker.
+    """
+
+    def __init__(self, config, log=None, history: DurationHistory | None = None):
+        super().__init__(config, log)
+        self.history = history
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        # New nodes joining later just get topped up
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(self.node2collection.values())[0]
+        self.pending[:] = sorted(
+            range(len(self.collection)),
+            key=lambda index: self.history.estimate(self.collection[index]),
+            reverse=True,
+        )
+
+        for node in self.nodes + self.nodes[::-1]:
+            self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration=0):
+        if node.shutting_down:
+            return
+        if self.pending:
+            missing = 2 - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
+        self.log("num items waiting for node:", len(self.pending))
@@ -0,0 +1,248 @@
+"""
+Soak runner: loop a journey on one long-lived browser for hours and fail on latency/memory drift
+
+    python -m utils.soak_runner --local-store --duration 3600
+    python -m utils.soak_runner --journey guest_purchase --reuse-context --max-memory-drift 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from statistics import linear_regression, mean
+
+from dotenv import load_dotenv
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+from local_store import LocalStoreServer
+from pages.base.base_page import BasePage
+from test_data.test_data import TestDataGenerator
+from utils.load_runner import JOURNEYS, LoadStats, ThinkTime, purchasable_products
+
+
+def _rss_mb(pid: int) -> float:
+    """Resident memory of one process from /proc (Linux)"""
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _descendants(pid: int) -> list[int]:
+    """Every process below pid: the Playwright driver and the browser processes it started"""
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as stat:
+                    # The command name (2nd field) is in parentheses and may contain spaces
+                    parent = int(stat.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(parent, []).append(int(entry))
+    found, queue = [], [pid]
+    while queue:
+        for child in children.get(queue.pop(), []):
+            found.append(child)
+            queue.append(child)
+    return found
+
+
+def memory_sample() -> dict[str, float | None]:
+    """Python and browser (driver included) resident memory in MB, None where /proc is not available"""
+    if not os.path.isdir("/proc"):
+        return {"python_rss_mb": None, "browser_rss_mb": None}
+    browser = 0.0
+    for pid in _descendants(os.getpid()):
+        try:
+            browser += _rss_mb(pid)
+        except OSError:
+            continue
+    return {"python_rss_mb": round(_rss_mb(os.getpid()), 1), "browser_rss_mb": round(browser, 1)}
+
+
+async def js_heap_mb(context: BrowserContext, page: Page) -> float | None:
+    """Used JS heap of the page through CDP, Chromium only"""
+    try:
+        session = await context.new_cdp_session(page)
+    except Exception:
+        return None
+    try:
+        await session.send("Performance.enable")
+        metrics = {m["name"]: m["value"] for m in (await session.send("Performance.getMetrics"))["metrics"]}
+        return round(metrics["JSHeapUsedSize"] / 2**20, 2)
+    finally:
+        await session.detach()
+
+
+class DriftReport:
+    """Least-squares slope of every sampled metric against elapsed time, per hour"""
+
+    def __init__(self, samples: list[dict], warmup: int = 3):
+        # The first iterations warm caches and JITs, they would read as a downward trend
+        self.samples = samples[warmup:] if len(samples) > warmup + 2 else samples
+
+    def trend(self, metric: str) -> dict | None:
+        points = [(s["elapsed_s"] / 3600, s[metric]) for s in self.samples if s.get(metric) is not None]
+        if len(points) < 3 or len({x for x, _ in points}) < 2:
+            return None
+        hours, values = zip(*points)
+        slope, intercept = linear_regression(hours, values)
+        return {
+            "start": round(intercept, 2),
+            "per_hour": round(slope, 2),
+            "per_hour_pct": round(slope / intercept * 100, 1) if intercept else None,
+            "mean": round(mean(values), 2),
+        }
+
+    def metrics(self) -> list[str]:
+        names = dict.fromkeys(key for sample in self.samples for key in sample)
+        return [name for name in names if name not in ("iteration", "elapsed_s", "error")]
+
+    def evaluate(self, max_latency_drift_pct: float, max_memory_drift_mb: float) -> tuple[dict, list[str]]:
+        """Trend of every metric, plus the ones over their threshold"""
+        trends, failures = {}, []
+        for metric in self.metrics():
+            trend = self.trend(metric)
+            if trend is None:
+                continue
+            trends[metric] = trend
+            if metric.endswith("_ms") and (trend["per_hour_pct"] or 0) > max_latency_drift_pct:
+                failures.append(f"{metric} grows {trend['per_hour_pct']}%/h (max {max_latency_drift_pct}%/h)")
+            elif metric.endswith("_mb") and trend["per_hour"] > max_memory_drift_mb:
+                failures.append(f"{metric} grows {trend['per_hour']} MB/h (max {max_memory_drift_mb} MB/h)")
+            elif metric == "open_pages" and trend["per_hour"] > 0 and self.samples[-1][metric] > self.samples[0][metric]:
+                failures.append(f"pages leak: {self.samples[0][metric]} open at start, {self.samples[-1][metric]} now")
+        return trends, failures
+
+
+class SoakRunner:
+    """One browser for the whole soak, one journey after the other, one sample per iteration"""
+
+    def __init__(self, base_url: str, journey: str, search_terms: list[str], duration: float,
+                 think: ThinkTime | None = None, reuse_context: bool = False,
+                 browser_name: str = "chromium", headless: bool = True):
+        self.base_url = base_url
+        self.journey = JOURNEYS[journey]
+        self.journey_name = journey
+        self.search_terms = search_terms
+        self.duration = duration
+        self.think = think or ThinkTime("0")
+        self.reuse_context = reuse_context
+        self.browser_name = browser_name
+        self.headless = headless
+        self.samples: list[dict] = []
+
+    def shopper(self) -> dict:
+        if self.journey_name == "registered_purchase":
+            return {"login_name": os.getenv("VALID_LOGIN_NAME", "cmctest"),
+                    "password": os.getenv("VALID_PASSWORD", "Qwerty123")}
+        return TestDataGenerator.generate_guest_checkout_data()
+
+    async def run(self) -> list[dict]:
+        BasePage.base_url = self.base_url
+        # Sync API on a thread of its own, this thread's loop is already running
+        products = await asyncio.to_thread(purchasable_products, self.base_url, self.search_terms)
+        if not products:
+            raise RuntimeError(f"No purchasable product matches {self.search_terms} on {self.base_url}")
+        async with async_playwright() as playwright:
+            browser = await getattr(playwright, self.browser_name).launch(headless=self.headless)
+            started = time.perf_counter()
+            context = await browser.new_context() if self.reuse_context else None
+            iteration = 0
+            while time.perf_counter() - started < self.duration:
+                iteration += 1
+                sample = await self._iteration(browser, context, random.choice(products))
+                sample.update(iteration=iteration, elapsed_s=round(time.perf_counter() - started, 1))
+                self.samples.append(sample)
+                print(json.dumps(sample), flush=True)
+            if context:
+                await context.close()
+            await browser.close()
+        return self.samples
+
+    async def _iteration(self, browser: Browser, shared: BrowserContext | None, product: dict) -> dict:
+        stats = LoadStats()
+        context = shared or await browser.new_context()
+        page = await context.new_page()
+        start = time.perf_counter()
+        error = None
+        try:
+            await self.journey(page, product, self.shopper(), stats, self.think)
+        except Exception as e:
+            error = type(e).__name__
+        sample = {"journey_ms": round((time.perf_counter() - start) * 1000, 1)} if not error else {"error": error}
+        sample.update({f"{step}_ms": round(values[0] * 1000, 1) for step, values in stats.latencies.items()})
+        sample["js_heap_mb"] = await js_heap_mb(context, page)
+        await page.close()
+        if not shared:
+            await context.close()
+        # Counted after cleanup: anything still open here was left behind by the journey
+        sample["open_pages"] = sum(len(c.pages) for c in browser.contexts)
+        sample.update(memory_sample())
+        return sample
+
+
+def main(argv: list[str] | None = None) -> int:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Loop a journey for a long time and report latency/memory drift")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--local-store", action="store_true", help="Start the bundled stand-in store and target it")
+    target.add_argument("--base-url", default=os.getenv("BASE_URL", "https://automationteststore.com/"))
+    parser.add_argument("--journey", default="registered_purchase", choices=sorted(JOURNEYS))
+    parser.add_argument("--duration", type=float, default=3600.0, help="Seconds to keep starting iterations")
+    parser.add_argument("--think-time", default="0", help='"1-3" uniform seconds, "exp:2" exponential mean, "0"')
+    parser.add_argument("--products", default="shirt,shoes,cream,perfume,conditioner")
+    parser.add_argument("--reuse-context", action="store_true",
+                        help="Run every iteration in one long-lived context (new page each time)")
+    parser.add_argument("--warmup", type=int, default=3, help="First iterations left out of the trends")
+    parser.add_argument("--max-latency-drift", type=float, default=10.0, help="Max latency growth in %% per hour")
+    parser.add_argument("--max-memory-drift", type=float, default=100.0, help="Max memory growth in MB per hour")
+    parser.add_argument("--max-error-rate", type=float, default=0.0,
+                        help="Max share of failed iterations, 0.05 = 5%% (default: none may fail)")
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--json", type=Path, help="Write samples and trends there")
+    args = parser.parse_args(argv)
+    if not 0 <= args.max_error_rate <= 1:
+        parser.error("--max-error-rate is a share of the iterations, between 0 and 1")
+
+    server = None
+    if args.local_store:
+        accounts = {os.getenv("VALID_LOGIN_NAME", "cmctest"): os.getenv("VALID_PASSWORD", "Qwerty123")}
+        server = LocalStoreServer(accounts=accounts).start()
+    base_url = server.url if server else args.base_url
+    try:
+        runner = SoakRunner(base_url, args.journey, args.products.split(","), args.duration,
+                            ThinkTime(args.think_time), args.reuse_context, args.browser, headless=not args.headed)
+        samples = asyncio.run(runner.run())
+    finally:
+        if server:
+            server.stop()
+
+    trends, failures = DriftReport(samples, args.warmup).evaluate(args.max_latency_drift, args.max_memory_drift)
+    errors = sum(1 for sample in samples if "error" in sample)
+    print(f"{len(samples)} iterations of {args.journey} on {base_url}, {errors} failed")
+    if errors:
+        # A failed iteration has no journey_ms, its trend only covers the ones that completed
+        print(f"  journey_ms trend over the {len(samples) - errors} completed iteration(s) only")
+        if errors / len(samples) > args.max_error_rate:
+            failures.append(f"{errors}/{len(samples)} iterations failed (max error rate {args.max_error_rate:.0%})")
+    for metric, trend in trends.items():
+        pct = f" ({trend['per_hour_pct']:+}%/h)" if trend["per_hour_pct"] is not None else ""
+        print(f"  {metric:<24} start {trend['start']:>10}  {trend['per_hour']:+10}/h{pct}")
+    for failure in failures:
+        print(f"❌ {failure}")
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({"samples": samples, "trends": trends, "failures": failures}, indent=2))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())